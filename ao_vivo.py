@@ -0,0 +1,188 @@
+"""Partida ao vivo no terminal: simulação em passo fixo e desenho desacoplados (asyncio).
+
+Duas tarefas no mesmo laço de eventos:
+
+* a simulação avança o Jogo a `rodadas_por_segundo` (passo fixo: se atrasar,
+  roda as rodadas devidas em sequência, até um limite, em vez de desacelerar a
+  partida), ou o mais rápido possível com rodadas_por_segundo=None, cedendo o
+  laço a cada FATIA segundos de trabalho;
+* o desenho amostra o estado mais recente a `fps` quadros por segundo. As
+  rodadas entre dois quadros não são desenhadas; só as células por onde os
+  agentes passaram nelas, mais as que ocupavam no quadro anterior, são
+  marcadas para redesenho (RenderizadorANSI). Se
+  um quadro atrasar (terminal lento), os quadros perdidos são descartados, sem
+  tentar alcançá-los.
+
+Assim o terminal não limita a simulação, e a partida continua acompanhável a
+milhares de rodadas por segundo.
+
+    python ao_vivo.py --semente 7 --rodadas-por-segundo 2000 --fps 30
+    python ao_vivo.py --semente 7 --rodadas-por-segundo 0     # o mais rápido possível
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from labirinto import Jogo, LARGURA, ALTURA, PERCEPCAO, glifo_celula, mensagem_evento, _rodape
+from renderizador import RenderizadorANSI
+
+RODADAS_POR_SEGUNDO = 20  # ritmo do main antigo (uma rodada a cada 0,05 s)
+FPS = 30
+FATIA = 0.005        # segundos de simulação entre duas cessões do laço (modo sem limite)
+ATRASO_MAXIMO = 0.25  # segundos de rodadas devidas que a simulação ainda recupera; o resto é perdoado
+
+
+@dataclass
+class EstatisticasAoVivo:
+    rodadas: int
+    segundos: float
+    quadros: int
+    quadros_descartados: int
+
+    @property
+    def rodadas_por_segundo(self):
+        return self.rodadas / self.segundos if self.segundos > 0 else 0.0
+
+
+class PartidaAoVivo:
+    """Estado compartilhado entre a tarefa de simulação e a de desenho."""
+
+    def __init__(self, jogo, rodadas_por_segundo=RODADAS_POR_SEGUNDO, fps=FPS, saida=None):
+        if fps <= 0:
+            raise ValueError(f"fps deve ser positivo (recebido {fps}).")
+        self.jogo = jogo
+        self.intervalo_rodada = 1.0 / rodadas_por_segundo if rodadas_por_segundo else 0.0
+        self.intervalo_quadro = 1.0 / fps
+        # O limite de fps é do laço de desenho; o renderizador desenha tudo o que recebe
+        self.tela = RenderizadorANSI(jogo.lab.largura, jogo.lab.altura, saida=saida)
+        # Células a redesenhar: as dos agentes no quadro na tela e as ocupadas desde então
+        self.sujas = {jogo.entrante.pos, jogo.minotauro.pos}
+        self.mensagem = ""
+        self.quadros = 0
+        self.quadros_descartados = 0
+
+    def _glifo(self, x, y):
+        jogo = self.jogo
+        return glifo_celula(jogo.lab, x, y, jogo.entrante.pos, jogo.minotauro.pos, jogo.minotauro,
+                            jogo.entrante.morto, jogo.itens)
+
+    def _rodada(self):
+        jogo = self.jogo
+        evento = jogo.avancar()
+        if evento is not None:
+            self.mensagem = mensagem_evento(evento, jogo.rodada)
+        self.sujas.add(jogo.entrante.pos)
+        self.sujas.add(jogo.minotauro.pos)
+
+    async def simular(self, max_rodadas=None):
+        """Avança o jogo até o fim (ou até max_rodadas), em passo fixo ou sem limite."""
+        jogo = self.jogo
+        intervalo = self.intervalo_rodada
+        relogio = time.perf_counter
+        proxima = relogio()
+        while not jogo.encerrado and (max_rodadas is None or jogo.rodada < max_rodadas):
+            agora = relogio()
+            if not intervalo:
+                limite = agora + FATIA
+                while not jogo.encerrado and relogio() < limite:
+                    if max_rodadas is not None and jogo.rodada >= max_rodadas:
+                        break
+                    self._rodada()
+                await asyncio.sleep(0)
+                continue
+
+            if agora - proxima > ATRASO_MAXIMO:
+                proxima = agora - ATRASO_MAXIMO
+            limite = agora + FATIA
+            while proxima <= agora and not jogo.encerrado:
+                if max_rodadas is not None and jogo.rodada >= max_rodadas:
+                    break
+                self._rodada()
+                proxima += intervalo
+                if relogio() >= limite:
+                    break
+            await asyncio.sleep(max(proxima - relogio(), 0.0))
+
+    def desenhar(self, rodape_extra=(), forcar=False):
+        """Desenha o estado atual: as células sujas e as posições atuais dos agentes."""
+        jogo = self.jogo
+        instr = jogo.instrumentacao
+        inicio = time.perf_counter() if instr is not None else 0.0
+        atuais = {jogo.entrante.pos, jogo.minotauro.pos}
+        sujas, self.sujas = self.sujas | atuais, set(atuais)  # os agentes saem dessas células depois
+        self.tela.atualizar(sujas, self._glifo, _rodape(jogo, self.mensagem) + list(rodape_extra), forcar=forcar)
+        self.quadros += 1
+        if instr is not None:
+            instr.marcar("render", inicio)
+
+    async def renderizar(self, simulacao):
+        """Desenha a fps fixo até a simulação terminar, descartando os quadros atrasados."""
+        intervalo = self.intervalo_quadro
+        proximo = time.perf_counter() + intervalo
+        while True:
+            espera = max(proximo - time.perf_counter(), 0.0)
+            concluidas, _ = await asyncio.wait({simulacao}, timeout=espera)
+            if concluidas:
+                return
+            self.desenhar()
+            proximo += intervalo
+            agora = time.perf_counter()
+            if agora > proximo:
+                perdidos = int((agora - proximo) / intervalo) + 1
+                self.quadros_descartados += perdidos
+                proximo += perdidos * intervalo
+
+
+async def executar_async(jogo, rodadas_por_segundo=RODADAS_POR_SEGUNDO, fps=FPS, saida=None,
+                         pausa_inicial=0.0, max_rodadas=None, rodape_final=()):
+    """Roda a partida ao vivo (simulação e desenho concorrentes) e retorna EstatisticasAoVivo."""
+    partida = PartidaAoVivo(jogo, rodadas_por_segundo, fps, saida)
+    partida.tela.quadro_completo(partida._glifo, _rodape(jogo))
+    if pausa_inicial:
+        await asyncio.sleep(pausa_inicial)
+
+    rodada_inicial = jogo.rodada
+    inicio = time.perf_counter()
+    simulacao = asyncio.create_task(partida.simular(max_rodadas))
+    await partida.renderizar(simulacao)
+    await simulacao  # propaga exceções da simulação
+    segundos = time.perf_counter() - inicio
+
+    fim = [f"--- FIM DE JOGO: {jogo.status_final} na Rodada {jogo.rodada} ---"] if jogo.encerrado else []
+    partida.desenhar(fim + list(rodape_final), forcar=True)
+    partida.tela.fechar()
+    return EstatisticasAoVivo(jogo.rodada - rodada_inicial, segundos, partida.quadros, partida.quadros_descartados)
+
+
+def executar(jogo, rodadas_por_segundo=RODADAS_POR_SEGUNDO, fps=FPS, saida=None, pausa_inicial=0.0,
+             max_rodadas=None, rodape_final=()):
+    """Versão síncrona de executar_async (cria o próprio laço de eventos)."""
+    return asyncio.run(executar_async(jogo, rodadas_por_segundo, fps, saida, pausa_inicial, max_rodadas,
+                                      rodape_final))
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Partida ao vivo com simulação e desenho desacoplados.")
+    parser.add_argument("--semente", type=int, default=None)
+    parser.add_argument("--largura", type=int, default=LARGURA)
+    parser.add_argument("--altura", type=int, default=ALTURA)
+    parser.add_argument("--percepcao", type=int, default=PERCEPCAO)
+    parser.add_argument("--energia", type=int, default=500)
+    parser.add_argument("--itens", type=int, default=30)
+    parser.add_argument("--rodadas-por-segundo", type=float, default=RODADAS_POR_SEGUNDO,
+                        help="ritmo da simulação; 0 = o mais rápido possível")
+    parser.add_argument("--fps", type=float, default=FPS)
+    parser.add_argument("--max-rodadas", type=int, default=None)
+    args = parser.parse_args(argumentos)
+
+    jogo = Jogo(args.semente, args.largura, args.altura, args.percepcao, args.energia, args.itens)
+    estatisticas = executar(jogo, args.rodadas_por_segundo or None, args.fps, max_rodadas=args.max_rodadas)
+    print(f"[INFO] {estatisticas.rodadas} rodadas em {estatisticas.segundos:.2f} s "
+          f"({estatisticas.rodadas_por_segundo:.0f} rodadas/s), {estatisticas.quadros} quadros, "
+          f"{estatisticas.quadros_descartados} descartados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""Benchmarks dos caminhos quentes do jogo, com baseline em JSON.
+
+Mede, com sementes fixas e nos tamanhos 31, 101, 501 e 2001:
+
+    gerar_labirinto            geração (Prim)
+    espalhar_itens             sorteio dos itens
+    busca/<estratégia>         caminho mínimo entre pares fixos de células (caminhos.buscar,
+                               o núcleo de caminho_minimo), para cada estratégia
+    distancia_minima/<estr.>   distância entre os mesmos pares ("bfs" e "arvore")
+    minotauro/perseguicao      Minotauro.passo perseguindo (com o CampoDistancias da rodada)
+    minotauro/patrulha         Minotauro.passo patrulhando
+    entrante/passo             Entrante.passo (DFS)
+    jogo                       partidas completas sem terminal (jogar)
+
+Para cada caso são registrados operações por segundo, nós expandidos por
+operação (células tocadas pelas buscas, quando se aplica) e o pico de memória
+de uma operação (tracemalloc, medido numa passada separada para não distorcer
+o tempo).
+
+    python benchmark.py --saida baseline.json               # grava uma baseline
+    python benchmark.py --comparar baseline.json            # compara e aponta regressões
+    python benchmark.py --tamanhos 31 101 --casos busca jogo
+
+Com --comparar, o código de saída é 1 se algum caso ficou mais lento (ou
+usou mais memória) além da tolerância, ou se expandiu mais nós. Tempo só se
+compara na mesma máquina: se a baseline foi gravada em outra (campo
+"maquina") ou com outro Python, ops/s ficam de fora e só memória e nós são
+comparados. O benchmark_baseline.json do repositório é uma amostra do
+formato; para achar regressões de tempo, grave uma baseline local antes.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+
+from labirinto import (Entrante, Minotauro, CampoDistancias, gerar_labirinto, espalhar_itens,
+                       distancia_minima, jogar, encontrar_spawn_minotauro)
+from caminhos import ESTRATEGIAS, buscar
+
+VERSAO_BASELINE = 2  # 2: campo "maquina"
+TOLERANCIA = 0.5  # numa máquina com carga, o mesmo caso chega a variar ~2x entre execuções
+SEMENTE = 1234
+TAMANHOS = (31, 101, 501, 2001)
+
+# Quantidade de operações por caso em cada tamanho
+REPETICOES = {
+    31:   {"gerar": 50, "itens": 50, "consultas": 200, "passos": 5000, "jogos": 20},
+    101:  {"gerar": 10, "itens": 20, "consultas": 100, "passos": 5000, "jogos": 5},
+    501:  {"gerar": 2,  "itens": 5,  "consultas": 10,  "passos": 2000, "jogos": 1},
+    2001: {"gerar": 1,  "itens": 1,  "consultas": 3,   "passos": 1000, "jogos": 1},
+}
+
+
+@lru_cache(maxsize=None)
+def _labirinto(tamanho):
+    """Labirinto fixo do tamanho (gerado uma vez; os casos que o alteram usam cópias)."""
+    return gerar_labirinto(tamanho, tamanho, random.Random(SEMENTE))
+
+
+@lru_cache(maxsize=None)
+def _pares(tamanho, quantidade):
+    """Pares fixos (origem, destino) de índices de células livres."""
+    lab = _labirinto(tamanho)
+    rng = random.Random(SEMENTE)
+    livres = lab.livres()
+    return [(livres.sortear(rng), livres.sortear(rng)) for _ in range(quantidade)]
+
+
+# --- Casos: cada um recebe (tamanho, repetições) e devolve uma função que roda
+# as operações e retorna (operações, nós expandidos ou None) ---
+def caso_gerar(tamanho, n):
+    def rodar():
+        for k in range(n):
+            gerar_labirinto(tamanho, tamanho, random.Random(SEMENTE + k))
+        return n, None
+    return rodar
+
+
+def caso_itens(tamanho, n):
+    lab = _labirinto(tamanho)
+    lab.livres()  # índice de células livres fora da medição (os itens não alteram a grade)
+
+    def rodar():
+        for k in range(n):
+            espalhar_itens(lab, quantidade=30, rng=random.Random(SEMENTE + k))
+        return n, None
+    return rodar
+
+
+def caso_busca(estrategia):
+    def caso(tamanho, n):
+        lab = _labirinto(tamanho)
+        pares = _pares(tamanho, n)
+        buscar(pares[0][0], pares[0][1], lab, estrategia)  # estruturas pré-calculadas (marcos, oráculo) fora da medição
+
+        def rodar():
+            nos = 0
+            for origem, destino in pares:
+                nos += buscar(origem, destino, lab, estrategia)[1]
+            return len(pares), nos
+        return rodar
+    return caso
+
+
+def caso_distancia(estrategia):
+    def caso(tamanho, n):
+        lab = _labirinto(tamanho)
+        pares = [(lab.coord(a), lab.coord(b)) for a, b in _pares(tamanho, n)]
+        distancia_minima(pares[0][0], pares[0][1], lab, estrategia)
+
+        def rodar():
+            for origem, destino in pares:
+                distancia_minima(origem, destino, lab, estrategia)
+            return len(pares), None
+        return rodar
+    return caso
+
+
+def caso_perseguicao(tamanho, n):
+    lab = _labirinto(tamanho)
+    alvo = lab.coord(_pares(tamanho, 1)[0][0])
+    campo = CampoDistancias(alvo, lab)
+    # Começa num ponto a 5 arestas do alvo e volta para ele sempre que o alcança
+    inicio = alvo
+    for vizinho in (lab.coord(j) for j in sorted(campo.dist, key=campo.dist.get)):
+        inicio = vizinho
+        if campo.distancia(vizinho) >= 5:
+            break
+
+    def rodar():
+        minotauro = Minotauro(inicio, rng=random.Random(SEMENTE))
+        nos = 0
+        for rodada in range(n):
+            if minotauro.pos == alvo:
+                minotauro.pos = inicio
+            campo_rodada = CampoDistancias(alvo, lab, 5)
+            nos += len(campo_rodada.dist)
+            minotauro.passo(alvo, lab, 5, rodada, campo_rodada)
+        return n, nos
+    return rodar
+
+
+def caso_patrulha(tamanho, n):
+    lab = _labirinto(tamanho)
+    inicio = encontrar_spawn_minotauro(lab)
+    longe = (1, 1)
+
+    def rodar():
+        minotauro = Minotauro(inicio, rng=random.Random(SEMENTE))
+        campo = CampoDistancias(longe, lab, 1)  # alvo fora da percepção: só patrulha
+        for rodada in range(n):
+            minotauro.passo(longe, lab, 5, rodada, campo)
+        return n, None
+    return rodar
+
+
+def caso_entrante(tamanho, n):
+    lab = _labirinto(tamanho)
+    # Saída na moldura (inalcançável): a DFS percorre o labirinto inteiro e,
+    # quando volta ao início sem mais vizinhos, recomeça com um novo Entrante
+    saida = (-1, -1)
+
+    def rodar():
+        rng = random.Random(SEMENTE)
+        entrante = Entrante((1, 1), saida, lab, energia_max=n + 1, rng=rng)
+        for _ in range(n):
+            entrante.passo()
+            if not entrante.trilha:
+                entrante = Entrante((1, 1), saida, lab, energia_max=n + 1, rng=rng)
+        return n, None
+    return rodar
+
+
+def caso_jogo(tamanho, n):
+    def rodar():
+        for k in range(n):
+            jogar(SEMENTE + k, tamanho, tamanho)
+        return n, None
+    return rodar
+
+
+CASOS = {
+    "gerar_labirinto": (caso_gerar, "gerar"),
+    "espalhar_itens": (caso_itens, "itens"),
+    **{f"busca/{e}": (caso_busca(e), "consultas") for e in ESTRATEGIAS},
+    "distancia_minima/bfs": (caso_distancia("bfs"), "consultas"),
+    "distancia_minima/arvore": (caso_distancia("arvore"), "consultas"),
+    "minotauro/perseguicao": (caso_perseguicao, "passos"),
+    "minotauro/patrulha": (caso_patrulha, "passos"),
+    "entrante/passo": (caso_entrante, "passos"),
+    "jogo": (caso_jogo, "jogos"),
+}
+
+
+def medir(nome, tamanho):
+    """Roda um caso: passada cronometrada e passada de uma operação com tracemalloc."""
+    fabrica, chave = CASOS[nome]
+    n = REPETICOES[tamanho][chave]
+
+    rodar = fabrica(tamanho, n)
+    inicio = time.perf_counter()
+    ops, nos = rodar()
+    segundos = time.perf_counter() - inicio
+
+    rodar = fabrica(tamanho, 1)
+    tracemalloc.start()
+    rodar()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "segundos": round(segundos, 6),
+        "ops_s": round(ops / segundos, 3) if segundos > 0 else None,
+        "nos_por_op": round(nos / ops, 1) if nos is not None else None,
+        "pico_kb": round(pico / 1024, 1),
+    }
+
+
+def executar(tamanhos=TAMANHOS, casos=None, saida=sys.stdout):
+    """Roda os casos (todos, ou os cujo nome começa por algum prefixo de `casos`) e devolve a baseline."""
+    nomes = [n for n in CASOS if not casos or any(n.startswith(c) for c in casos)]
+    resultados = {}
+    for tamanho in tamanhos:
+        for nome in nomes:
+            chave = f"{nome}@{tamanho}"
+            resultados[chave] = r = medir(nome, tamanho)
+            nos = "" if r["nos_por_op"] is None else f"  {r['nos_por_op']:>10} nós/op"
+            print(f"{chave:<32} {r['ops_s']:>12.2f} ops/s  pico {r['pico_kb']:>10.1f} KB{nos}", file=saida)
+        _labirinto.cache_clear()
+        _pares.cache_clear()
+    return {
+        "versao": VERSAO_BASELINE,
+        "semente": SEMENTE,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "maquina": platform.node(),
+        "resultados": resultados,
+    }
+
+
+def mesma_maquina(atual, baseline):
+    """True se as duas medições vieram da mesma máquina e do mesmo Python (só então ops/s são comparáveis)."""
+    return all(baseline.get(campo) == atual[campo] for campo in ("maquina", "python"))
+
+
+def comparar(atual, baseline, tolerancia=TOLERANCIA, tempo=True):
+    """Lista de regressões de `atual` em relação a `baseline` (dicts no formato de executar).
+
+    Com tempo=False, ops/s não são comparados (baselines de outra máquina).
+    """
+    regressoes = []
+    for chave, novo in atual["resultados"].items():
+        antigo = baseline["resultados"].get(chave)
+        if antigo is None:
+            continue
+        if tempo and antigo["ops_s"] and novo["ops_s"] < antigo["ops_s"] * (1 - tolerancia):
+            regressoes.append(f"{chave}: {novo['ops_s']:.2f} ops/s (baseline {antigo['ops_s']:.2f})")
+        if antigo["pico_kb"] and novo["pico_kb"] > antigo["pico_kb"] * (1 + tolerancia):
+            regressoes.append(f"{chave}: pico de {novo['pico_kb']:.1f} KB (baseline {antigo['pico_kb']:.1f} KB)")
+        if antigo["nos_por_op"] is not None and (novo["nos_por_op"] or 0) > antigo["nos_por_op"]:
+            regressoes.append(f"{chave}: {novo['nos_por_op']} nós/op (baseline {antigo['nos_por_op']})")
+    return regressoes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do labirinto com baseline em JSON.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS), choices=TAMANHOS)
+    parser.add_argument("--casos", nargs="+", help="prefixos dos casos (ex.: busca jogo)")
+    parser.add_argument("--saida", help="grava os resultados neste JSON")
+    parser.add_argument("--comparar", help="baseline JSON para comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="variação aceita (0.5 = 50%%)")
+    args = parser.parse_args(argumentos)
+
+    atual = executar(args.tamanhos, args.casos)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(atual, f, indent=2, ensure_ascii=False)
+        print(f"[INFO] Resultados salvos em '{args.saida}'")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            baseline = json.load(f)
+        tempo = mesma_maquina(atual, baseline)
+        if not tempo:
+            print("[AVISO] A baseline não foi gravada nesta máquina (ou com este Python): ops/s não são "
+                  "comparados, só memória e nós. Grave uma baseline local com --saida.")
+        regressoes = comparar(atual, baseline, args.tolerancia, tempo)
+        for r in regressoes:
+            print(f"[REGRESSÃO] {r}")
+        if regressoes:
+            return 1
+        print("[INFO] Nenhuma regressão em relação à baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
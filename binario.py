@@ -0,0 +1,288 @@
+"""Formato binário compacto de labirinto (1 bit por célula), com leitura por mmap.
+
+Layout do arquivo (inteiros little-endian):
+
+    cabeçalho   "LABB", versão (u16), largura, altura (u32), semente (i64 com sinal,
+                SEM_SEMENTE = -2**63 se não houver), entrada x, y, saída x, y
+                (u32) e número de itens (u32)
+    paredes     uma linha de ceil(largura / 8) bytes por linha do labirinto; o bit
+                x % 8 do byte x // 8 vale 1 se a célula (x, y) é caminho
+    itens       um registro (x u32, y u32, código u8) por item
+
+Um labirinto 20001x20001 ocupa cerca de 50 MB. abrir_binario mapeia o arquivo
+com mmap (somente leitura): a GradeMapeada tem a interface de acesso da Grade
+(`celulas[i]`, `offsets`, `vizinhos`, `livres().sortear`, ...), e cada consulta
+lê o bit direto do buffer mapeado, sem descompactar o labirinto. Abrir é
+instantâneo e vários processos podem mapear o mesmo arquivo (pre_calculo =
+False; ver caminhos.py sobre "alt" e "arvore"). Só a camada de
+itens (pequena) vai para a memória, como uma CamadaItens (itens.py); as
+alterações de terreno (`definir`) ficam num dict à parte e não são escritas
+no arquivo.
+
+    python binario.py gerar 20001 20001 --saida grande.labb --semente 1
+"""
+
+import argparse
+import mmap
+import random
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+from grade import Grade, BaseMoldura, COD_PAREDE, COD_CAMINHO
+from itens import CamadaItens
+
+MAGICO = b"LABB"
+VERSAO_FORMATO = 2  # 2: semente com sinal (na versão 1, qualquer semente negativa era "sem semente")
+SEM_SEMENTE = -2 ** 63
+_CABECALHO = struct.Struct("<4sHIIqIIIII")
+_ITEM = struct.Struct("<IIB")
+
+# Byte de 0/1 por célula -> dígito ASCII, e o inverso (usados para empacotar/desempacotar linhas)
+_PARA_DIGITO = bytes.maketrans(b"\x00\x01", b"01")
+_EXPANDE = [bytes((b >> k) & 1 for k in range(8)) for b in range(256)]
+
+
+@dataclass
+class Cabecalho:
+    """Metadados de um arquivo binário de labirinto."""
+    largura: int
+    altura: int
+    semente: Optional[int]
+    entrada: tuple
+    saida: tuple
+    itens: int
+
+    @property
+    def bytes_por_linha(self):
+        return (self.largura + 7) // 8
+
+    @property
+    def inicio_itens(self):
+        return _CABECALHO.size + self.bytes_por_linha * self.altura
+
+
+def _empacotar_linha(linha):
+    """Linha de códigos (bytes) -> bits empacotados (1 = caminho), bit x % 8 do byte x // 8."""
+    livres = bytes(linha).translate(bytes([0]) + bytes([1]) * 255)
+    digitos = livres.translate(_PARA_DIGITO)[::-1]
+    return int(digitos, 2).to_bytes((len(linha) + 7) // 8, "little") if digitos else b""
+
+
+def escrever_linhas_binario(caminho, largura, altura, linhas, semente=None, entrada=(1, 1), saida=None,
+                            itens=()):
+    """Grava no formato binário um labirinto dado como `altura` linhas de códigos (bytes de `largura`).
+
+    As linhas são consumidas uma a uma (podem vir de eller.linhas_eller), então
+    a memória não depende da altura. `itens`: registros (x, y, código) da
+    camada de itens.
+    """
+    if semente is not None and not SEM_SEMENTE < semente < 2 ** 63:
+        raise ValueError(f"A semente deve caber em 64 bits com sinal (recebida {semente}).")
+    if saida is None:
+        saida = (largura - 2, altura - 2)
+    itens = list(itens)
+    with open(caminho, "wb") as f:
+        f.write(bytes(_CABECALHO.size))
+        y = -1
+        for y, linha in enumerate(linhas):
+            if len(linha) != largura:
+                raise ValueError(f"Linha {y} com {len(linha)} células (esperado {largura}).")
+            f.write(_empacotar_linha(linha))
+        if y + 1 != altura:
+            raise ValueError(f"Recebidas {y + 1} linhas (esperado {altura}).")
+        for item in itens:
+            f.write(_ITEM.pack(*item))
+        f.seek(0)
+        f.write(_CABECALHO.pack(MAGICO, VERSAO_FORMATO, largura, altura,
+                                SEM_SEMENTE if semente is None else semente,
+                                *entrada, *saida, len(itens)))
+
+
+def salvar_binario(grade, caminho, semente=None, entrada=(1, 1), saida=None, itens=None):
+    """Grava uma Grade (e, opcionalmente, a sua CamadaItens) no formato binário."""
+    celulas = grade.celulas
+    linhas = (celulas[r.start:r.stop] for r in map(grade.indices_linha, range(grade.altura)))
+    registros = sorted((*grade.coord(i), codigo) for i, codigo in itens) if itens is not None else ()
+    escrever_linhas_binario(caminho, grade.largura, grade.altura, linhas, semente, entrada, saida, registros)
+
+
+def _ler_cabecalho(dados, caminho, tamanho=None):
+    """Cabeçalho no início de `dados`; `tamanho` é o tamanho do arquivo (padrão: len(dados))."""
+    if len(dados) < _CABECALHO.size:
+        raise ValueError(f"'{caminho}' é curto demais para um labirinto binário.")
+    magico, versao, largura, altura, semente, ex, ey, sx, sy, itens = _CABECALHO.unpack_from(dados)
+    if magico != MAGICO:
+        raise ValueError(f"'{caminho}' não está no formato binário de labirinto.")
+    if versao not in (1, VERSAO_FORMATO):
+        raise ValueError(f"Versão de formato não suportada: {versao}")
+    sem_semente = semente < 0 if versao == 1 else semente == SEM_SEMENTE
+    cabecalho = Cabecalho(largura, altura, None if sem_semente else semente, (ex, ey), (sx, sy), itens)
+    if (len(dados) if tamanho is None else tamanho) < cabecalho.inicio_itens + itens * _ITEM.size:
+        raise ValueError(f"'{caminho}' está truncado.")
+    return cabecalho
+
+
+def ler_cabecalho(caminho):
+    """Cabeçalho de um arquivo binário, sem ler as paredes."""
+    with open(caminho, "rb") as f:
+        inicio = f.read(_CABECALHO.size)
+        tamanho = f.seek(0, 2)
+    return _ler_cabecalho(inicio, caminho, tamanho)
+
+
+def _itens(dados, cabecalho):
+    inicio = cabecalho.inicio_itens
+    return [_ITEM.unpack_from(dados, inicio + k * _ITEM.size) for k in range(cabecalho.itens)]
+
+
+def carregar_binario(caminho):
+    """Carrega o arquivo inteiro numa Grade comum. Retorna (grade, itens, cabecalho)."""
+    with open(caminho, "rb") as f:
+        dados = f.read()
+    cabecalho = _ler_cabecalho(dados, caminho)
+    largura, bpl = cabecalho.largura, cabecalho.bytes_por_linha
+    grade = Grade(largura, cabecalho.altura)
+    celulas = grade.celulas
+    for y in range(cabecalho.altura):
+        inicio = _CABECALHO.size + y * bpl
+        linha = b"".join(map(_EXPANDE.__getitem__, dados[inicio:inicio + bpl]))
+        destino = grade.indice(0, y)
+        celulas[destino:destino + largura] = linha[:largura]
+    itens = CamadaItens(grade, ((grade.indice(x, y), codigo) for x, y, codigo in _itens(dados, cabecalho)))
+    return grade, itens, cabecalho
+
+
+class _CelulasMapeadas:
+    """Visão `celulas[i]` (índices planos da Grade, com a moldura) sobre os bits mapeados."""
+    __slots__ = ("grade",)
+
+    def __init__(self, grade):
+        self.grade = grade
+
+    def __len__(self):
+        grade = self.grade
+        return grade.passo * (grade.altura + 2)
+
+    def __getitem__(self, i):
+        grade = self.grade
+        if grade.camada:
+            codigo = grade.camada.get(i)
+            if codigo is not None:
+                return codigo
+        y, x = divmod(i, grade.passo)
+        x -= 1
+        y -= 1
+        if not (0 <= x < grade.largura and 0 <= y < grade.altura):
+            return COD_PAREDE
+        if grade.buffer[grade._inicio + y * grade._bpl + (x >> 3)] >> (x & 7) & 1:
+            return COD_CAMINHO
+        return COD_PAREDE
+
+    def __setitem__(self, i, codigo):
+        x, y = self.grade.coord(i)
+        self.grade.definir(x, y, codigo)
+
+
+class _LivresMapeadas:
+    """Sorteio uniforme de células livres por rejeição, sem listar as células.
+
+    Num labirinto cerca de metade das células é livre, então bastam poucas
+    tentativas; depois de TENTATIVAS sem sucesso, sortear devolve None.
+    """
+    TENTATIVAS = 10000
+
+    __slots__ = ("grade",)
+
+    def __init__(self, grade):
+        self.grade = grade
+
+    def sortear(self, rng, excluir=()):
+        grade = self.grade
+        largura, altura = grade.largura, grade.altura
+        for _ in range(self.TENTATIVAS):
+            i = grade.indice(rng.randrange(largura), rng.randrange(altura))
+            if grade.livre(i) and i not in excluir:
+                return i
+        return None
+
+
+class GradeMapeada(BaseMoldura):
+    """Labirinto de um arquivo binário aberto com mmap, com a interface de acesso da Grade.
+
+    As paredes são lidas do arquivo mapeado (somente leitura); as alterações
+    de terreno ficam em `camada` (índice plano -> código) e os itens em `itens`.
+    """
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.cabecalho = cabecalho = _ler_cabecalho(self.buffer, caminho)
+        self._definir_dimensoes(cabecalho.largura, cabecalho.altura)
+        self.versao = 0
+        self._inicio = _CABECALHO.size
+        self._bpl = cabecalho.bytes_por_linha
+        self.camada = {}
+        self.celulas = _CelulasMapeadas(self)
+        self.itens = CamadaItens(self, ((self.indice(x, y), codigo) for x, y, codigo in _itens(self.buffer, cabecalho)))
+        self._livres = _LivresMapeadas(self)
+
+    def fechar(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def definir(self, x, y, codigo):
+        """Altera o terreno da célula (x, y) só na memória (o arquivo mapeado não muda)."""
+        i = self.indice(x, y)
+        antes = self.celulas[i]
+        self.camada[i] = codigo
+        if (antes == COD_PAREDE) != (codigo == COD_PAREDE):
+            self.versao += 1
+
+    def copiar(self):
+        """Grade comum (em memória) com o mesmo terreno (os itens ficam em `itens`)."""
+        nova = Grade(self.largura, self.altura)
+        celulas = nova.celulas
+        for y in range(self.altura):
+            inicio = self._inicio + y * self._bpl
+            linha = b"".join(map(_EXPANDE.__getitem__, self.buffer[inicio:inicio + self._bpl]))
+            destino = nova.indice(0, y)
+            celulas[destino:destino + self.largura] = linha[:self.largura]
+        for i, codigo in self.camada.items():
+            celulas[i] = codigo
+        return nova
+
+
+def abrir_binario(caminho):
+    """Abre um arquivo binário com mmap, sem carregar as paredes na memória."""
+    return GradeMapeada(caminho)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Gera labirintos no formato binário (1 bit por célula).")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p_gerar = sub.add_parser("gerar", help="gera um labirinto de Eller linha a linha direto para o arquivo")
+    p_gerar.add_argument("largura", type=int)
+    p_gerar.add_argument("altura", type=int)
+    p_gerar.add_argument("--saida", default="labirinto.labb")
+    p_gerar.add_argument("--semente", type=int, default=None)
+    p_info = sub.add_parser("info", help="mostra o cabeçalho de um arquivo")
+    p_info.add_argument("arquivo")
+    args = parser.parse_args(argumentos)
+
+    if args.comando == "gerar":
+        from eller import linhas_eller
+        linhas = linhas_eller(args.largura, args.altura, random.Random(args.semente))
+        escrever_linhas_binario(args.saida, args.largura, args.altura, linhas, args.semente)
+        print(f"[INFO] Labirinto {args.largura}x{args.altura} salvo em '{args.saida}'")
+    else:
+        print(ler_cabecalho(args.arquivo))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""Buscas de caminho mínimo sobre a Grade, com estratégias intercambiáveis.
+
+Todas as estratégias recebem e devolvem índices planos e retornam o MESMO
+caminho: o menor lexicograficamente (na ordem de grade.offsets) entre os
+caminhos mínimos, que é o caminho que a BFS simples com ordem fixa de vizinhos
+encontra. As estratégias diferem só em quantas células precisam tocar.
+
+Estratégias (ESTRATEGIAS):
+    "bfs"          BFS a partir da origem (a original do jogo)
+    "bidirecional" BFS alternando camadas a partir da origem e do destino
+    "astar"        A* com heurística de Manhattan
+    "alt"          A* com marcos (landmarks) e desigualdade triangular, combinada com Manhattan
+    "arvore"       oráculo da árvore do Prim com correção do disco central (oraculo.py);
+                   em labirintos onde o oráculo não se aplica (ciclos fora do
+                   disco, como nas dimensões pares), usa a BFS
+
+Cada função interna retorna (caminho, tocados), onde `tocados` é o número de
+células que a busca registrou.
+
+"alt" e "arvore" pré-calculam o labirinto inteiro. Em grades com
+pre_calculo = False (a GradeMapeada de binario.py e o MundoInfinito), buscar
+usa a BFS no lugar delas.
+"""
+
+import weakref
+from collections import deque
+from heapq import heappush, heappop
+from array import array
+
+import instrumentacao
+from grade import COD_PAREDE
+from oraculo import OraculoArvore
+
+
+def bfs_indices(origem, destino, grade):
+    """BFS sobre índices planos. Retorna a lista de índices do caminho (vazia se não houver)."""
+    return _bfs(origem, destino, grade)[0]
+
+
+def _bfs(origem, destino, grade):
+    if origem == destino:
+        return [origem], 1
+    celulas = grade.celulas
+    offsets = grade.offsets
+    fila = deque([origem])
+    pai = {origem: -1}
+
+    while fila:
+        atual = fila.popleft()
+        for d in offsets:
+            nb = atual + d
+            if celulas[nb] != COD_PAREDE and nb not in pai:
+                pai[nb] = atual
+                if nb == destino:
+                    path = [nb]
+                    p = atual
+                    while p != -1:
+                        path.append(p)
+                        p = pai[p]
+                    path.reverse()
+                    return path, len(pai)
+                fila.append(nb)
+    return [], len(pai)
+
+
+def bfs_limitada(origem, grade, raio):
+    """BFS a partir de `origem` (índice plano) que para de expandir na profundidade `raio`.
+
+    Retorna um dict índice -> distância com todas as células a até `raio` arestas.
+    O custo é proporcional às células dentro do raio, não ao tamanho do labirinto.
+    """
+    celulas = grade.celulas
+    offsets = grade.offsets
+    dist = {origem: 0}
+    fronteira = [origem]
+    for d in range(1, raio + 1):
+        proxima = []
+        for atual in fronteira:
+            for o in offsets:
+                nb = atual + o
+                if celulas[nb] != COD_PAREDE and nb not in dist:
+                    dist[nb] = d
+                    proxima.append(nb)
+        if not proxima:
+            break
+        fronteira = proxima
+    instrumentacao.registrar_busca("bfs_limitada", len(dist))
+    return dist
+
+
+def bfs_multiorigem(origens, grade, raio=None):
+    """BFS simultânea a partir de várias origens (índices planos), opcionalmente limitada a `raio`.
+
+    Retorna (dist, dono): dicts índice -> distância até a origem mais próxima e
+    índice, em `origens`, dessa origem. Uma única busca substitui uma BFS por
+    origem; o custo é o das células alcançadas, independente do número de
+    origens. Empates ficam com a origem que a busca alcança primeiro (a ordem
+    de `origens` decide entre fontes igualmente próximas da mesma camada).
+    """
+    celulas = grade.celulas
+    offsets = grade.offsets
+    dist = {}
+    dono = {}
+    fronteira = []
+    for k, i in enumerate(origens):
+        if i not in dist:
+            dist[i] = 0
+            dono[i] = k
+            fronteira.append(i)
+    d = 0
+    while fronteira and (raio is None or d < raio):
+        d += 1
+        proxima = []
+        for atual in fronteira:
+            k = dono[atual]
+            for o in offsets:
+                nb = atual + o
+                if celulas[nb] != COD_PAREDE and nb not in dist:
+                    dist[nb] = d
+                    dono[nb] = k
+                    proxima.append(nb)
+        fronteira = proxima
+    instrumentacao.registrar_busca("bfs_multiorigem", len(dist))
+    return dist, dono
+
+
+def distancias_completas(origem, grade):
+    """Distâncias BFS de origem para todas as células, num array (-1 = inalcançável)."""
+    celulas = grade.celulas
+    offsets = grade.offsets
+    dist = array("i", [-1]) * len(celulas)
+    dist[origem] = 0
+    fila = deque([origem])
+    while fila:
+        atual = fila.popleft()
+        d = dist[atual] + 1
+        for o in offsets:
+            nb = atual + o
+            if celulas[nb] != COD_PAREDE and dist[nb] < 0:
+                dist[nb] = d
+                fila.append(nb)
+    return dist
+
+
+# --- Reconstrução canônica ---
+def _guloso(atual, camadas, aceita, offsets, path):
+    """Para cada j em `camadas`, anda para o primeiro vizinho (na ordem de
+    offsets) aceito por aceita(vizinho, j) e o acrescenta a path."""
+    for j in camadas:
+        for o in offsets:
+            if aceita(atual + o, j):
+                atual += o
+                break
+        path.append(atual)
+    return atual
+
+
+def _marca_no_caminho(alvos, g, offsets):
+    """A partir de `alvos` (todos com o mesmo g), volta por g-1, g-2, ... até 0
+    marcando as células que estão em algum caminho mínimo. Só considera
+    células com g conhecido."""
+    marcadas = set(alvos)
+    camada = list(alvos)
+    while camada:
+        proxima = []
+        for u in camada:
+            gu = g[u] - 1
+            for o in offsets:
+                w = u + o
+                if w not in marcadas and g.get(w) == gu:
+                    marcadas.add(w)
+                    proxima.append(w)
+        camada = proxima
+    return marcadas
+
+
+# --- Bidirecional ---
+def _expande(fronteira, dist, d, celulas, offsets):
+    proxima = []
+    for atual in fronteira:
+        for o in offsets:
+            nb = atual + o
+            if celulas[nb] != COD_PAREDE and nb not in dist:
+                dist[nb] = d
+                proxima.append(nb)
+    return proxima
+
+
+def _bidirecional(origem, destino, grade):
+    if origem == destino:
+        return [origem], 1
+    celulas = grade.celulas
+    offsets = grade.offsets
+
+    df = {origem: 0}
+    db = {destino: 0}
+    ff, fb = [origem], [destino]
+    kf = kb = 0
+    encontro = None
+    while ff and fb:
+        # Expande uma camada inteira do lado com a menor fronteira
+        if len(ff) <= len(fb):
+            kf += 1
+            ff = _expande(ff, df, kf, celulas, offsets)
+            encontro = [v for v in ff if v in db]
+        else:
+            kb += 1
+            fb = _expande(fb, db, kb, celulas, offsets)
+            encontro = [v for v in fb if v in df]
+        if encontro:
+            break
+    tocados = len(df) + len(db)
+    if not encontro:
+        return [], tocados
+
+    # Bolas completas até kf (origem) e kb (destino), com D = kf + kb; toda
+    # célula de um caminho mínimo na camada kf tem df = kf e db = kb.
+    camada = [v for v in encontro if df.get(v) == kf and db.get(v) == kb]
+    no_caminho = _marca_no_caminho(camada, df, offsets)
+
+    path = [origem]
+    atual = _guloso(origem, range(1, kf + 1), lambda w, j: w in no_caminho and df[w] == j, offsets, path)
+    # Do lado do destino, qualquer vizinho com db um a menos está num caminho mínimo
+    _guloso(atual, range(kb - 1, -1, -1), lambda w, j: db.get(w) == j, offsets, path)
+    return path, tocados
+
+
+# --- A* (Manhattan e ALT) ---
+def _astar(origem, destino, grade, h):
+    if origem == destino:
+        return [origem], 1
+    celulas = grade.celulas
+    offsets = grade.offsets
+
+    g = {origem: 0}
+    fechados = {}
+    heap = [(h(origem), 0, origem)]
+    total = None
+    while heap:
+        f, gv, v = heappop(heap)
+        # Depois de achar o destino, continua até fechar todas as células com
+        # f <= D: com heurística consistente, isso inclui todo caminho mínimo.
+        if total is not None and f > total:
+            break
+        if v in fechados or gv != g[v]:
+            continue
+        fechados[v] = gv
+        if v == destino:
+            total = gv
+            continue
+        ng = gv + 1
+        for o in offsets:
+            w = v + o
+            if celulas[w] != COD_PAREDE and ng < g.get(w, ng + 1):
+                g[w] = ng
+                heappush(heap, (ng + h(w), ng, w))
+
+    if total is None:
+        return [], len(g)
+
+    no_caminho = _marca_no_caminho([destino], fechados, offsets)
+    path = [origem]
+    _guloso(origem, range(1, total + 1), lambda w, j: w in no_caminho and fechados[w] == j, offsets, path)
+    return path, len(g)
+
+
+def _manhattan(destino, grade):
+    passo = grade.passo
+    ty, tx = divmod(destino, passo)
+
+    def h(i):
+        y, x = divmod(i, passo)
+        return abs(x - tx) + abs(y - ty)
+    return h
+
+
+class Marcos:
+    """Distâncias pré-calculadas de alguns marcos (landmarks) para todas as células.
+
+    Pela desigualdade triangular, |d(m, t) - d(m, v)| <= d(v, t) para todo marco m,
+    o que dá uma heurística admissível e consistente para o A* (ALT). Os marcos
+    são escolhidos pelo ponto mais distante dos já escolhidos, começando pela
+    célula mais distante da entrada.
+    """
+    def __init__(self, grade, quantidade=8):
+        self.versao = grade.versao
+        self.distancias = []
+        livres = grade.livres()
+        if not len(livres):
+            return
+        inicial = grade.indice(1, 1) if grade.livre(grade.indice(1, 1)) else livres.lista[0]
+        minimo = distancias_completas(inicial, grade)
+        for _ in range(quantidade):
+            marco = max(livres.lista, key=minimo.__getitem__)
+            dist = distancias_completas(marco, grade)
+            self.distancias.append(dist)
+            minimo = array("i", map(min, minimo, dist))
+
+    def heuristica(self, destino, grade):
+        manhattan = _manhattan(destino, grade)
+        alvos = [(dist, dist[destino]) for dist in self.distancias if dist[destino] >= 0]
+
+        def h(i):
+            melhor = manhattan(i)
+            for dist, dt in alvos:
+                dv = dist[i]
+                if dv >= 0:
+                    dif = dv - dt if dv > dt else dt - dv
+                    if dif > melhor:
+                        melhor = dif
+            return melhor
+        return h
+
+
+_marcos_cache = weakref.WeakKeyDictionary()  # grade -> Marcos; some junto com a grade
+
+
+def marcos_para(grade):
+    """Marcos do labirinto, recalculados se a grade for nova ou sua versão mudou."""
+    marcos = _marcos_cache.get(grade)
+    if marcos is None or marcos.versao != grade.versao:
+        marcos = _marcos_cache[grade] = Marcos(grade)
+    return marcos
+
+
+_oraculo_cache = weakref.WeakKeyDictionary()  # grade -> (versão, OraculoArvore ou None); some junto com a grade
+
+
+def oraculo_para(grade):
+    """Oráculo de árvore do labirinto, reconstruído se a grade for nova ou sua versão mudou.
+
+    Retorna None se o oráculo não se aplica ao labirinto (ver OraculoArvore).
+    """
+    if not grade.pre_calculo:
+        return None
+    versao, oraculo = _oraculo_cache.get(grade, (None, None))
+    if versao != grade.versao:
+        try:
+            oraculo = OraculoArvore(grade)
+        except ValueError:
+            oraculo = None
+        _oraculo_cache[grade] = (grade.versao, oraculo)
+    return oraculo
+
+
+def _arvore(origem, destino, grade):
+    oraculo = oraculo_para(grade)
+    if oraculo is None:
+        return _bfs(origem, destino, grade)
+    path = oraculo.caminho(origem, destino)
+    return path, len(path)
+
+
+def _astar_manhattan(origem, destino, grade):
+    return _astar(origem, destino, grade, _manhattan(destino, grade))
+
+
+def _astar_alt(origem, destino, grade):
+    return _astar(origem, destino, grade, marcos_para(grade).heuristica(destino, grade))
+
+
+PRE_CALCULADAS = ("alt", "arvore")  # estratégias que pré-calculam o labirinto inteiro
+
+ESTRATEGIAS = {
+    "bfs": _bfs,
+    "bidirecional": _bidirecional,
+    "astar": _astar_manhattan,
+    "alt": _astar_alt,
+    "arvore": _arvore,
+}
+
+
+def buscar(origem, destino, grade, estrategia="bfs"):
+    """Caminho mínimo (índices planos) e número de células tocadas pela estratégia."""
+    try:
+        busca = ESTRATEGIAS[estrategia]
+    except KeyError:
+        raise ValueError(f"Estratégia de busca desconhecida: {estrategia!r} (use uma de {sorted(ESTRATEGIAS)})")
+    if estrategia in PRE_CALCULADAS and not grade.pre_calculo:
+        busca = _bfs
+    resultado = busca(origem, destino, grade)
+    instrumentacao.registrar_busca(estrategia, resultado[1])
+    return resultado
@@ -0,0 +1,250 @@
+"""Corpus de labirintos em disco: cache de gerar_labirinto + espalhar_itens.
+
+Cada entrada é identificada por (largura, altura, semente, itens, VERSAO_GERADOR)
+e guarda dois arquivos no diretório do corpus:
+
+    <chave>.labb   o labirinto e a camada de itens, no formato binário (binario.py)
+    <chave>.json   metadados pré-calculados: spawn do Minotauro, número de
+                   células livres, distância entrada -> saída e o estado do
+                   random.Random(semente) logo depois da geração
+
+Com o estado do gerador guardado, JogoCorpus(semente) começa exatamente como
+Jogo(semente): o labirinto sai do disco e os agentes continuam a mesma
+sequência de sorteios. Variar PERCEPCAO ou energia sobre um corpus fixo não
+gera nenhum labirinto.
+
+O corpus tem um limite de bytes em disco: cada leitura atualiza a data de
+modificação da entrada e, quando o total passa do limite, as entradas usadas
+há mais tempo são apagadas (LRU). A gravação é atômica (arquivo temporário e
+os.replace), então vários processos podem usar o mesmo diretório.
+
+    python corpus.py aquecer --tamanhos 31 101 --sementes 0 1000 --processos 8
+    python corpus.py info
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from binario import salvar_binario, carregar_binario
+from caminhos import distancias_completas
+from labirinto import (Jogo, VERSAO_GERADOR, PERCEPCAO, gerar_labirinto, espalhar_itens,
+                       encontrar_spawn_minotauro)
+
+DIRETORIO = ".corpus"
+LIMITE_BYTES = 1 << 30  # 1 GB
+
+
+def chave(largura, altura, semente, itens):
+    """Nome-base dos arquivos da entrada (inclui a versão do gerador)."""
+    return f"{largura}x{altura}_s{semente}_i{itens}_v{VERSAO_GERADOR}"
+
+
+def gerar_entrada(largura, altura, semente, itens):
+    """Gera o labirinto da semente como Jogo(semente) geraria. Retorna (grade, camada de itens, metadados)."""
+    rng = random.Random(semente)
+    lab = gerar_labirinto(largura, altura, rng)
+    camada = espalhar_itens(lab, quantidade=itens, rng=rng)
+    versao, estado, gauss = rng.getstate()
+    dist = distancias_completas(lab.indice(1, 1), lab)[lab.indice(largura - 2, altura - 2)]
+    metadados = {
+        "largura": largura,
+        "altura": altura,
+        "semente": semente,
+        "itens": itens,
+        "versao_gerador": VERSAO_GERADOR,
+        "spawn_minotauro": list(encontrar_spawn_minotauro(lab)),
+        "livres": len(lab.livres()),
+        "distancia_saida": dist if dist >= 0 else None,
+        "estado_rng": [versao, list(estado), gauss],
+    }
+    return lab, camada, metadados
+
+
+def _gravar_atomico(caminho, escrever):
+    diretorio = os.path.dirname(caminho) or "."
+    fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+    os.close(fd)
+    try:
+        escrever(temporario)
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+
+
+class Corpus:
+    """Cache LRU em disco de labirintos gerados, com limite de bytes."""
+
+    def __init__(self, diretorio=DIRETORIO, limite_bytes=LIMITE_BYTES):
+        self.diretorio = diretorio
+        self.limite_bytes = limite_bytes
+        os.makedirs(diretorio, exist_ok=True)
+        self.acertos = 0
+        self.faltas = 0
+
+    def _caminhos(self, nome):
+        base = os.path.join(self.diretorio, nome)
+        return base + ".labb", base + ".json"
+
+    def contem(self, largura, altura, semente, itens):
+        return os.path.exists(self._caminhos(chave(largura, altura, semente, itens))[0])
+
+    def guardar(self, lab, itens, metadados, despejar=True):
+        """Grava uma entrada (o .json antes do .labb: o .labb marca a entrada como completa)."""
+        m = metadados
+        arq_lab, arq_meta = self._caminhos(chave(m["largura"], m["altura"], m["semente"], m["itens"]))
+
+        def escrever_meta(caminho):
+            with open(caminho, "w", encoding="utf-8") as f:
+                json.dump(metadados, f)
+
+        _gravar_atomico(arq_meta, escrever_meta)
+        _gravar_atomico(arq_lab, lambda caminho: salvar_binario(lab, caminho, semente=m["semente"], itens=itens))
+        if despejar:
+            self.despejar()
+
+    def obter(self, largura, altura, semente, itens):
+        """(grade, camada de itens, metadados) da entrada, gerando e guardando se ainda não estiver no corpus."""
+        arq_lab, arq_meta = self._caminhos(chave(largura, altura, semente, itens))
+        try:
+            lab, camada, _ = carregar_binario(arq_lab)
+            with open(arq_meta, encoding="utf-8") as f:
+                metadados = json.load(f)
+            os.utime(arq_lab)  # uso recente (LRU)
+            self.acertos += 1
+            return lab, camada, metadados
+        except FileNotFoundError:
+            pass
+        self.faltas += 1
+        lab, camada, metadados = gerar_entrada(largura, altura, semente, itens)
+        self.guardar(lab, camada, metadados)
+        return lab, camada, metadados
+
+    def entradas(self):
+        """Lista de (último uso, bytes, nome) das entradas completas, da menos à mais recente."""
+        resultado = []
+        for arquivo in os.listdir(self.diretorio):
+            if not arquivo.endswith(".labb"):
+                continue
+            nome = arquivo[:-len(".labb")]
+            arq_lab, arq_meta = self._caminhos(nome)
+            try:
+                estado = os.stat(arq_lab)
+                tamanho = estado.st_size + os.path.getsize(arq_meta)
+            except FileNotFoundError:
+                continue
+            resultado.append((estado.st_mtime, tamanho, nome))
+        resultado.sort()
+        return resultado
+
+    def tamanho(self):
+        """Bytes ocupados pelas entradas."""
+        return sum(t for _, t, _ in self.entradas())
+
+    def despejar(self):
+        """Apaga as entradas usadas há mais tempo até o corpus caber no limite. Retorna quantas apagou."""
+        entradas = self.entradas()
+        total = sum(t for _, t, _ in entradas)
+        apagadas = 0
+        for _, tamanho, nome in entradas:
+            if total <= self.limite_bytes:
+                break
+            for arquivo in self._caminhos(nome):
+                try:
+                    os.unlink(arquivo)
+                except FileNotFoundError:
+                    pass
+            total -= tamanho
+            apagadas += 1
+        return apagadas
+
+
+class JogoCorpus(Jogo):
+    """Jogo(semente) com o labirinto lido do corpus em vez de gerado.
+
+    O RNG da partida é restaurado para o estado logo depois da geração, então a
+    partida é idêntica à de Jogo com os mesmos parâmetros.
+    """
+    def __init__(self, corpus, semente, largura, altura, percepcao=PERCEPCAO, energia_max=500,
+                 quantidade_itens=30, instrumentar=False):
+        if semente is None:
+            raise ValueError("O corpus exige uma semente.")
+        self.corpus = corpus
+        super().__init__(semente, largura, altura, percepcao, energia_max, quantidade_itens,
+                         instrumentar=instrumentar)
+
+    def _montar(self, quantidade_itens):
+        lab, itens, metadados = self.corpus.obter(self.largura, self.altura, self.semente, quantidade_itens)
+        versao, estado, gauss = metadados["estado_rng"]
+        self.rng.setstate((versao, tuple(estado), gauss))
+        return lab, itens, (self.largura-2, self.altura-2), tuple(metadados["spawn_minotauro"])
+
+    def __getstate__(self):
+        # O corpus (diretório em disco) não faz parte do estado da partida
+        estado = self.__dict__.copy()
+        estado["corpus"] = None
+        return estado
+
+
+def jogar(corpus, semente, largura, altura, percepcao=PERCEPCAO, energia_max=500,
+          quantidade_itens=30, max_rodadas=None):
+    """Como labirinto.jogar, mas com o labirinto vindo do corpus."""
+    jogo = JogoCorpus(corpus, semente, largura, altura, percepcao, energia_max, quantidade_itens)
+    while not jogo.encerrado:
+        if max_rodadas is not None and jogo.rodada >= max_rodadas:
+            break
+        jogo.avancar()
+    return jogo.resultado()
+
+
+def _aquecer_um(diretorio, limite_bytes, largura, altura, semente, itens):
+    corpus = Corpus(diretorio, limite_bytes)
+    if corpus.contem(largura, altura, semente, itens):
+        return False
+    corpus.guardar(*gerar_entrada(largura, altura, semente, itens), despejar=False)
+    return True
+
+
+def aquecer(corpus, tamanhos, sementes, itens=30, processos=None):
+    """Gera em paralelo as entradas que faltam para cada (tamanho, semente). Retorna quantas gerou."""
+    tarefas = [(corpus.diretorio, corpus.limite_bytes, t, t, s, itens) for t in tamanhos for s in sementes
+               if not corpus.contem(t, t, s, itens)]
+    if not tarefas:
+        return 0
+    with ProcessPoolExecutor(processos) as executor:
+        geradas = sum(executor.map(_aquecer_um, *zip(*tarefas), chunksize=max(len(tarefas) // 64, 1)))
+    corpus.despejar()
+    return geradas
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Corpus de labirintos em disco (cache LRU).")
+    parser.add_argument("--diretorio", default=DIRETORIO)
+    parser.add_argument("--limite-mb", type=float, default=LIMITE_BYTES / 2**20)
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_aquecer = sub.add_parser("aquecer", help="gera o corpus em paralelo")
+    p_aquecer.add_argument("--tamanhos", type=int, nargs="+", default=[31])
+    p_aquecer.add_argument("--sementes", type=int, nargs=2, default=[0, 100], metavar=("INICIO", "FIM"),
+                           help="faixa [INICIO, FIM) de sementes")
+    p_aquecer.add_argument("--itens", type=int, default=30)
+    p_aquecer.add_argument("--processos", type=int, default=None)
+
+    sub.add_parser("info", help="mostra o tamanho do corpus")
+    args = parser.parse_args(argumentos)
+
+    corpus = Corpus(args.diretorio, int(args.limite_mb * 2**20))
+    if args.comando == "aquecer":
+        geradas = aquecer(corpus, args.tamanhos, range(*args.sementes), args.itens, args.processos)
+        print(f"[INFO] {geradas} labirintos gerados em '{args.diretorio}'")
+    entradas = corpus.entradas()
+    print(f"[INFO] {len(entradas)} entradas, {sum(t for _, t, _ in entradas) / 2**20:.1f} MB "
+          f"(limite {corpus.limite_bytes / 2**20:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Gerador de labirintos linha a linha (algoritmo de Eller), com memória O(largura).
+
+O gerar_labirinto (Prim) precisa da grade inteira e da fronteira em memória.
+O algoritmo de Eller percorre as linhas de células de cima para baixo e só
+guarda, para a linha atual, o conjunto (componente conexa) de cada coluna.
+Cada linha é emitida assim que fica pronta, então dá para gerar labirintos
+muito altos (por exemplo 2001 x 1.000.000) direto para o disco.
+
+A estrutura é a mesma do gerar_labirinto: células nas coordenadas ímpares,
+paredes entre elas, moldura de paredes e um labirinto perfeito (uma árvore),
+com o disco livre do centro (centro_livre) aberto e a saída (largura-2,
+altura-2) garantida como caminho.
+
+As linhas são bytes com os códigos da Grade (COD_PAREDE / COD_CAMINHO).
+Com largura e altura ímpares o resultado é conexo; com dimensões pares a
+coluna/linha extra fica de parede, como no gerar_labirinto, e a saída é
+ligada à última linha de células.
+
+    python eller.py 2001 1000000 --saida grande.lab --semente 1
+"""
+
+import argparse
+import math
+import random
+
+from grade import Grade, COD_CAMINHO, centro_livre
+
+CABECALHO = b"LABIRINTO-BRUTO"  # cabeçalho do formato bruto: uma linha de texto, depois um byte por célula
+
+
+def _faixa_do_disco(y, cx, cy, raio, largura):
+    """Faixa [inicio, fim) de colunas da linha y dentro do disco livre (vazia se não houver)."""
+    dy = y - cy
+    if raio < 0 or dy * dy > raio * raio:
+        return 0, 0
+    dx = math.isqrt(raio * raio - dy * dy)
+    return max(cx - dx, 0), min(cx + dx + 1, largura)
+
+
+def linhas_eller(largura, altura, rng=random, disco=True):
+    """Gera as `altura` linhas do labirinto, de cima para baixo, cada uma como bytes de `largura` códigos.
+
+    O estado de trabalho é O(largura): o conjunto de cada coluna de células da
+    linha atual e os membros de cada conjunto. Com disco=False, o disco livre
+    do centro não é aberto e o resultado é uma árvore.
+    """
+    colunas = max((largura - 1) // 2, 0)      # células nas colunas x = 1, 3, 5, ...
+    linhas_celulas = max((altura - 1) // 2, 0)  # células nas linhas y = 1, 3, 5, ...
+    cx, cy, raio = centro_livre(largura, altura) if disco else (0, 0, -1)
+    saida = (largura - 2, altura - 2)
+
+    parede = bytes(largura)
+    conjunto = [0] * colunas   # conjunto de cada coluna (0 = ainda sem conjunto)
+    membros = {}               # conjunto -> colunas da linha atual
+    proximo = 1
+
+    def emitir(y, linha):
+        inicio, fim = _faixa_do_disco(y, cx, cy, raio, largura)
+        if inicio < fim:
+            linha[inicio:fim] = bytes([COD_CAMINHO]) * (fim - inicio)
+        if y == saida[1] and 0 <= saida[0] < largura:
+            linha[saida[0]] = COD_CAMINHO
+            # Com largura e altura pares, a saída fica fora da malha de células:
+            # liga-a à passagem sob a última célula da última linha
+            if largura % 2 == 0 and altura % 2 == 0 and saida[0] >= 1:
+                linha[saida[0] - 1] = COD_CAMINHO
+        return bytes(linha)
+
+    y = 0
+    yield emitir(y, bytearray(parede))
+    for r in range(linhas_celulas):
+        ultima = r == linhas_celulas - 1
+
+        # Colunas sem conjunto ganham um conjunto novo
+        for k in range(colunas):
+            if not conjunto[k]:
+                conjunto[k] = proximo
+                membros[proximo] = [k]
+                proximo += 1
+
+        # Linha de células: junta vizinhos de conjuntos diferentes ao acaso
+        # (na última linha, junta todos, para o labirinto ficar conexo).
+        # Um byte aleatório por coluna decide cada sorteio de 50%.
+        linha = bytearray(parede)
+        linha[1:2 * colunas:2] = bytes([COD_CAMINHO]) * colunas
+        sorteio = rng.randbytes(colunas)
+        for k in range(colunas - 1):
+            a, b = conjunto[k], conjunto[k + 1]
+            if a != b and (ultima or sorteio[k] & 1):
+                linha[2 * k + 2] = COD_CAMINHO
+                # Une o conjunto menor ao maior
+                if len(membros[a]) < len(membros[b]):
+                    a, b = b, a
+                for j in membros[b]:
+                    conjunto[j] = a
+                membros[a].extend(membros.pop(b))
+        y += 1
+        yield emitir(y, linha)
+
+        # Linha de passagens para baixo: cada conjunto desce por ao menos uma coluna
+        linha = bytearray(parede)
+        if not ultima:
+            novos = {}
+            sorteio = rng.randbytes(colunas)
+            for c, cols in membros.items():
+                descem = [k for k in cols if sorteio[k] & 1]
+                if not descem:
+                    descem = [cols[rng.randrange(len(cols))]]
+                novos[c] = descem
+                for k in descem:
+                    linha[2 * k + 1] = COD_CAMINHO
+            conjunto = [0] * colunas
+            for c, cols in novos.items():
+                for k in cols:
+                    conjunto[k] = c
+            membros = novos
+        y += 1
+        if y < altura:
+            yield emitir(y, linha)
+
+    # Linhas de parede restantes (a moldura de baixo e, com altura par, a linha extra)
+    for y in range(y + 1, altura):
+        yield emitir(y, bytearray(parede))
+
+
+def gerar_labirinto_eller(largura, altura, rng=random):
+    """Labirinto de Eller já montado numa Grade (mesma interface de gerar_labirinto)."""
+    grade = Grade(largura, altura)
+    celulas = grade.celulas
+    for y, linha in enumerate(linhas_eller(largura, altura, rng)):
+        inicio = grade.indice(0, y)
+        celulas[inicio:inicio + largura] = linha
+    return grade
+
+
+def escrever_eller(caminho, largura, altura, rng=random):
+    """Gera o labirinto direto para um arquivo no formato bruto (um byte por célula, linha a linha)."""
+    with open(caminho, "wb") as f:
+        f.write(CABECALHO + f" {largura} {altura}\n".encode("ascii"))
+        for linha in linhas_eller(largura, altura, rng):
+            f.write(linha)
+
+
+def _ler_cabecalho(f, caminho):
+    cabecalho = f.readline().split()
+    if len(cabecalho) != 3 or cabecalho[0] != CABECALHO:
+        raise ValueError(f"'{caminho}' não está no formato bruto de labirinto.")
+    return int(cabecalho[1]), int(cabecalho[2])
+
+
+def ler_linhas(caminho):
+    """Lê um arquivo do formato bruto linha a linha (bytes de `largura` códigos), sem carregá-lo todo."""
+    with open(caminho, "rb") as f:
+        largura, altura = _ler_cabecalho(f, caminho)
+        for y in range(altura):
+            linha = f.read(largura)
+            if len(linha) != largura:
+                raise ValueError(f"'{caminho}' terminou antes da linha {y}.")
+            yield linha
+
+
+def carregar_bruto(caminho):
+    """Carrega numa Grade um labirinto salvo no formato bruto."""
+    with open(caminho, "rb") as f:
+        largura, altura = _ler_cabecalho(f, caminho)
+    grade = Grade(largura, altura)
+    celulas = grade.celulas
+    for y, linha in enumerate(ler_linhas(caminho)):
+        inicio = grade.indice(0, y)
+        celulas[inicio:inicio + largura] = linha
+    return grade
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Gera um labirinto (Eller) direto para um arquivo no formato bruto.")
+    parser.add_argument("largura", type=int)
+    parser.add_argument("altura", type=int)
+    parser.add_argument("--saida", default="labirinto.lab")
+    parser.add_argument("--semente", type=int, default=None)
+    args = parser.parse_args(argumentos)
+
+    escrever_eller(args.saida, args.largura, args.altura, random.Random(args.semente))
+    print(f"[INFO] Labirinto {args.largura}x{args.altura} salvo em '{args.saida}'")
+
+
+if __name__ == "__main__":
+    main()
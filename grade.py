@@ -0,0 +1,265 @@
+"""Grade compacta do labirinto: um bytearray plano com códigos de célula.
+
+A grade guarda uma moldura sentinela de paredes em volta do labirinto, de modo
+que os vizinhos de qualquer célula livre podem ser obtidos somando os
+deslocamentos de `offsets` ao índice plano, sem checar limites.
+
+BaseGrade e BaseMoldura guardam a interface de acesso por índice plano e a
+aritmética da moldura, compartilhadas com a GradeMapeada (binario.py) e o
+MundoInfinito (mundo.py).
+"""
+
+import math
+from array import array
+
+# --- Códigos de célula ---
+COD_PAREDE = 0
+COD_CAMINHO = 1
+COD_ITEM_BASE = 2  # itens (na camada de itens, fora da grade) usam os códigos COD_ITEM_BASE, COD_ITEM_BASE+1, ...
+
+
+def centro_livre(largura, altura):
+    """Centro (cx, cy) e raio do disco livre aberto no meio do labirinto (~5% da área)."""
+    cx, cy = largura // 2, altura // 2
+    total = largura * altura
+    area_livre = math.ceil(total * 0.05)
+    raio = int(math.sqrt(area_livre / math.pi))
+    return cx, cy, raio
+
+
+def celulas_do_disco(largura, altura, cx, cy, raio):
+    """Coordenadas (x, y) dentro do labirinto que pertencem ao disco de centro (cx, cy)."""
+    for y in range(cy - raio, cy + raio + 1):
+        for x in range(cx - raio, cx + raio + 1):
+            if 0 <= x < largura and 0 <= y < altura:
+                if (x - cx) ** 2 + (y - cy) ** 2 <= raio ** 2:
+                    yield x, y
+
+
+class BaseGrade:
+    """Interface de acesso por índice plano comum às grades (Grade, GradeMapeada, MundoInfinito).
+
+    A subclasse define `celulas` (indexável por índice plano), `indice`,
+    `coord`, `dentro`, `_livres` e chama _definir_passo; daqui vêm os
+    vizinhos, as máscaras de vizinhos e o resto da interface usada pelas
+    buscas e pelos agentes.
+    """
+    __slots__ = ()
+    pre_calculo = False  # aceita as buscas que pré-calculam o labirinto inteiro (ver caminhos.buscar)
+
+    def _definir_passo(self, passo):
+        self.passo = passo
+        # Mesma ordem de vizinhos usada nas buscas: (0,1), (0,-1), (1,0), (-1,0)
+        self.offsets = (passo, -passo, 1, -1)
+        # offsets_por_mascara[m]: deslocamentos dos vizinhos livres cuja máscara de bits é m
+        self.offsets_por_mascara = tuple(
+            tuple(d for k, d in enumerate(self.offsets) if m >> k & 1) for m in range(16))
+
+    def celula(self, x, y):
+        """Código da célula (x, y)."""
+        return self.celulas[self.indice(x, y)]
+
+    def livre(self, i):
+        """True se o índice plano i não é parede."""
+        return self.celulas[i] != COD_PAREDE
+
+    def vizinhos(self, i):
+        """Índices planos dos vizinhos livres de i, na ordem de `offsets`."""
+        celulas = self.celulas
+        return [i + d for d in self.offsets if celulas[i + d] != COD_PAREDE]
+
+    def mascara_vizinhos(self, i, mascaras=None):
+        """Máscara de vizinhos livres de i (bit k = offsets[k] livre); calculada a cada chamada."""
+        celulas = self.celulas
+        m = 0
+        for k, d in enumerate(self.offsets):
+            if celulas[i + d] != COD_PAREDE:
+                m |= 1 << k
+        return m
+
+    def livres(self):
+        """Índice das células livres (com `sortear`)."""
+        return self._livres
+
+
+class BaseMoldura(BaseGrade):
+    """Índices planos de uma grade largura x altura cercada por uma moldura sentinela.
+
+    Cada linha tem uma coluna sentinela de cada lado e há uma linha sentinela
+    em cima e embaixo: passo = largura + 2.
+    """
+    __slots__ = ()
+
+    def _definir_dimensoes(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+        self._definir_passo(largura + 2)
+
+    def __len__(self):
+        return self.altura
+
+    def indice(self, x, y):
+        """Índice plano da célula (x, y)."""
+        return (y + 1) * self.passo + x + 1
+
+    def coord(self, i):
+        """Coordenada (x, y) de um índice plano."""
+        y, x = divmod(i, self.passo)
+        return (x - 1, y - 1)
+
+    def dentro(self, x, y):
+        return 0 <= x < self.largura and 0 <= y < self.altura
+
+    def indices_linha(self, y):
+        """Faixa de índices planos da linha y (sem as sentinelas)."""
+        inicio = (y + 1) * self.passo + 1
+        return range(inicio, inicio + self.largura)
+
+
+class Grade(BaseMoldura):
+    """Labirinto largura x altura armazenado como bytearray endereçado por índice plano."""
+    __slots__ = ("largura", "altura", "passo", "celulas", "offsets", "versao", "_livres", "_livres_versao",
+                 "_mascaras", "_mascaras_versao", "offsets_por_mascara", "__weakref__")
+    pre_calculo = True
+
+    def __init__(self, largura, altura):
+        self._definir_dimensoes(largura, altura)
+        self.celulas = bytearray(self.passo * (altura + 2))
+        # Incrementada sempre que uma célula muda entre parede e caminho (invalida caches de rotas)
+        self.versao = 0
+        self._livres = None
+        self._livres_versao = -1  # versão em que _livres foi montado na ordem das linhas
+        self._mascaras = None
+        self._mascaras_versao = -1
+
+    def celula(self, x, y):
+        """Código da célula (x, y)."""
+        return self.celulas[(y + 1) * self.passo + x + 1]
+
+    def definir(self, x, y, codigo):
+        """Altera o código da célula (x, y), mantendo o índice de células livres e a versão."""
+        i = (y + 1) * self.passo + x + 1
+        antes = self.celulas[i]
+        self.celulas[i] = codigo
+        if (antes == COD_PAREDE) == (codigo == COD_PAREDE):
+            return
+        self.versao += 1
+        if self._livres is not None:
+            if codigo == COD_PAREDE:
+                self._livres.remover(i)
+            else:
+                self._livres.adicionar(i)
+
+    def livres(self):
+        """Índice das células livres (construído na primeira chamada).
+
+        Mudanças de parede/caminho depois disso devem passar por `definir`.
+        """
+        if self._livres is None:
+            celulas = self.celulas
+            self._livres = IndiceLivres(
+                len(celulas),
+                (i for y in range(self.altura) for i in self.indices_linha(y) if celulas[i] != COD_PAREDE),
+            )
+            self._livres_versao = self.versao
+        return self._livres
+
+    def mascaras(self):
+        """bytearray com a máscara de vizinhos livres de cada célula (bit k = offsets[k] livre).
+
+        As máscaras são calculadas sob demanda por mascara_vizinhos (0xFF = ainda não
+        calculada) e descartadas quando a versão da grade muda.
+        """
+        if self._mascaras is None or self._mascaras_versao != self.versao:
+            self._mascaras = bytearray(b"\xff") * len(self.celulas)
+            self._mascaras_versao = self.versao
+        return self._mascaras
+
+    def mascara_vizinhos(self, i, mascaras=None):
+        """Máscara de vizinhos livres de i (usa/preenche o cache de mascaras())."""
+        if mascaras is None:
+            mascaras = self.mascaras()
+        m = mascaras[i]
+        if m == 0xFF:
+            celulas = self.celulas
+            m = 0
+            for k, d in enumerate(self.offsets):
+                if celulas[i + d] != COD_PAREDE:
+                    m |= 1 << k
+            mascaras[i] = m
+        return m
+
+    def __getstate__(self):
+        # O cache de máscaras é refeito sob demanda; não vai para instantâneos. O índice de
+        # livres também não, enquanto a grade não mudou desde que ele foi montado: livres()
+        # o remonta na mesma ordem (a das linhas), e o sorteio depende dessa ordem.
+        omitidos = ("_mascaras", "_mascaras_versao", "offsets_por_mascara", "_livres_versao", "__weakref__")
+        if self._livres_versao == self.versao:
+            omitidos += ("_livres",)
+        return {nome: getattr(self, nome) for nome in self.__slots__ if nome not in omitidos}
+
+    def __setstate__(self, estado):
+        self.__init__(estado["largura"], estado["altura"])
+        for nome, valor in estado.items():
+            setattr(self, nome, valor)
+
+    def copiar(self):
+        nova = Grade(self.largura, self.altura)
+        nova.celulas[:] = self.celulas
+        return nova
+
+
+class IndiceLivres:
+    """Conjunto de índices planos com inserção, remoção e sorteio uniforme em O(1).
+
+    `lista` guarda os índices em ordem arbitrária e `posicao[i]` a posição de i
+    na lista (-1 se ausente); a remoção troca o elemento pelo último.
+    """
+    __slots__ = ("lista", "posicao")
+
+    def __init__(self, tamanho, indices=()):
+        self.lista = array("i", indices)
+        self.posicao = array("i", [-1]) * tamanho
+        posicao = self.posicao
+        for k, i in enumerate(self.lista):
+            posicao[i] = k
+
+    def __len__(self):
+        return len(self.lista)
+
+    def __getstate__(self):
+        # `posicao` sai de `lista`; só a lista (com a sua ordem) é guardada
+        return (len(self.posicao), self.lista)
+
+    def __setstate__(self, estado):
+        tamanho, lista = estado
+        self.__init__(tamanho, lista)
+
+    def __contains__(self, i):
+        return self.posicao[i] >= 0
+
+    def adicionar(self, i):
+        if self.posicao[i] < 0:
+            self.posicao[i] = len(self.lista)
+            self.lista.append(i)
+
+    def remover(self, i):
+        k = self.posicao[i]
+        if k < 0:
+            return
+        ultimo = self.lista.pop()
+        if ultimo != i:
+            self.lista[k] = ultimo
+            self.posicao[ultimo] = k
+        self.posicao[i] = -1
+
+    def sortear(self, rng, excluir=()):
+        """Sorteia uniformemente um índice que não esteja em `excluir` (None se não houver)."""
+        lista = self.lista
+        n = len(lista)
+        if n <= len(excluir) and all(i in excluir for i in lista):
+            return None
+        while True:
+            i = lista[rng.randrange(n)]
+            if i not in excluir:
+                return i
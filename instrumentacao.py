@@ -0,0 +1,152 @@
+"""Instrumentação opcional dos caminhos quentes de uma partida.
+
+Uma Instrumentacao acumula, por rodada, o número de buscas (BFS e afins), os
+nós expandidos, o tempo de parede de cada fase (campo de distâncias,
+movimento do Minotauro, combate, movimento do Entrante, renderização) e a
+variação líquida de blocos de memória vivos (sys.getallocatedblocks). Essa
+variação é alocados menos liberados na rodada: não mede a taxa de alocação
+(uma rodada que aloca e libera muito aparece como ~0).
+
+É opcional: o Jogo só mede alguma coisa se for criado com instrumentar=True.
+Durante a rodada, a instrumentação do jogo fica em ATIVA, e toda busca se
+registra por registrar_busca (a única porta de entrada). Desligada, o custo é
+uma chamada a registrar_busca (com um teste `is not None`) por busca e um
+teste por fase.
+"""
+
+import sys
+import time
+from array import array
+
+FASES = ("campo", "minotauro", "combate", "entrante", "render")
+METRICAS = ("buscas", "nos", "blocos_liquidos") + tuple(f"tempo_{f}" for f in FASES)
+
+ATIVA = None  # Instrumentacao da rodada em andamento (None = desligada)
+
+
+def registrar_busca(tipo, nos):
+    """Conta uma busca de `tipo` que expandiu `nos` células (se houver instrumentação ativa)."""
+    if ATIVA is not None:
+        ATIVA.busca(tipo, nos)
+
+
+def histograma(valores):
+    """Contagens por faixa de potência de 2: [(inicio, fim, contagem), ...] com inicio <= v <= fim.
+
+    A primeira faixa é só o 0; as seguintes são 1, 2-3, 4-7, 8-15, ...
+    """
+    contagens = {}
+    for v in valores:
+        v = int(v)
+        faixa = v.bit_length() if v > 0 else 0
+        contagens[faixa] = contagens.get(faixa, 0) + 1
+    faixas = []
+    for faixa in sorted(contagens):
+        inicio = 0 if faixa == 0 else 1 << (faixa - 1)
+        fim = 0 if faixa == 0 else (1 << faixa) - 1
+        faixas.append((inicio, fim, contagens[faixa]))
+    return faixas
+
+
+class Instrumentacao:
+    """Contadores e cronômetros de uma partida, com uma série por rodada para cada métrica."""
+
+    def __init__(self):
+        self.rodadas = 0
+        self.por_tipo = {}  # tipo de busca -> [chamadas, nós expandidos]
+        self.series = {nome: array("d") for nome in METRICAS}
+        self._atual = dict.fromkeys(METRICAS, 0)
+        self._aberta = False
+        self._blocos = sys.getallocatedblocks()
+
+    # --- Coleta ---
+    def iniciar_rodada(self):
+        """Fecha a rodada anterior (se aberta) e começa a contar a próxima."""
+        if self._aberta:
+            self.fechar_rodada()
+        self._aberta = True
+        self._blocos = sys.getallocatedblocks()
+        return time.perf_counter()
+
+    def marcar(self, fase, inicio):
+        """Soma à fase o tempo desde `inicio`; retorna o instante atual (início da próxima fase)."""
+        agora = time.perf_counter()
+        self._atual["tempo_" + fase] += agora - inicio
+        return agora
+
+    def busca(self, tipo, nos):
+        contagem = self.por_tipo.get(tipo)
+        if contagem is None:
+            contagem = self.por_tipo[tipo] = [0, 0]
+        contagem[0] += 1
+        contagem[1] += nos
+        atual = self._atual
+        atual["buscas"] += 1
+        atual["nos"] += nos
+
+    def fechar_rodada(self):
+        if not self._aberta:
+            return
+        self._atual["blocos_liquidos"] = sys.getallocatedblocks() - self._blocos
+        for nome, valor in self._atual.items():
+            self.series[nome].append(valor)
+            self._atual[nome] = 0
+        self.rodadas += 1
+        self._aberta = False
+
+    # --- Consulta ---
+    def totais(self):
+        self.fechar_rodada()
+        return {nome: sum(serie) if nome.startswith("tempo_") else int(sum(serie))
+                for nome, serie in self.series.items()}
+
+    def histogramas(self):
+        """Histograma por rodada de cada métrica (tempos em microssegundos)."""
+        self.fechar_rodada()
+        resultado = {}
+        for nome, serie in self.series.items():
+            if nome.startswith("tempo_"):
+                resultado[nome + "_us"] = histograma(v * 1e6 for v in serie)
+            elif nome != "blocos_liquidos":
+                resultado[nome] = histograma(serie)
+        return resultado
+
+    def resumo(self):
+        """Totais, buscas por tipo e histogramas por rodada, num dict serializável em JSON."""
+        totais = self.totais()
+        return {
+            "rodadas": self.rodadas,
+            "totais": totais,
+            "por_tipo": {tipo: {"chamadas": c, "nos": n} for tipo, (c, n) in sorted(self.por_tipo.items())},
+            "histogramas": {nome: [list(f) for f in faixas] for nome, faixas in self.histogramas().items()},
+        }
+
+    def escrever_texto(self, f):
+        """Seção de instrumentação do relatório em texto."""
+        totais = self.totais()
+        rodadas = max(self.rodadas, 1)
+        f.write("======== INSTRUMENTAÇÃO ========\n")
+        f.write(f"Rodadas medidas: {self.rodadas}\n")
+        buscas, nos = totais["buscas"], totais["nos"]
+        f.write(f"Buscas: {buscas} ({buscas / rodadas:.2f} por rodada) | "
+                f"Nós expandidos: {nos} ({nos / max(buscas, 1):.1f} por busca)\n")
+        for tipo, (chamadas, n) in sorted(self.por_tipo.items()):
+            f.write(f" - {tipo}: {chamadas} chamadas, {n} nós\n")
+
+        tempo_total = sum(totais[f"tempo_{fase}"] for fase in FASES)
+        f.write("Tempo por fase (total | média por rodada | fração):\n")
+        for fase in FASES:
+            t = totais[f"tempo_{fase}"]
+            fracao = t / tempo_total if tempo_total else 0.0
+            f.write(f" - {fase}: {t * 1e3:.2f} ms | {t / rodadas * 1e6:.1f} µs | {fracao:.1%}\n")
+        liquidos = totais["blocos_liquidos"]
+        f.write(f"Blocos de memória vivos (variação líquida, não é taxa de alocação): {liquidos} "
+                f"({liquidos / rodadas:.1f} por rodada)\n")
+
+        f.write("Histogramas por rodada (faixa: rodadas):\n")
+        for nome, faixas in self.histogramas().items():
+            if not any(fim for _, fim, _ in faixas):
+                continue
+            texto = " | ".join((f"{a}" if a == b else f"{a}-{b}") + f": {c}" for a, b, c in faixas)
+            f.write(f" - {nome}: {texto}\n")
+        f.write("================================\n")
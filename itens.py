@@ -0,0 +1,97 @@
+"""Camada de itens separada da grade: índice plano -> código do item.
+
+A Grade guarda só paredes e caminhos; os itens ficam numa CamadaItens, com
+consulta, inclusão e remoção em O(1) (um dict por índice plano). Coletar um
+item não altera a grade, então várias distribuições de itens podem ser usadas
+sobre o mesmo labirinto sem copiá-lo.
+
+Para consultas por região, os itens também ficam em baldes de LADO_BALDE x
+LADO_BALDE células. `na_regiao` percorre só os baldes que tocam o retângulo, e
+`ao_alcance(origem, k)` (itens a até k passos) usa os baldes para achar os
+candidatos a distância de Manhattan <= k e só então faz uma BFS limitada a k,
+e só se houver algum candidato.
+
+Os códigos são os de labirinto.CODIGO_ITEM (a partir de grade.COD_ITEM_BASE).
+"""
+
+from caminhos import bfs_limitada
+
+LADO_BALDE = 8
+
+
+class CamadaItens:
+    """Itens de um labirinto, indexados por índice plano da grade e por balde espacial."""
+    __slots__ = ("grade", "lado", "codigos", "_baldes")
+
+    def __init__(self, grade, itens=(), lado=LADO_BALDE):
+        self.grade = grade
+        self.lado = lado
+        self.codigos = {}   # índice plano -> código
+        self._baldes = {}   # (bx, by) -> set de índices planos
+        for i, codigo in itens:
+            self.adicionar(i, codigo)
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __contains__(self, i):
+        return i in self.codigos
+
+    def __iter__(self):
+        """Pares (índice plano, código)."""
+        return iter(self.codigos.items())
+
+    def _balde(self, i):
+        x, y = self.grade.coord(i)
+        return (x // self.lado, y // self.lado)
+
+    def obter(self, i):
+        """Código do item em i (None se não houver)."""
+        return self.codigos.get(i)
+
+    def adicionar(self, i, codigo):
+        if i not in self.codigos:
+            self._baldes.setdefault(self._balde(i), set()).add(i)
+        self.codigos[i] = codigo
+
+    def remover(self, i):
+        """Remove e retorna o código do item em i (None se não houver)."""
+        codigo = self.codigos.pop(i, None)
+        if codigo is not None:
+            balde = self._balde(i)
+            membros = self._baldes[balde]
+            membros.discard(i)
+            if not membros:
+                del self._baldes[balde]
+        return codigo
+
+    def copiar(self):
+        """Cópia independente (mesma grade, mesmos itens)."""
+        return CamadaItens(self.grade, self.codigos.items(), self.lado)
+
+    def na_regiao(self, x0, y0, x1, y1):
+        """Itens com x0 <= x <= x1 e y0 <= y <= y1, como [(índice plano, código)]."""
+        lado = self.lado
+        coord = self.grade.coord
+        resultado = []
+        for by in range(y0 // lado, y1 // lado + 1):
+            for bx in range(x0 // lado, x1 // lado + 1):
+                for i in self._baldes.get((bx, by), ()):
+                    x, y = coord(i)
+                    if x0 <= x <= x1 and y0 <= y <= y1:
+                        resultado.append((i, self.codigos[i]))
+        return resultado
+
+    def ao_alcance(self, origem, k):
+        """Itens a até k passos (pelo labirinto) do índice `origem`, como [(distância, índice, código)] em ordem."""
+        ox, oy = self.grade.coord(origem)
+        coord = self.grade.coord
+        candidatos = []
+        for i, codigo in self.na_regiao(ox - k, oy - k, ox + k, oy + k):
+            x, y = coord(i)
+            if abs(x - ox) + abs(y - oy) <= k:
+                candidatos.append((i, codigo))
+        if not candidatos:
+            return []
+        dist = bfs_limitada(origem, self.grade, k)
+        return sorted((dist[i], i, codigo) for i, codigo in candidatos if i in dist)
@@ -1,632 +1,1065 @@
-"""Labirinto com Entrante (DFS) e Minotauro (BFS) - Lógica de Movimento Restaurada e Otimizada."""
-
-import random
-import os 
-import math
-from collections import deque
-import time
-from heapq import heappush, heappop
-
-# --- Configurações ---
-LARGURA = 31
-ALTURA = 31
-PAREDE = "🔳"
-CAMINHO = "⬜"
-JOGADOR = "🏃"
-MINOTAURO = "🐂"
-ENTRADA = "🟩"
-SAIDA = "❎"
-
-PERCEPCAO = 5  # p(G): distância (em arestas) para o Minotauro detectar o entrante
-
-ITENS_ATIVOS = True
-
-# Consumíveis: energia
-CONSUMIVEIS = {
-    "🟥": 10,
-    "🟠": 25,
-    "🔴": 50
-}
-
-# Armas (força)
-ARMAS = {
-    "🟧": 10,
-    "🟨": 25,
-    "🔥": 50
-}
-
-# Armaduras (defesa)
-ARMADURAS = {
-    "🟦": 10,
-    "🔵": 50
-}
-
-# --- Gera labirinto ---
-def gerar_labirinto(largura, altura):
-    """Gera um labirinto usando o algoritmo de Prim modificado com um centro livre."""
-    # --- Inicializa matriz com paredes ---
-    matriz = [[PAREDE for _ in range(largura)] for _ in range(altura)]
-    visitado = [[False for _ in range(largura)] for _ in range(altura)]
-
-    start_x, start_y = 1, 1
-    matriz[start_y][start_x] = CAMINHO
-    visitado[start_y][start_x] = True
-
-    # Inicializa as paredes a partir dos vizinhos da entrada
-    paredes = []
-    for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        nx, ny = start_x+dx, start_y+dy
-        if 0 <= nx < largura and 0 <= ny < altura:
-            if not visitado[ny][nx]:
-                paredes.append((nx, ny))
-
-
-    # --- Loop do Prim ---
-    while paredes:
-        idx = random.randrange(len(paredes))
-        x, y = paredes[idx]
-
-        vizinhos_conectados = []
-        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < largura and 0 <= ny < altura and visitado[ny][nx]:
-                vizinhos_conectados.append((nx, ny))
-
-        if vizinhos_conectados:
-            nx, ny = random.choice(vizinhos_conectados)
-
-            px, py = (x+nx)//2, (y+ny)//2
-            matriz[py][px] = CAMINHO
-
-            matriz[y][x] = CAMINHO
-            visitado[y][x] = True
-
-            for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                nnx, nny = x+dx, y+dy
-                if 0 <= nnx < largura and 0 <= nny < altura and not visitado[nny][nnx] and (nnx, nny) not in paredes:
-                    paredes.append((nnx, nny))
-
-        paredes.pop(idx)
-
-    # --- Cria centro livre  ---
-    cx, cy = largura // 2, altura // 2
-    total = largura * altura
-    area_livre = math.ceil(total * 0.05)
-    raio = int(math.sqrt(area_livre / math.pi))
-
-    for y in range(cy - raio, cy + raio + 1):
-        for x in range(cx - raio, cx + raio + 1):
-            if 0 <= x < largura and 0 <= y < altura:
-                if (x - cx) ** 2 + (y - cy) ** 2 <= raio ** 2:
-                    matriz[y][x] = CAMINHO
-
-    matriz[altura-2][largura-2] = CAMINHO
-
-    return matriz
-
-def espalhar_itens(matriz, quantidade=20):
-    """Espalha itens aleatórios no labirinto se ITENS_ATIVOS for True."""
-    if not ITENS_ATIVOS:
-        return
-
-    altura = len(matriz)
-    largura = len(matriz[0])
-    # Incluindo os novos símbolos para CONSUMIVEIS, ARMAS e ARMADURAS
-    itens = list(CONSUMIVEIS.keys()) * 1 + list(ARMAS.keys()) + list(ARMADURAS.keys())
-
-    espalhados = 0
-    tentativas = 0
-    while espalhados < quantidade and tentativas < quantidade * 10:
-        tentativas += 1
-        x = random.randint(1, largura-2)
-        y = random.randint(1, altura-2)
-
-        # Evita colocar item na entrada e na saída
-        if matriz[y][x] == CAMINHO and (x, y) != (1, 1) and (x, y) != (largura-2, altura-2):
-            matriz[y][x] = random.choice(itens)
-            espalhados += 1
-
-# --- utilidades de grid ---
-def vizinhos_livres(pos, matriz):
-    """Gera vizinhos livres (não parede) de uma posição (x,y) na matriz."""
-    x, y = pos
-    for dx, dy in [(0,1),(0,-1),(1,0),(-1,0)]:
-        nx, ny = x+dx, y+dy
-        if 0 <= nx < len(matriz[0]) and 0 <= ny < len(matriz):
-            if matriz[ny][nx] != PAREDE:
-                yield (nx, ny)
-
-def caminho_minimo(origem, destino, matriz):
-    """BFS retorna lista de vértices do caminho (inclui origem e destino)"""
-    if origem == destino:
-        return [origem]
-    fila = deque([origem])
-    pai = {origem: None}
-
-    altura = len(matriz)
-    largura = len(matriz[0])
-
-    while fila:
-        atual = fila.popleft()
-        for dx, dy in [(0,1),(0,-1),(1,0),(-1,0)]:
-            nb = (atual[0]+dx, atual[1]+dy)
-            nx, ny = nb
-
-            celula = matriz[ny][nx]
-            is_path = celula != PAREDE
-
-            if 0 <= nx < largura and 0 <= ny < altura and is_path and nb not in pai:
-                pai[nb] = atual
-                if nb == destino:
-                    path = [nb]
-                    p = pai[nb]
-                    while p is not None:
-                        path.append(p)
-                        p = pai[p]
-                    path.reverse()
-                    return path
-                fila.append(nb)
-    return []
-
-def distancia_minima(origem, destino, matriz):
-    """Distância em número de arestas pelo caminho mínimo."""
-    path = caminho_minimo(origem, destino, matriz)
-    return len(path)-1 if path else float('inf')
-
-# --- Entrante (DFS com “novelo de lã”) ---
-class Entrante:
-    """Classe que representa o Entrante (jogador) no labirinto."""
-    def __init__(self, inicio, saida, matriz, energia_max=500):
-        self.pos = inicio
-        self.saida = saida
-        self.matriz = matriz
-        self.visitado = set([inicio])
-        self.trilha = [] # Pilha para DFS
-        self.energia_max = energia_max
-        self.energia = energia_max
-        self.morto = False
-
-        # Campos de Relatório
-        self.trilha_final = [inicio]
-
-        # Equipamentos (usados se ITENS_ATIVOS for True)
-        self.arma = None
-        self.armadura = None
-
-        # Posição anterior para fins de rastro
-        self.pos_anterior = inicio
-
-    def coletar_item(self, item):
-        """Coleta e aplica o efeito do item (se ITENS_ATIVOS for True)."""
-        if not ITENS_ATIVOS:
-            return
-
-        # Consumível
-        if item in CONSUMIVEIS:
-            self.energia = min(self.energia_max, self.energia + CONSUMIVEIS[item])
-        # Arma
-        elif item in ARMAS:
-            self.arma = item
-        # Armadura
-        elif item in ARMADURAS:
-            self.armadura = item
-
-    def bonus_combate_total(self):
-        """Calcula a chance de vitória/sobrevivência baseada nos equipamentos."""
-        if not ITENS_ATIVOS:
-            return 0.0
-
-        chance = 0
-        if self.arma:
-            chance += ARMAS[self.arma]
-        if self.armadura:
-            chance += ARMADURAS[self.armadura]
-        return chance / 100
-
-    def passo(self):
-        """Faz um passo no labirinto usando DFS com trilha (novelo de lã)."""
-        if self.energia <= 0:
-            return self.pos, False, True
-
-        if self.morto:
-            return self.pos, False, False
-
-        self.energia -= 1
-
-        # 1. Restaura visualmente a célula anterior
-        if self.pos_anterior != self.pos:
-
-            if self.pos_anterior == (1, 1): # Entrada
-                self.matriz[self.pos_anterior[1]][self.pos_anterior[0]] = ENTRADA
-            elif self.pos_anterior == self.saida: # Saída
-                self.matriz[self.pos_anterior[1]][self.pos_anterior[0]] = SAIDA
-            else:
-                self.matriz[self.pos_anterior[1]][self.pos_anterior[0]] = CAMINHO
-
-        self.pos_anterior = self.pos
-
-        if self.pos == self.saida:
-            return self.pos, True, False
-
-        vizs = list(vizinhos_livres(self.pos, self.matriz))
-        random.shuffle(vizs)
-
-        # 2. Tenta avançar (DFS)
-        for nb in vizs:
-            if nb not in self.visitado:
-                # Movimento
-                self.trilha.append(self.pos)
-                self.pos = nb
-                self.visitado.add(self.pos)
-
-                # REGISTRO: Adiciona o novo vértice à trilha final
-                self.trilha_final.append(self.pos)
-
-                # Coleta item se houver
-                if ITENS_ATIVOS:
-                    celula = self.matriz[self.pos[1]][self.pos[0]]
-                    if celula in CONSUMIVEIS or celula in ARMAS or celula in ARMADURAS:
-                        self.coletar_item(celula)
-                        self.matriz[self.pos[1]][self.pos[0]] = CAMINHO
-
-                return self.pos, (self.pos == self.saida), False
-
-        # 3. Backtrack
-        if self.trilha:
-            self.pos = self.trilha.pop()
-
-            # REGISTRO: Adiciona o vértice de retorno à trilha final
-            self.trilha_final.append(self.pos)
-
-        return self.pos, (self.pos == self.saida), False
-
-    def mostrar_energia(self):
-        """Retorna uma string representando o status atual do Entrante."""
-        base_status = f"--- 🏃 Entrante | 🍗 Energia: {self.energia}/{self.energia_max}"
-
-        if ITENS_ATIVOS:
-            arma = self.arma if self.arma else "Nenhuma"
-            armadura = self.armadura if self.armadura else "Nenhuma"
-            return f"{base_status} | Arma: {arma} | Armadura: {armadura} ---"
-        else:
-            return f"{base_status} | ITENS: DESATIVADOS ---"
-
-
-# --- Minotauro (dois modos) ---
-class Minotauro:
-    """Classe que representa o Minotauro no labirinto."""
-    def __init__(self, inicio):
-        self.pos = inicio
-        self.centro = inicio
-        self.perseguindo = False
-        self.ultimo = inicio
-        self.passos_patrulha = 0
-        self.passos_max = 15
-        self.destino = None
-        self.escondido = False
-
-        # Campos de Estado da Patrulha Anterior
-        self.voltando = False
-        self.memoria = []
-        self.memoria_max = 20
-
-        # Campos de Relatório
-        self.detectado_em = None
-        self.alcancado_em = None
-        self.caminho_perseguicao = []
-        self.ultima_perseg_pos = inicio
-
-    def _encontrar_destino_aleatorio(self, matriz):
-        """Função auxiliar para escolher um ponto aleatório livre no mapa."""
-
-        largura, altura = len(matriz[0]), len(matriz)
-        livres = [(x, y) for y in range(altura) for x in range(largura) if matriz[y][x] != PAREDE and (x, y) != self.pos and (x, y) != self.centro]
-
-        if not livres:
-            return self.centro
-
-        return random.choice(livres)
-
-
-    def passo(self, alvo, matriz, percepcao, rodada_atual):
-        """Faz um passo no labirinto baseado na lógica de perseguição/patrulha."""
-
-        if self.escondido:
-            return self.pos
-
-        dist = distancia_minima(self.pos, alvo, matriz)
-        perseg_anterior = self.perseguindo
-
-        self.perseguindo = dist <= percepcao
-
-        # Lógica de registro de detecção
-        if self.perseguindo and not perseg_anterior and dist > 0:
-            if self.detectado_em is None:
-                self.detectado_em = rodada_atual
-
-        # === MODO PERSEGUIÇÃO: Movimento de 2 em 2 (Ajustado) ===
-        if self.perseguindo and dist > 0 and dist < float('inf'):
-            path = caminho_minimo(self.pos, alvo, matriz)
-
-            if len(path) >= 3:
-                proxima_pos = path[2] 
-            elif len(path) == 2:
-
-                proxima_pos = path[1]
-            else:
-                proxima_pos = None
-
-            if proxima_pos:
-                self.ultimo = self.pos
-                self.pos = proxima_pos
-
-                # REGISTRO: Adiciona a posição à trilha de perseguição
-                if self.ultima_perseg_pos != self.pos:
-                    self.caminho_perseguicao.append(self.pos)
-                    self.ultima_perseg_pos = self.pos
-        
-        # === MODO PATRULHA: Original com BFS (Otimizado) ===
-        else:
-            contador = 0
-            if self.destino is None or self.pos == self.destino:
-                if not self.voltando:
-                    # escolhe ponto aleatório
-                    self.destino = self._encontrar_destino_aleatorio(matriz)
-                    contador += 1
-                    if contador > 10:
-                        self.voltando = True
-                else:
-                    # volta ao centro
-                    self.destino = self.centro
-                    self.voltando = False
-
-
-            path = caminho_minimo(self.pos, self.destino, matriz)
-
-            if len(path) >= 2:
-                proxima_pos = path[1]
-
-                self.ultimo = self.pos
-                self.pos = proxima_pos
-                self.passos_patrulha += 1
-                self.memoria.append(self.pos)
-
-                if len(self.memoria) > self.memoria_max:
-                    self.memoria.pop(0)
-
-            if self.passos_patrulha >= self.passos_max:
-                self.passos_patrulha = 0
-                self.destino = None
-
-        return self.pos
-
-# --- Renderização ---
-def imprimir(matriz, entrante_pos, minotauro_pos, minotauro: Minotauro=None):
-    largura_celula = 1
-    for y in range(len(matriz)):
-        linha = ""
-        for x in range(len(matriz[0])):
-
-            celula = matriz[y][x]
-            is_explosion = False
-            if (x, y) == entrante_pos and entrante.morto:
-                celula = "💥"
-                is_explosion = True
-
-            if (x, y) == entrante_pos and not is_explosion:
-                celula = JOGADOR
-            elif (x, y) == minotauro_pos and not minotauro.escondido:
-                celula = MINOTAURO
-
-            elif (x, y) == (1, 1):
-                celula = ENTRADA
-            elif (x, y) == (len(matriz[0])-2, len(matriz)-2):
-                celula = SAIDA
-
-            linha += f"{celula:<{largura_celula}}"
-        print(linha)
-
-
-# --- Regras de encontro ---
-def resolver_encontro():
-    """Resolve o encontro entre Entrante e Minotauro. Retorna True se o Entrante sobrevive."""
-    # 1. Chance base
-    chance = 0.01
-
-    if ITENS_ATIVOS:
-        # 2. Adiciona bônus de equipamentos se existirem
-        bonus_equipamento = entrante.bonus_combate_total()
-        chance += bonus_equipamento
-
-    # 3. Garante que não ultrapasse 99%
-    chance = min(chance, 0.99)
-
-    return random.random() < chance
-
-# Função para checar se o Minotauro está adjacente ou sobre o Entrante
-def checar_combate_imediato(minotauro_pos, entrante_pos, matriz):
-    """Checa se o Minotauro está na mesma posição ou adjacente ao Entrante."""
-    if minotauro_pos == entrante_pos:
-        return True
-    dist = distancia_minima(minotauro_pos, entrante_pos, matriz)
-    return dist == 1
-
-# --- Geração de Relatório ---
-def gerar_relatorio(jogador: Entrante, minotauro: Minotauro, status_final: str):
-    """Gera um relatório final do jogo e salva em 'relatorio.txt'."""
-    # global ITENS_ATIVOS
-
-    report = "======== RELATÓRIO DO LABIRINTO (MINOTAURO) ========\n"
-    report += f"STATUS FINAL: {status_final}\n"
-    report += f"Rodada final: {minotauro.alcancado_em if minotauro.alcancado_em else 'N/A'}\n"
-    report += "----------------------------------------------------\n"
-
-    # Tempo restante de comida
-    report += f"TEMPO RESTANTE DE ENERGIA (Comida): {jogador.energia} passos (Inteiros)\n"
-
-    if ITENS_ATIVOS:
-        report += f"Arma do Entrante: {jogador.arma if jogador.arma else 'Nenhuma'}\n"
-        report += f"Armadura do Entrante: {jogador.armadura if jogador.armadura else 'Nenhuma'}\n"
-    else:
-        report += "[INFO] A coleta, uso e rastreamento de Itens/Equipamentos estão DESATIVADOS.\n"
-
-    report += "----------------------------------------------------\n"
-    trilha = jogador.trilha_final
-    # Sequência de vértices do prisioneiro (Entrante)
-    report += f"SEQUÊNCIA DE VÉRTICES VISITADOS PELO PRISIONEIRO ({len(jogador.trilha_final)} vértices):\n"
-    report += "-> ["
-    for i, vertice in enumerate(trilha):
-        report += str(vertice)
-
-        if i < len(trilha) - 1:
-            report += ", "
-        if (i + 1) % 8 == 0 and i < len(trilha) - 1:
-            report += "\n   "
-
-    report += "]\n"
-    report += "----------------------------------------------------\n"
-
-    # Detecção e Perseguição
-    report += "RASTREAMENTO DO MINOTAURO:\n"
-
-    if minotauro.detectado_em:
-        report += f" - Detecção do Prisioneiro: Rodada {minotauro.detectado_em}\n"
-    else:
-        report += " - O prisioneiro não foi detectado pelo Minotauro.\n"
-
-    if minotauro.alcancado_em:
-        report += f" - Encontro (Alcançado): Rodada {minotauro.alcancado_em}\n"
-    else:
-        report += " - O encontro não ocorreu.\n"
-
-    if minotauro.caminho_perseguicao:
-        report += " - Caminho Percorrido pelo Minotauro (durante a perseguição):\n"
-        report += str(minotauro.caminho_perseguicao) + "\n"
-    else:
-        report += " - Nenhuma perseguição significativa ocorreu ou foi registrada.\n"
-
-    report += "====================================================\n"
-
-    with open("relatorio.txt", "w", encoding="utf-8") as f:
-        f.write(report)
-
-    print("\n[INFO] Relatório salvo em 'relatorio.txt'")
-
-
-# --- Principal ---
-def main():
-    """Função principal que executa o jogo do labirinto."""
-    global entrante
-
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-    entrada = (1, 1)
-    saida = (LARGURA-2, ALTURA-2)
-
-    lab = gerar_labirinto(LARGURA, ALTURA)
-
-    espalhar_itens(lab, quantidade=30)
-    lab[entrada[1]][entrada[0]] = ENTRADA
-    lab[saida[1]][saida[0]] = SAIDA
-
-
-    # Encontra ponto de spawn do Minotauro
-    cx, cy = len(lab[0])//2, len(lab)//2
-    mino_start = None
-    if lab[cy][cx] == PAREDE:
-        pq = []
-        seen = set()
-        heappush(pq, (0, (cx, cy)))
-        while pq:
-            _, (x, y) = heappop(pq)
-            if (x, y) in seen:
-                continue
-            seen.add((x, y))
-            if lab[y][x] != PAREDE:
-                mino_start = (x, y)
-                break
-            for nx, ny in [(x+1,y),(x-1,y),(x,y+1),(x,y-1)]:
-                if 0 <= nx < len(lab[0]) and 0 <= ny < len(lab):
-                    heappush(pq, (abs(nx-cx)+abs(ny-cy), (nx, ny)))
-    else:
-        mino_start = (cx, cy)
-
-    if mino_start is None:
-        mino_start = (LARGURA-2, ALTURA-2)
-
-
-    entrante = Entrante(entrada, saida, lab)
-    minotauro = Minotauro(mino_start)
-    minotauro.centro = mino_start
-
-    time.sleep(1.0)
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-    rodada = 0
-    status_final = "INCOMPLETO"
-
-    while True:
-
-        rodada += 1
-
-        # 1. MINOTAURO SE MOVE
-        mpos = minotauro.passo(entrante.pos, lab, PERCEPCAO, rodada)
-
-        # 2. VERIFICAÇÃO DE COMBATE E RESOLUÇÃO
-        if checar_combate_imediato(mpos, entrante.pos, lab):
-
-            minotauro.alcancado_em = rodada
-            sobreviveu = resolver_encontro()
-
-            if not sobreviveu:
-                print(f"\n💀 O Minotauro eliminou o prisioneiro na Rodada {rodada}!")
-                entrante.morto = True
-                status_final = "MORREU PELO MINOTAURO"
-            else:
-                print(f"\n⚔️ Batalha! O prisioneiro sobreviveu na Rodada {rodada} e continua sua jornada.")
-
-            minotauro.escondido = True
-
-            if entrante.morto:
-                break
-
-
-        # 3. ENTRANTE SE MOVE (Se não estiver morto)
-        epos, salvou, morreu_fome = entrante.passo()
-
-        # 4. LIMPEZA E RENDERIZAÇÃO
-        os.system('cls' if os.name == 'nt' else 'clear')
-        imprimir(lab, epos, mpos, minotauro)
-
-        destino_str = minotauro.destino if minotauro.destino else "Nenhum"
-        estado_mino = '🐂 PERSEGUINDO 🏃' if minotauro.perseguindo and not minotauro.escondido else ('Patrulha para ' + str(destino_str) if not minotauro.escondido else "Desativado")
-
-        print(f"\nRodada {rodada} | Estado do Minotauro: {estado_mino} | Percepção (Distância): {PERCEPCAO}")
-        print(entrante.mostrar_energia())
-
-        # 5. CONDIÇÕES DE FIM DE JOGO
-        if morreu_fome:
-            print("\n💀 O prisioneiro não aguentou mais andar. Morreu de fome!")
-            status_final = "MORREU DE FOME"
-            minotauro.alcancado_em = rodada
-            break
-
-        if salvou:
-            print("\n🎉 O prisioneiro encontrou a saída!")
-            status_final = "ESCAPOU"
-            minotauro.alcancado_em = rodada
-            break
-
-        time.sleep(0.05)
-
-    # RENDERIZAÇÃO FINAL
-    os.system('cls' if os.name == 'nt' else 'clear')
-    imprimir(lab, entrante.pos, minotauro.pos, minotauro)
-    print(f"\n--- FIM DE JOGO: {status_final} na Rodada {rodada} ---")
-
-    # GERAÇÃO FINAL DO RELATÓRIO
-    gerar_relatorio(entrante, minotauro, status_final)
-
-
-if __name__ == "__main__":
-    main()
+"""Labirinto com Entrante (DFS) e Minotauro (BFS) - Lógica de Movimento Restaurada e Otimizada."""
+
+import random
+import csv
+import json
+import io
+import pickle
+import zlib
+from collections import deque
+from heapq import heappush, heappop
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from grade import Grade, COD_PAREDE, COD_CAMINHO, COD_ITEM_BASE, centro_livre, celulas_do_disco
+from caminhos import buscar, bfs_limitada, bfs_multiorigem, oraculo_para
+from trilhas import TrilhaMovimentos, TrilhaIndices, MapaVisitados
+from itens import CamadaItens
+import instrumentacao
+from instrumentacao import Instrumentacao
+
+# --- Configurações ---
+LARGURA = 31
+ALTURA = 31
+PAREDE = "🔳"
+CAMINHO = "⬜"
+JOGADOR = "🏃"
+MINOTAURO = "🐂"
+ENTRADA = "🟩"
+SAIDA = "❎"
+
+PERCEPCAO = 5  # p(G): distância (em arestas) para o Minotauro detectar o entrante
+
+ESTRATEGIA_CAMINHO = "bfs"  # busca usada por caminho_minimo: "bfs", "bidirecional", "astar", "alt" ou "arvore"
+
+ITENS_ATIVOS = True
+
+# Consumíveis: energia
+CONSUMIVEIS = {
+    "🟥": 10,
+    "🟠": 25,
+    "🔴": 50
+}
+
+# Armas (força)
+ARMAS = {
+    "🟧": 10,
+    "🟨": 25,
+    "🔥": 50
+}
+
+# Armaduras (defesa)
+ARMADURAS = {
+    "🟦": 10,
+    "🔵": 50
+}
+
+# Itens: código (na CamadaItens, ver itens.py) -> símbolo (o símbolo só é usado na renderização e no estado do Entrante)
+ITENS = list(CONSUMIVEIS) + list(ARMAS) + list(ARMADURAS)
+CODIGO_ITEM = {item: COD_ITEM_BASE + k for k, item in enumerate(ITENS)}
+ITEM_POR_CODIGO = {cod: item for item, cod in CODIGO_ITEM.items()}
+GLIFOS = [PAREDE, CAMINHO] + ITENS
+
+# Versão da geração (gerar_labirinto + espalhar_itens): incremente sempre que a
+# mesma semente passar a produzir outro labirinto (invalida o corpus em disco, ver corpus.py)
+VERSAO_GERADOR = 1
+
+# --- Gera labirinto ---
+# Eventos de passos_geracao: (tipo, x, y)
+EVENTO_FRONTEIRA = "fronteira"  # célula da fronteira sorteada (com ou sem vizinho já no labirinto)
+EVENTO_CAVAR = "cavar"          # célula que vira caminho (a passagem e depois a célula nova)
+EVENTO_CENTRO = "centro"        # célula aberta pelo disco livre do centro
+EVENTO_SAIDA = "saida"          # saída garantida como caminho
+
+
+def passos_geracao(largura, altura, rng=random, eventos=True):
+    """Gera um labirinto usando o algoritmo de Prim modificado com um centro livre, passo a passo.
+
+    Com eventos=True, produz (yield) um evento (tipo, x, y) a cada passo (ver
+    EVENTO_*); com eventos=False não produz nenhum e roda direto. Em ambos os
+    casos, a Grade pronta é o valor de retorno do gerador (StopIteration.value,
+    ou o resultado de `yield from`). Os sorteios são os mesmos nos dois modos.
+    """
+    # --- Inicializa grade com paredes ---
+    grade = Grade(largura, altura)
+    celulas = grade.celulas
+
+    # Área de trabalho do Prim com margem de 2 células, para que os saltos de 2
+    # nunca saiam do buffer e dispensem checagem de limites.
+    # Estados: 0 = parede, 1 = caminho, 2 = na fronteira, 3 = fora do labirinto
+    passo = largura + 4
+    trabalho = bytearray([3]) * (passo * (altura + 4))
+    for y in range(altura):
+        inicio = (y + 2) * passo + 2
+        trabalho[inicio:inicio + largura] = bytes(largura)
+
+    saltos = (-2, 2, -2*passo, 2*passo)
+
+    def xy(c):
+        y, x = divmod(c, passo)
+        return x - 2, y - 2
+
+    # Fronteira: lista para sorteio O(1); a pertinência é o estado 2 na área de
+    # trabalho, e a remoção troca o sorteado pelo último elemento (também O(1)).
+    fronteira = []
+
+    start_x, start_y = 1, 1
+    c = (start_y + 2) * passo + start_x + 2
+    trabalho[c] = 1
+    if eventos:
+        yield (EVENTO_CAVAR, start_x, start_y)
+
+    # Inicializa a fronteira a partir dos vizinhos da entrada
+    for d in saltos:
+        if trabalho[c+d] == 0:
+            fronteira.append(c+d)
+            trabalho[c+d] = 2
+
+    # --- Loop do Prim ---
+    while fronteira:
+        k = rng.randrange(len(fronteira))
+        c = fronteira[k]
+        fronteira[k] = fronteira[-1]
+        fronteira.pop()
+        if eventos:
+            yield (EVENTO_FRONTEIRA, *xy(c))
+
+        vizinhos_conectados = [c+d for d in saltos if trabalho[c+d] == 1]
+
+        if vizinhos_conectados:
+            n = rng.choice(vizinhos_conectados)
+
+            trabalho[(c+n)//2] = 1
+            trabalho[c] = 1
+            if eventos:
+                yield (EVENTO_CAVAR, *xy((c+n)//2))
+                yield (EVENTO_CAVAR, *xy(c))
+
+            for d in saltos:
+                if trabalho[c+d] == 0:
+                    fronteira.append(c+d)
+                    trabalho[c+d] = 2
+
+    # Copia a área de trabalho para a grade (0 -> parede, 1 -> caminho)
+    tabela = bytes([COD_PAREDE, COD_CAMINHO, COD_PAREDE, COD_PAREDE]) + bytes(252)
+    for y in range(altura):
+        origem = (y + 2) * passo + 2
+        destino = grade.indice(0, y)
+        celulas[destino:destino + largura] = trabalho[origem:origem + largura].translate(tabela)
+
+    # --- Cria centro livre  ---
+    for x, y in celulas_do_disco(largura, altura, *centro_livre(largura, altura)):
+        celulas[grade.indice(x, y)] = COD_CAMINHO
+        if eventos:
+            yield (EVENTO_CENTRO, x, y)
+
+    grade.definir(largura-2, altura-2, COD_CAMINHO)
+    if eventos:
+        yield (EVENTO_SAIDA, largura-2, altura-2)
+
+    return grade
+
+
+def gerar_labirinto(largura, altura, rng=random):
+    """Gera um labirinto usando o algoritmo de Prim modificado com um centro livre.
+
+    rng: fonte de aleatoriedade (módulo random ou uma instância random.Random).
+    Retorna uma Grade (ver grade.py). É passos_geracao sem eventos.
+    """
+    try:
+        next(passos_geracao(largura, altura, rng, eventos=False))
+    except StopIteration as fim:
+        return fim.value
+    raise RuntimeError("passos_geracao produziu eventos com eventos=False")
+
+def espalhar_itens(matriz, quantidade=20, rng=random):
+    """Sorteia itens em células livres do labirinto (se ITENS_ATIVOS for True).
+
+    A grade não é alterada: os itens vão numa CamadaItens nova (ver itens.py),
+    que é retornada (vazia se os itens estiverem desativados).
+    """
+    camada = CamadaItens(matriz)
+    if not ITENS_ATIVOS:
+        return camada
+
+    altura = matriz.altura
+    largura = matriz.largura
+    # Incluindo os novos símbolos para CONSUMIVEIS, ARMAS e ARMADURAS
+    itens = list(CONSUMIVEIS.keys()) * 1 + list(ARMAS.keys()) + list(ARMADURAS.keys())
+
+    # Sorteia células livres sem reposição pelo índice de células livres: cada
+    # célula sai no máximo uma vez (nunca dois itens na mesma), então só para
+    # quando acabam as candidatas.
+    livres = matriz.livres()
+    excluir = {matriz.indice(1, 1), matriz.indice(largura-2, altura-2)}
+
+    espalhados = 0
+    while espalhados < quantidade:
+        i = livres.sortear(rng, excluir)
+        if i is None:
+            break
+        excluir.add(i)
+        camada.adicionar(i, CODIGO_ITEM[rng.choice(itens)])
+        espalhados += 1
+    return camada
+
+# --- utilidades de grid ---
+def vizinhos_livres(pos, matriz):
+    """Gera vizinhos livres (não parede) de uma posição (x,y) na matriz."""
+    coord = matriz.coord
+    for j in matriz.vizinhos(matriz.indice(*pos)):
+        yield coord(j)
+
+def caminho_minimo(origem, destino, matriz, estrategia=None):
+    """Retorna lista de vértices do caminho mínimo (inclui origem e destino).
+
+    estrategia: "bfs", "bidirecional", "astar", "alt" ou "arvore" (ver caminhos.py);
+    todas devolvem o mesmo caminho. None usa ESTRATEGIA_CAMINHO.
+    """
+    if origem == destino:
+        return [origem]
+    path, _ = buscar(matriz.indice(*origem), matriz.indice(*destino), matriz,
+                     estrategia or ESTRATEGIA_CAMINHO)
+    coord = matriz.coord
+    return [coord(i) for i in path]
+
+def distancia_limitada(origem, destino, matriz, raio):
+    """Distância entre origem e destino se for no máximo `raio`; senão inf."""
+    d = bfs_limitada(matriz.indice(*origem), matriz, raio).get(matriz.indice(*destino))
+    return float('inf') if d is None else d
+
+def distancia_minima(origem, destino, matriz, estrategia=None):
+    """Distância em número de arestas pelo caminho mínimo.
+
+    Com a estratégia "arvore", a distância sai do oráculo sem montar o caminho
+    (se o oráculo não se aplica ao labirinto, como nas dimensões pares, usa a BFS).
+    """
+    estrategia = estrategia or ESTRATEGIA_CAMINHO
+    if estrategia == "arvore":
+        oraculo = oraculo_para(matriz)
+        if oraculo is not None:
+            return oraculo.distancia(matriz.indice(*origem), matriz.indice(*destino))
+        estrategia = "bfs"
+    path = caminho_minimo(origem, destino, matriz, estrategia)
+    return len(path)-1 if path else float('inf')
+
+class CampoDistancias:
+    """Distâncias BFS de todas as células alcançáveis até uma origem (o Entrante).
+
+    É calculado uma vez por rodada e responde todas as consultas da rodada:
+    percepção do Minotauro, próximo passo da perseguição e checagem de combate.
+    Os caminhos seguem, a partir da consulta, o primeiro vizinho (na ordem de
+    grade.offsets) que diminui a distância. Isso reproduz exatamente o caminho
+    que caminho_minimo(consulta, origem) devolveria, pois a BFS com ordem fixa
+    de vizinhos escolhe o menor caminho lexicograficamente.
+
+    raio: se informado, o campo só cobre células a até `raio` arestas da origem
+    (bfs_limitada); as demais têm distância inf.
+
+    Com CampoDistancias.de_origens o campo parte de várias origens ao mesmo
+    tempo (bfs_multiorigem): cada célula guarda a distância até a origem mais
+    próxima, e mais_proxima(pos) diz qual é ela.
+    """
+    def __init__(self, origem, matriz, raio=None):
+        self.matriz = matriz
+        self.origem = origem
+        self.dono = None
+        raiz = matriz.indice(*origem)
+
+        if raio is not None:
+            self.dist = bfs_limitada(raiz, matriz, raio)
+            return
+
+        celulas = matriz.celulas
+        offsets = matriz.offsets
+        dist = {raiz: 0}
+        fila = deque([raiz])
+        while fila:
+            atual = fila.popleft()
+            d = dist[atual] + 1
+            for o in offsets:
+                nb = atual + o
+                if celulas[nb] != COD_PAREDE and nb not in dist:
+                    dist[nb] = d
+                    fila.append(nb)
+        self.dist = dist
+        instrumentacao.registrar_busca("campo", len(dist))
+
+    @classmethod
+    def de_origens(cls, origens, matriz, raio=None):
+        """Campo até a mais próxima de várias origens (x, y), com uma única BFS."""
+        campo = cls.__new__(cls)
+        campo.matriz = matriz
+        campo.origem = list(origens)
+        campo.dist, campo.dono = bfs_multiorigem([matriz.indice(*o) for o in campo.origem], matriz, raio)
+        return campo
+
+    def mais_proxima(self, pos):
+        """Posição, em self.origem, da origem mais próxima de pos (None se fora do campo)."""
+        i = self.matriz.indice(*pos)
+        if i not in self.dist:
+            return None
+        return 0 if self.dono is None else self.dono[i]
+
+    def distancia(self, pos):
+        """Distância de pos até a origem (inf se inalcançável)."""
+        d = self.dist.get(self.matriz.indice(*pos))
+        return float('inf') if d is None else d
+
+    def _passo_indice(self, i):
+        dist = self.dist
+        alvo = dist[i] - 1
+        for o in self.matriz.offsets:
+            if dist.get(i + o) == alvo:
+                return i + o
+        return i
+
+    def proximo_passo(self, pos, passos=1):
+        """Célula alcançada andando `passos` arestas de pos em direção à origem."""
+        i = self.matriz.indice(*pos)
+        if i not in self.dist:
+            return pos
+        for _ in range(min(passos, self.dist[i])):
+            i = self._passo_indice(i)
+        return self.matriz.coord(i)
+
+    def caminho(self, pos):
+        """Caminho mínimo de pos até a origem (mesmo resultado de caminho_minimo)."""
+        i = self.matriz.indice(*pos)
+        if i not in self.dist:
+            return []
+        path = [i]
+        while self.dist[i] > 0:
+            i = self._passo_indice(i)
+            path.append(i)
+        coord = self.matriz.coord
+        return [coord(j) for j in path]
+
+# --- Entrante (DFS com “novelo de lã”) ---
+class Entrante:
+    """Classe que representa o Entrante (jogador) no labirinto."""
+    def __init__(self, inicio, saida, matriz, energia_max=500, rng=random, itens=None):
+        self.matriz = matriz
+        self.itens = itens  # CamadaItens (ou equivalente) de onde coletar; None = sem itens
+        self._i = matriz.indice(*inicio)  # posição atual como índice plano
+        self.rng = rng
+        self.saida = saida
+        self._saida = matriz.indice(*saida)
+        self.visitado = MapaVisitados(matriz, [inicio])
+        self.trilha = TrilhaMovimentos(matriz) # Pilha para DFS
+        self.energia_max = energia_max
+        self.energia = energia_max
+        self.morto = False
+
+        # Campos de Relatório
+        self.trilha_final = TrilhaMovimentos(matriz, inicio)
+
+        # Equipamentos (usados se ITENS_ATIVOS for True)
+        self.arma = None
+        self.armadura = None
+
+        # Posição anterior para fins de rastro
+        self._anterior = self._i
+
+    @property
+    def pos(self):
+        return self.matriz.coord(self._i)
+
+    @pos.setter
+    def pos(self, pos):
+        self._i = self.matriz.indice(*pos)
+
+    @property
+    def pos_anterior(self):
+        return self.matriz.coord(self._anterior)
+
+    def coletar_item(self, item):
+        """Coleta e aplica o efeito do item (se ITENS_ATIVOS for True)."""
+        if not ITENS_ATIVOS:
+            return
+
+        # Consumível
+        if item in CONSUMIVEIS:
+            self.energia = min(self.energia_max, self.energia + CONSUMIVEIS[item])
+        # Arma
+        elif item in ARMAS:
+            self.arma = item
+        # Armadura
+        elif item in ARMADURAS:
+            self.armadura = item
+
+    def bonus_combate_total(self):
+        """Calcula a chance de vitória/sobrevivência baseada nos equipamentos."""
+        if not ITENS_ATIVOS:
+            return 0.0
+
+        chance = 0
+        if self.arma:
+            chance += ARMAS[self.arma]
+        if self.armadura:
+            chance += ARMADURAS[self.armadura]
+        return chance / 100
+
+    def passo(self):
+        """Faz um passo no labirinto usando DFS com trilha (novelo de lã)."""
+        if self.energia <= 0:
+            return self.pos, False, True
+
+        if self.morto:
+            return self.pos, False, False
+
+        self.energia -= 1
+
+        # 1. Guarda a célula anterior (entrada/saída são desenhadas na renderização)
+        i = self._i
+        self._anterior = i
+
+        if i == self._saida:
+            return self.pos, True, False
+
+        # 2. Tenta avançar (DFS): sorteia um vizinho livre ainda não visitado.
+        # Conta os candidatos e sorteia só se houver mais de um; não aloca listas.
+        matriz = self.matriz
+        offsets = matriz.offsets_por_mascara[matriz.mascara_vizinhos(i)]
+        visitado = self.visitado
+        candidatos = visitado.contar_nao_visitados(i, offsets)
+
+        if candidatos:
+            escolha = self.rng.randrange(candidatos) if candidatos > 1 else 0
+            j = visitado.nao_visitado(i, offsets, escolha)
+
+            # Movimento
+            self.trilha.anexar_indice(i)
+            self._i = j
+            self.visitado.adicionar_indice(j)
+
+            # REGISTRO: Adiciona o novo vértice à trilha final
+            self.trilha_final.anexar_indice(j)
+
+            # Coleta item se houver (uma remoção O(1) na camada de itens)
+            if ITENS_ATIVOS and self.itens is not None:
+                codigo = self.itens.remover(j)
+                if codigo is not None:
+                    self.coletar_item(ITEM_POR_CODIGO[codigo])
+
+            return self.pos, (j == self._saida), False
+
+        # 3. Backtrack
+        if self.trilha:
+            self._i = self.trilha.remover_indice()
+
+            # REGISTRO: Adiciona o vértice de retorno à trilha final
+            self.trilha_final.anexar_indice(self._i)
+
+        return self.pos, (self._i == self._saida), False
+
+    def mostrar_energia(self):
+        """Retorna uma string representando o status atual do Entrante."""
+        base_status = f"--- 🏃 Entrante | 🍗 Energia: {self.energia}/{self.energia_max}"
+
+        if ITENS_ATIVOS:
+            arma = self.arma if self.arma else "Nenhuma"
+            armadura = self.armadura if self.armadura else "Nenhuma"
+            return f"{base_status} | Arma: {arma} | Armadura: {armadura} ---"
+        else:
+            return f"{base_status} | ITENS: DESATIVADOS ---"
+
+
+# --- Minotauro (dois modos) ---
+class Minotauro:
+    """Classe que representa o Minotauro no labirinto."""
+    def __init__(self, inicio, rng=random):
+        self.pos = inicio
+        self.rng = rng
+        self.centro = inicio
+        self.perseguindo = False
+        self.ultimo = inicio
+        self.passos_patrulha = 0
+        self.passos_max = 15
+        self.destino = None
+        self.escondido = False
+
+        # Rota de patrulha em cache: caminho até self.destino, posição atual nele e
+        # versão da grade usada no cálculo
+        self.rota = None
+        self.rota_pos = 0
+        self.rota_versao = -1
+
+        # Campos de Estado da Patrulha Anterior
+        self.voltando = False
+        self.memoria = []
+        self.memoria_max = 20
+
+        # Campos de Relatório
+        self.detectado_em = None
+        self.alcancado_em = None
+        self.caminho_perseguicao = TrilhaIndices()
+        self.ultima_perseg_pos = inicio
+
+    def _encontrar_destino_aleatorio(self, matriz):
+        """Função auxiliar para escolher um ponto aleatório livre no mapa."""
+
+        excluidos = (matriz.indice(*self.pos), matriz.indice(*self.centro))
+        destino = matriz.livres().sortear(self.rng, excluidos)
+
+        if destino is None:
+            return self.centro
+
+        return matriz.coord(destino)
+
+
+    def passo(self, alvo, matriz, percepcao, rodada_atual, campo=None):
+        """Faz um passo no labirinto baseado na lógica de perseguição/patrulha.
+
+        campo: CampoDistancias já calculado a partir de `alvo` nesta rodada (opcional).
+        """
+
+        if self.escondido:
+            return self.pos
+
+        if campo is None:
+            campo = CampoDistancias(alvo, matriz, max(percepcao, 1))
+
+        dist = campo.distancia(self.pos)
+        perseg_anterior = self.perseguindo
+
+        self.perseguindo = dist <= percepcao
+
+        # Lógica de registro de detecção
+        if self.perseguindo and not perseg_anterior and dist > 0:
+            if self.detectado_em is None:
+                self.detectado_em = rodada_atual
+
+        # === MODO PERSEGUIÇÃO: Movimento de 2 em 2 (Ajustado) ===
+        if self.perseguindo and dist > 0 and dist < float('inf'):
+            # Anda até 2 arestas pelo caminho mínimo em direção ao alvo
+            proxima_pos = campo.proximo_passo(self.pos, 2)
+
+            # A perna de patrulha foi abandonada
+            self.rota = None
+
+            if proxima_pos:
+                self.ultimo = self.pos
+                self.pos = proxima_pos
+
+                # REGISTRO: Adiciona a posição à trilha de perseguição
+                if self.ultima_perseg_pos != self.pos:
+                    self.caminho_perseguicao.anexar(self.pos, matriz)
+                    self.ultima_perseg_pos = self.pos
+        
+        # === MODO PATRULHA: Original com BFS (Otimizado) ===
+        else:
+            contador = 0
+            if self.destino is None or self.pos == self.destino:
+                if not self.voltando:
+                    # escolhe ponto aleatório
+                    self.destino = self._encontrar_destino_aleatorio(matriz)
+                    self.rota = None
+                    contador += 1
+                    if contador > 10:
+                        self.voltando = True
+                else:
+                    # volta ao centro
+                    self.destino = self.centro
+                    self.rota = None
+                    self.voltando = False
+
+            # Calcula a rota uma vez por perna; depois só avança o índice.
+            # (Todo trecho final de um caminho mínimo da BFS é o caminho mínimo
+            # da BFS a partir dali, então seguir a rota equivale a recalculá-la.)
+            rota_valida = (self.rota is not None and self.rota_versao == matriz.versao
+                           and (not self.rota or self.rota[self.rota_pos] == self.pos))
+            if not rota_valida:
+                self.rota = caminho_minimo(self.pos, self.destino, matriz)
+                self.rota_pos = 0
+                self.rota_versao = matriz.versao
+
+            if self.rota_pos + 1 < len(self.rota):
+                self.rota_pos += 1
+                proxima_pos = self.rota[self.rota_pos]
+
+                self.ultimo = self.pos
+                self.pos = proxima_pos
+                self.passos_patrulha += 1
+                self.memoria.append(self.pos)
+
+                if len(self.memoria) > self.memoria_max:
+                    self.memoria.pop(0)
+
+            if self.passos_patrulha >= self.passos_max:
+                self.passos_patrulha = 0
+                self.destino = None
+                self.rota = None
+
+        return self.pos
+
+# --- Renderização ---
+def glifo_celula(matriz, x, y, entrante_pos, minotauro_pos, minotauro: Minotauro=None, morto=False, itens=None):
+    """Glifo (emoji) exibido na célula (x, y): agentes, entrada/saída e itens sobre o terreno."""
+    if (x, y) == entrante_pos:
+        return "💥" if morto else JOGADOR
+    if (x, y) == minotauro_pos and minotauro is not None and not minotauro.escondido:
+        return MINOTAURO
+    if (x, y) == (1, 1):
+        return ENTRADA
+    if (x, y) == (matriz.largura-2, matriz.altura-2):
+        return SAIDA
+    if itens is not None:
+        codigo = itens.obter(matriz.indice(x, y))
+        if codigo is not None:
+            return GLIFOS[codigo]
+    return GLIFOS[matriz.celula(x, y)]
+
+def imprimir(matriz, entrante_pos, minotauro_pos, minotauro: Minotauro=None, morto=False, itens=None):
+    """Imprime o labirinto inteiro de uma vez (para animação use RenderizadorANSI)."""
+    linhas = []
+    for y in range(matriz.altura):
+        linhas.append("".join(glifo_celula(matriz, x, y, entrante_pos, minotauro_pos, minotauro, morto, itens)
+                              for x in range(matriz.largura)))
+    print("\n".join(linhas))
+
+
+# --- Regras de encontro ---
+def resolver_encontro(jogador, rng=random):
+    """Resolve o encontro entre Entrante e Minotauro. Retorna True se o Entrante sobrevive."""
+    # 1. Chance base
+    chance = 0.01
+
+    if ITENS_ATIVOS:
+        # 2. Adiciona bônus de equipamentos se existirem
+        bonus_equipamento = jogador.bonus_combate_total()
+        chance += bonus_equipamento
+
+    # 3. Garante que não ultrapasse 99%
+    chance = min(chance, 0.99)
+
+    return rng.random() < chance
+
+# Função para checar se o Minotauro está adjacente ou sobre o Entrante
+def checar_combate_imediato(minotauro_pos, entrante_pos, matriz, campo=None):
+    """Checa se o Minotauro está na mesma posição ou adjacente ao Entrante.
+
+    campo: CampoDistancias já calculado a partir de `entrante_pos` (opcional).
+    """
+    if minotauro_pos == entrante_pos:
+        return True
+    if campo is not None:
+        return campo.distancia(minotauro_pos) == 1
+    return distancia_limitada(minotauro_pos, entrante_pos, matriz, 1) == 1
+
+# --- Geração de Relatório ---
+SEPARADOR = "----------------------------------------------------\n"
+
+def escrever_relatorio_texto(f, jogador: Entrante, minotauro: Minotauro, status_final: str):
+    """Escreve o relatório em texto no arquivo f, seção por seção (sem montar a string inteira)."""
+    f.write("======== RELATÓRIO DO LABIRINTO (MINOTAURO) ========\n")
+    f.write(f"STATUS FINAL: {status_final}\n")
+    f.write(f"Rodada final: {minotauro.alcancado_em if minotauro.alcancado_em else 'N/A'}\n")
+    f.write(SEPARADOR)
+
+    # Tempo restante de comida
+    f.write(f"TEMPO RESTANTE DE ENERGIA (Comida): {jogador.energia} passos (Inteiros)\n")
+
+    if ITENS_ATIVOS:
+        f.write(f"Arma do Entrante: {jogador.arma if jogador.arma else 'Nenhuma'}\n")
+        f.write(f"Armadura do Entrante: {jogador.armadura if jogador.armadura else 'Nenhuma'}\n")
+    else:
+        f.write("[INFO] A coleta, uso e rastreamento de Itens/Equipamentos estão DESATIVADOS.\n")
+
+    f.write(SEPARADOR)
+    trilha = jogador.trilha_final
+    # Sequência de vértices do prisioneiro (Entrante), 8 por linha
+    f.write(f"SEQUÊNCIA DE VÉRTICES VISITADOS PELO PRISIONEIRO ({len(trilha)} vértices):\n")
+    f.write("-> [")
+    ultimo = len(trilha) - 1
+    for i, vertice in enumerate(trilha):
+        if i < ultimo:
+            f.write(f"{vertice}, \n   " if (i + 1) % 8 == 0 else f"{vertice}, ")
+        else:
+            f.write(str(vertice))
+    f.write("]\n")
+    f.write(SEPARADOR)
+
+    # Detecção e Perseguição
+    f.write("RASTREAMENTO DO MINOTAURO:\n")
+
+    if minotauro.detectado_em:
+        f.write(f" - Detecção do Prisioneiro: Rodada {minotauro.detectado_em}\n")
+    else:
+        f.write(" - O prisioneiro não foi detectado pelo Minotauro.\n")
+
+    if minotauro.alcancado_em:
+        f.write(f" - Encontro (Alcançado): Rodada {minotauro.alcancado_em}\n")
+    else:
+        f.write(" - O encontro não ocorreu.\n")
+
+    if minotauro.caminho_perseguicao:
+        f.write(" - Caminho Percorrido pelo Minotauro (durante a perseguição):\n")
+        f.write("[")
+        for i, vertice in enumerate(minotauro.caminho_perseguicao):
+            f.write(f", {vertice}" if i else str(vertice))
+        f.write("]\n")
+    else:
+        f.write(" - Nenhuma perseguição significativa ocorreu ou foi registrada.\n")
+
+    f.write("====================================================\n")
+
+def _resumo_relatorio(jogador: Entrante, minotauro: Minotauro, status_final: str):
+    return {
+        "status": status_final,
+        "rodada_final": minotauro.alcancado_em,
+        "energia": jogador.energia,
+        "arma": jogador.arma if ITENS_ATIVOS else None,
+        "armadura": jogador.armadura if ITENS_ATIVOS else None,
+        "detectado_em": minotauro.detectado_em,
+        "alcancado_em": minotauro.alcancado_em,
+        "vertices_entrante": len(jogador.trilha_final),
+        "vertices_minotauro": len(minotauro.caminho_perseguicao),
+    }
+
+def escrever_relatorio_jsonl(f, jogador: Entrante, minotauro: Minotauro, status_final: str):
+    """JSON Lines: um registro "resumo" seguido de um registro por vértice das trilhas."""
+    resumo = {"tipo": "resumo"}
+    resumo.update(_resumo_relatorio(jogador, minotauro, status_final))
+    f.write(json.dumps(resumo, ensure_ascii=False) + "\n")
+    for tipo, trilha in (("entrante", jogador.trilha_final), ("minotauro", minotauro.caminho_perseguicao)):
+        for passo, (x, y) in enumerate(trilha):
+            f.write(f'{{"tipo": "{tipo}", "passo": {passo}, "x": {x}, "y": {y}}}\n')
+
+CAMPOS_CSV = ["tipo", "passo", "x", "y", "status", "rodada_final", "energia", "arma", "armadura",
+              "detectado_em", "alcancado_em", "vertices_entrante", "vertices_minotauro"]
+
+def escrever_relatorio_csv(f, jogador: Entrante, minotauro: Minotauro, status_final: str):
+    """CSV: uma linha "resumo" (colunas do resumo) e uma linha por vértice das trilhas (tipo, passo, x, y)."""
+    escritor = csv.writer(f)
+    escritor.writerow(CAMPOS_CSV)
+    resumo = _resumo_relatorio(jogador, minotauro, status_final)
+    escritor.writerow(["resumo", "", "", ""] + ["" if resumo[c] is None else resumo[c] for c in CAMPOS_CSV[4:]])
+    for tipo, trilha in (("entrante", jogador.trilha_final), ("minotauro", minotauro.caminho_perseguicao)):
+        escritor.writerows((tipo, passo, x, y) for passo, (x, y) in enumerate(trilha))
+
+FORMATOS_RELATORIO = {
+    "texto": escrever_relatorio_texto,
+    "jsonl": escrever_relatorio_jsonl,
+    "csv": escrever_relatorio_csv,
+}
+
+def escrever_instrumentacao(f, formato, instrumentacao: Instrumentacao):
+    """Acrescenta as medições de uma partida instrumentada ao relatório (texto ou jsonl)."""
+    if formato == "texto":
+        instrumentacao.escrever_texto(f)
+    elif formato == "jsonl":
+        registro = {"tipo": "instrumentacao"}
+        registro.update(instrumentacao.resumo())
+        f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+def gerar_relatorio(jogador: Entrante, minotauro: Minotauro, status_final: str,
+                    caminho="relatorio.txt", formato="texto", saida=None, instrumentacao=None):
+    """Gera um relatório final do jogo e salva em `caminho` (padrão 'relatorio.txt').
+
+    formato: "texto" (o relatório legível), "jsonl" ou "csv" (ver escrever_relatorio_*).
+    saida: arquivo já aberto; se informado, o relatório é escrito nele e `caminho` é ignorado.
+    instrumentacao: Instrumentacao da partida (Jogo.instrumentacao); se informada, seus
+    totais e histogramas vão ao fim do relatório em texto e num registro do jsonl
+    (o csv continua só com as trilhas).
+    """
+    try:
+        escrever = FORMATOS_RELATORIO[formato]
+    except KeyError:
+        raise ValueError(f"Formato de relatório desconhecido: {formato!r} (use um de {sorted(FORMATOS_RELATORIO)})")
+
+    if saida is not None:
+        escrever(saida, jogador, minotauro, status_final)
+        if instrumentacao is not None:
+            escrever_instrumentacao(saida, formato, instrumentacao)
+        return
+
+    with open(caminho, "w", encoding="utf-8", newline="" if formato == "csv" else None) as f:
+        escrever(f, jogador, minotauro, status_final)
+        if instrumentacao is not None:
+            escrever_instrumentacao(f, formato, instrumentacao)
+
+    print(f"\n[INFO] Relatório salvo em '{caminho}'")
+
+
+# --- Motor do jogo (sem renderização) ---
+def encontrar_spawn_minotauro(lab):
+    """Retorna a célula livre mais próxima do centro (spawn do Minotauro)."""
+    largura, altura = lab.largura, lab.altura
+    cx, cy = largura//2, altura//2
+    if lab.celula(cx, cy) != COD_PAREDE:
+        return (cx, cy)
+
+    pq = []
+    seen = set()
+    heappush(pq, (0, (cx, cy)))
+    while pq:
+        _, (x, y) = heappop(pq)
+        if (x, y) in seen:
+            continue
+        seen.add((x, y))
+        if lab.celula(x, y) != COD_PAREDE:
+            return (x, y)
+        for nx, ny in [(x+1,y),(x-1,y),(x,y+1),(x,y-1)]:
+            if 0 <= nx < largura and 0 <= ny < altura:
+                heappush(pq, (abs(nx-cx)+abs(ny-cy), (nx, ny)))
+
+    return (largura-2, altura-2)
+
+
+@dataclass
+class ResultadoJogo:
+    """Resultado estruturado de uma partida completa."""
+    status: str
+    rodadas: int
+    detectado_em: Optional[int]
+    encontro_em: Optional[int]
+    trilha_entrante: Sequence  # sequências somente-leitura de (x, y) (ver trilhas.py)
+    trilha_minotauro: Sequence
+    energia_restante: int
+
+
+class _PicklerInstantaneo(pickle.Pickler):
+    """Pickler de instantâneos que troca o labirinto `lab` (se dado) por uma referência."""
+
+    def __init__(self, arquivo, lab):
+        super().__init__(arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+        self.lab = lab
+
+    def persistent_id(self, obj):
+        return "lab" if obj is self.lab and obj is not None else None
+
+
+class _UnpicklerInstantaneo(pickle.Unpickler):
+    """Unpickler correspondente: resolve a referência ao labirinto com `lab`."""
+
+    def __init__(self, arquivo, lab):
+        super().__init__(arquivo)
+        self.lab = lab
+
+    def persistent_load(self, pid):
+        if pid != "lab" or self.lab is None:
+            raise pickle.UnpicklingError("Instantâneo sem labirinto: passe o labirinto da partida em restaurar(dados, lab).")
+        return self.lab
+
+
+class Jogo:
+    """Estado de uma partida: labirinto, agentes e contador de rodadas.
+
+    Não faz nenhuma saída no terminal; quem renderiza é o chamador (main).
+
+    instrumentar: se True, cada rodada é medida numa Instrumentacao
+    (self.instrumentacao; ver instrumentacao.py). O chamador pode somar o tempo
+    de renderização com self.instrumentacao.marcar("render", inicio).
+    """
+    def __init__(self, semente=None, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO,
+                 energia_max=500, quantidade_itens=30, rng=None, instrumentar=False):
+        self.rng = rng if rng is not None else random.Random(semente)
+        self.semente = semente
+        self.largura = largura
+        self.altura = altura
+        self.percepcao = percepcao
+
+        self.entrada = (1, 1)
+        self.lab, self.itens, self.saida, mino_start = self._montar(quantidade_itens)
+
+        self.entrante = Entrante(self.entrada, self.saida, self.lab, energia_max, rng=self.rng, itens=self.itens)
+        self.minotauro = Minotauro(mino_start, rng=self.rng)
+
+        self.rodada = 0
+        self.status_final = "INCOMPLETO"
+        self.encerrado = False
+        self.encontro_em = None
+        self.instrumentacao = Instrumentacao() if instrumentar else None
+
+    def _montar(self, quantidade_itens):
+        """Labirinto, itens, saída e spawn do Minotauro da partida (subclasses podem trocar o labirinto)."""
+        lab = gerar_labirinto(self.largura, self.altura, self.rng)
+        itens = espalhar_itens(lab, quantidade=quantidade_itens, rng=self.rng)
+        return lab, itens, (self.largura-2, self.altura-2), encontrar_spawn_minotauro(lab)
+
+    def avancar(self):
+        """Executa uma rodada completa.
+
+        Retorna o evento da rodada: None, "SOBREVIVEU" (combate vencido),
+        "MINOTAURO", "FOME" ou "ESCAPOU".
+        """
+        if self.encerrado:
+            return None
+
+        instr = self.instrumentacao
+        if instr is None:
+            return self._rodada(None, 0.0)
+
+        # Deixa a instrumentação visível para as buscas durante a rodada
+        inicio = instr.iniciar_rodada()
+        anterior = instrumentacao.ATIVA
+        instrumentacao.ATIVA = instr
+        try:
+            return self._rodada(instr, inicio)
+        finally:
+            instrumentacao.ATIVA = anterior
+
+    def _rodada(self, instr, t):
+        self.rodada += 1
+        rodada = self.rodada
+        entrante = self.entrante
+        minotauro = self.minotauro
+        evento = None
+
+        # Campo de distâncias até o Entrante, compartilhado pelas consultas da rodada.
+        # Só interessa até a percepção (detecção/perseguição) e até 1 (combate).
+        raio = 1 if minotauro.escondido else max(self.percepcao, 1)
+        campo = CampoDistancias(entrante.pos, self.lab, raio)
+        if instr is not None:
+            t = instr.marcar("campo", t)
+
+        # 1. MINOTAURO SE MOVE
+        mpos = minotauro.passo(entrante.pos, self.lab, self.percepcao, rodada, campo)
+        if instr is not None:
+            t = instr.marcar("minotauro", t)
+
+        # 2. VERIFICAÇÃO DE COMBATE E RESOLUÇÃO
+        if checar_combate_imediato(mpos, entrante.pos, self.lab, campo):
+            minotauro.alcancado_em = rodada
+            if self.encontro_em is None:
+                self.encontro_em = rodada
+
+            if resolver_encontro(entrante, self.rng):
+                evento = "SOBREVIVEU"
+            else:
+                entrante.morto = True
+                self.status_final = "MORREU PELO MINOTAURO"
+                self.encerrado = True
+
+            minotauro.escondido = True
+
+        if instr is not None:
+            t = instr.marcar("combate", t)
+        if entrante.morto:
+            return "MINOTAURO"
+
+        # 3. ENTRANTE SE MOVE
+        _, salvou, morreu_fome = entrante.passo()
+        if instr is not None:
+            instr.marcar("entrante", t)
+
+        # 4. CONDIÇÕES DE FIM DE JOGO
+        if morreu_fome:
+            self.status_final = "MORREU DE FOME"
+            minotauro.alcancado_em = rodada
+            self.encerrado = True
+            return "FOME"
+
+        if salvou:
+            self.status_final = "ESCAPOU"
+            minotauro.alcancado_em = rodada
+            self.encerrado = True
+            return "ESCAPOU"
+
+        return evento
+
+    def instantaneo(self, com_labirinto=True):
+        """Estado completo da partida (RNG, labirinto, itens, agentes), serializado e comprimido.
+
+        Com com_labirinto=False o labirinto fica de fora (só uma referência a
+        ele), e restaurar() precisa recebê-lo de volta; serve para quem guarda
+        muitos instantâneos da mesma partida (reproducao.Gravacao), já que o
+        labirinto não muda depois de gerado.
+
+        Só funciona com um gerador próprio (random.Random, o padrão); com o
+        módulo global `random` o estado não seria autocontido.
+        """
+        if not isinstance(self.rng, random.Random):
+            raise ValueError("Instantâneos exigem um random.Random próprio (crie o Jogo com semente ou rng=random.Random(...)).")
+        buffer = io.BytesIO()
+        _PicklerInstantaneo(buffer, None if com_labirinto else self.lab).dump(self)
+        return zlib.compress(buffer.getvalue())
+
+    @staticmethod
+    def restaurar(dados, lab=None):
+        """Jogo a partir de um instantâneo; continuar com avancar() repete a partida original.
+
+        `lab` é o labirinto da partida, obrigatório se o instantâneo foi tirado
+        com com_labirinto=False (o jogo restaurado passa a usar esse objeto).
+        Os dados são um pickle: carregue só instantâneos de fonte confiável.
+        """
+        return _UnpicklerInstantaneo(io.BytesIO(zlib.decompress(dados)), lab).load()
+
+    def resultado(self):
+        """Resumo da partida no formato ResultadoJogo."""
+        return ResultadoJogo(
+            status=self.status_final,
+            rodadas=self.rodada,
+            detectado_em=self.minotauro.detectado_em,
+            encontro_em=self.encontro_em,
+            trilha_entrante=self.entrante.trilha_final,
+            trilha_minotauro=self.minotauro.caminho_perseguicao,
+            energia_restante=self.entrante.energia,
+        )
+
+
+def jogar(semente=None, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO,
+          energia_max=500, quantidade_itens=30, max_rodadas=None):
+    """Executa uma partida inteira sem terminal, sem subprocessos e sem pausas.
+
+    max_rodadas: limite opcional de rodadas (status "INCOMPLETO" se atingido).
+    """
+    jogo = Jogo(semente, largura, altura, percepcao, energia_max, quantidade_itens)
+    while not jogo.encerrado:
+        if max_rodadas is not None and jogo.rodada >= max_rodadas:
+            break
+        jogo.avancar()
+    return jogo.resultado()
+
+
+# --- Principal ---
+def _rodape(jogo, mensagem=""):
+    minotauro = jogo.minotauro
+    destino_str = minotauro.destino if minotauro.destino else "Nenhum"
+    estado_mino = '🐂 PERSEGUINDO 🏃' if minotauro.perseguindo and not minotauro.escondido else ('Patrulha para ' + str(destino_str) if not minotauro.escondido else "Desativado")
+    return [
+        f"Rodada {jogo.rodada} | Estado do Minotauro: {estado_mino} | Percepção (Distância): {jogo.percepcao}",
+        jogo.entrante.mostrar_energia(),
+        "",
+        mensagem,
+    ]
+
+
+def mensagem_evento(evento, rodada):
+    """Mensagem do rodapé para o evento retornado por Jogo.avancar (None se não houver)."""
+    if evento == "MINOTAURO":
+        return f"💀 O Minotauro eliminou o prisioneiro na Rodada {rodada}!"
+    if evento == "SOBREVIVEU":
+        return f"⚔️ Batalha! O prisioneiro sobreviveu na Rodada {rodada} e continua sua jornada."
+    if evento == "FOME":
+        return "💀 O prisioneiro não aguentou mais andar. Morreu de fome!"
+    if evento == "ESCAPOU":
+        return "🎉 O prisioneiro encontrou a saída!"
+    return None
+
+
+def main(semente=None, instrumentar=False, rodadas_por_segundo=20, fps=30):
+    """Função principal que executa o jogo do labirinto.
+
+    A partida usa um gerador próprio com `semente` (sorteada se não for
+    informada e mostrada no fim), para que possa ser reproduzida depois.
+    instrumentar: mede as fases de cada rodada (inclusive a renderização) e
+    acrescenta as medições ao relatório.
+    rodadas_por_segundo / fps: ritmo da simulação (None = o mais rápido
+    possível) e dos quadros, independentes um do outro (ver ao_vivo.py).
+    """
+    from ao_vivo import executar
+
+    if semente is None:
+        semente = random.randrange(2**32)
+    jogo = Jogo(semente, instrumentar=instrumentar)
+    executar(jogo, rodadas_por_segundo, fps, pausa_inicial=1.0,
+             rodape_final=[f"Semente: {semente} (reproduza com: python reproducao.py gravar {semente})"])
+
+    # GERAÇÃO FINAL DO RELATÓRIO
+    gerar_relatorio(jogo.entrante, jogo.minotauro, jogo.status_final, instrumentacao=jogo.instrumentacao)
+
+
+if __name__ == "__main__":
+    main()
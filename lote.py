@@ -0,0 +1,403 @@
+"""Simulador em lote: milhares de partidas independentes avançando juntas (NumPy).
+
+Cada partida usa o mesmo labirinto e os mesmos itens que Jogo(semente) geraria
+(a geração continua escalar, por semente). Depois disso, o estado de todos os
+agentes fica em colunas NumPy (estrutura de arrays): posições, energia,
+perseguição, destino de patrulha, equipamentos. Cada rodada é feita para todas
+as partidas ativas de uma vez, com as mesmas regras de Entrante.passo,
+Minotauro.passo, checar_combate_imediato e resolver_encontro.
+
+As grades de todas as partidas ficam enfileiradas num único array plano: a
+célula i da partida g tem índice global g*n + i (n = tamanho de uma Grade), e
+os deslocamentos de vizinhos são os mesmos da Grade, graças à moldura
+sentinela.
+
+Os sorteios dos agentes vêm de um numpy.random.Generator, e não do
+random.Random de cada partida. Por isso as partidas não repetem as de jogar(),
+mas seguem a mesma distribuição: as taxas de cada status e as médias de rodadas
+batem estatisticamente com as do motor escalar.
+
+Memória: as colunas por célula (grades, itens, visitados, pilha da DFS, campos
+de distância e marcas da BFS) somam cerca de 15 bytes por célula por partida
+(19 em grades com 2**15 células ou mais), ou seja, O(partidas x células). Em
+101x101 são ~155 KB por partida, ~640 MB num bloco de 4096; simular_lote
+processa `bloco` partidas por vez justamente para limitar isso.
+
+Requer NumPy (pip install numpy), a única dependência de fora da biblioteca
+padrão do projeto, e só deste módulo.
+"""
+
+import random
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError as erro:
+    raise ImportError("lote.py requer NumPy (pip install numpy); o resto do projeto não depende dele.") from erro
+
+import labirinto
+from labirinto import (LARGURA, ALTURA, PERCEPCAO, CONSUMIVEIS, ARMAS, ARMADURAS, CODIGO_ITEM,
+                       gerar_labirinto, espalhar_itens, encontrar_spawn_minotauro)
+from grade import COD_PAREDE, COD_ITEM_BASE
+
+# Códigos de status (índices em STATUS)
+EM_JOGO, ESCAPOU, FOME, MINOTAURO = 0, 1, 2, 3
+STATUS = ("INCOMPLETO", "ESCAPOU", "MORREU DE FOME", "MORREU PELO MINOTAURO")
+
+PASSOS_PATRULHA = 15  # Minotauro.passos_max
+
+
+def _tabela(valores):
+    """Array indexado por código de célula com o valor de cada item (0 para os demais)."""
+    tabela = np.zeros(256, dtype=np.int32)
+    for item, valor in valores.items():
+        tabela[CODIGO_ITEM[item]] = valor
+    return tabela
+
+
+ENERGIA_POR_CODIGO = _tabela(CONSUMIVEIS)
+ARMA_POR_CODIGO = _tabela(ARMAS)
+ARMADURA_POR_CODIGO = _tabela(ARMADURAS)
+
+
+@dataclass
+class ResultadoLote:
+    """Resultados por partida, em arrays alinhados com `sementes` (-1 = não ocorreu)."""
+    sementes: np.ndarray
+    status: np.ndarray            # códigos de STATUS
+    rodadas: np.ndarray
+    detectado_em: np.ndarray
+    encontro_em: np.ndarray
+    energia_restante: np.ndarray
+
+    def __len__(self):
+        return len(self.sementes)
+
+    def contagem(self):
+        """Número de partidas por status (nomes de STATUS)."""
+        contagens = np.bincount(self.status, minlength=len(STATUS))
+        return {nome: int(c) for nome, c in zip(STATUS, contagens)}
+
+    def taxas(self):
+        """Fração das partidas em cada status."""
+        total = max(len(self), 1)
+        return {nome: c / total for nome, c in self.contagem().items()}
+
+
+class SimuladorLote:
+    """Estado de várias partidas (uma por semente) em colunas NumPy.
+
+    Todas usam as mesmas dimensões e parâmetros. rng: numpy.random.Generator
+    dos sorteios dos agentes (padrão: default_rng(semente_rng)).
+    """
+    def __init__(self, sementes, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO,
+                 energia_max=500, quantidade_itens=30, rng=None, semente_rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng(semente_rng)
+        self.sementes = np.asarray(list(sementes), dtype=np.int64)
+        self.percepcao = percepcao
+        self.energia_max = energia_max
+        self.itens_ativos = labirinto.ITENS_ATIVOS
+        jogos = len(self.sementes)
+
+        # --- Geração escalar (idêntica à de Jogo) e empilhamento das grades ---
+        grades = []
+        camadas = []
+        centros = []
+        for semente in self.sementes.tolist():
+            rng_jogo = random.Random(semente)
+            lab = gerar_labirinto(largura, altura, rng_jogo)
+            camadas.append(espalhar_itens(lab, quantidade=quantidade_itens, rng=rng_jogo))
+            grades.append(lab)
+            centros.append(lab.indice(*encontrar_spawn_minotauro(lab)))
+        modelo = grades[0] if grades else labirinto.Grade(largura, altura)
+        n = len(modelo.celulas)
+        self.n = n
+        self.passo = modelo.passo
+        self.offsets = np.array(modelo.offsets, dtype=np.int64)
+        self.celulas = np.frombuffer(b"".join(bytes(g.celulas) for g in grades), dtype=np.uint8).copy()
+        self.base = np.arange(jogos, dtype=np.int64) * n  # índice global da célula 0 de cada partida
+
+        # Camada de itens de todas as partidas, no mesmo índice global (0 = sem item)
+        self.itens = np.zeros(jogos * n, dtype=np.uint8)
+        for g, camada in enumerate(camadas):
+            for i, codigo in camada:
+                self.itens[g * n + i] = codigo
+
+        # Células livres de cada partida (sorteio dos destinos de patrulha)
+        livres = [np.flatnonzero(np.frombuffer(bytes(g.celulas), dtype=np.uint8) != COD_PAREDE) for g in grades]
+        self.n_livres = np.array([len(l) for l in livres], dtype=np.int64)
+        self.livres = np.zeros((jogos, int(self.n_livres.max()) if jogos else 0), dtype=np.int64)
+        for g, l in enumerate(livres):
+            self.livres[g, :len(l)] = l
+
+        entrada = modelo.indice(1, 1)
+        saida = modelo.indice(largura - 2, altura - 2)
+        self.saida = self.base + saida
+
+        # --- Entrantes ---
+        self.e_pos = self.base + entrada
+        self.energia = np.full(jogos, energia_max, dtype=np.int64)
+        self.arma = np.zeros(jogos, dtype=np.uint8)      # código do item equipado (0 = nenhum)
+        self.armadura = np.zeros(jogos, dtype=np.uint8)
+        self.visitado = np.zeros(jogos * n, dtype=bool)
+        self.visitado[self.e_pos] = True
+        self.pilha = np.zeros((jogos, n), dtype=np.int32)  # pilha da DFS (índices locais), O(jogos x n)
+        self.topo = np.zeros(jogos, dtype=np.int64)
+
+        # --- Minotauros ---
+        self.m_pos = self.base + np.array(centros, dtype=np.int64)
+        self.centro = self.m_pos.copy()
+        self.escondido = np.zeros(jogos, dtype=bool)
+        self.perseguindo = np.zeros(jogos, dtype=bool)
+        self.destino = np.full(jogos, -1, dtype=np.int64)
+        self.passos_patrulha = np.zeros(jogos, dtype=np.int64)
+        # Distâncias até o destino de patrulha de cada partida (-1 = parede/não calculado).
+        # Estes três arrays têm uma entrada por célula de cada partida: O(jogos x n).
+        tipo_dist = np.int16 if n < 2 ** 15 else np.int32
+        self.campo_patrulha = np.full(jogos * n, -1, dtype=tipo_dist)
+        self._rascunho = np.full(jogos * n, -1, dtype=tipo_dist)  # campo de perseguição da rodada
+        self._marca = np.zeros(jogos * n, dtype=np.int32)  # deduplicação das fronteiras da BFS
+
+        # --- Resultados ---
+        self.status = np.zeros(jogos, dtype=np.int8)
+        self.rodadas = np.zeros(jogos, dtype=np.int64)
+        self.detectado_em = np.full(jogos, -1, dtype=np.int64)
+        self.encontro_em = np.full(jogos, -1, dtype=np.int64)
+        self.rodada = 0
+
+    # --- Auxiliares vetorizados ---
+    def _bfs(self, origens, dist, raio=None, ate=None):
+        """BFS simultânea a partir de uma origem global por partida, gravando em `dist`.
+
+        ate: uma célula global por origem; a busca de cada partida para na
+        camada em que alcança a sua (todas as células a distância menor ou
+        igual ficam calculadas, o que basta para descer dali até a origem).
+        Retorna a lista de arrays de células tocadas (para limpar `dist` depois).
+        """
+        livre = self.celulas
+        offsets = self.offsets
+        marca = self._marca
+        n = self.n
+        if ate is not None:
+            alvo = np.zeros(len(self.base), dtype=np.int64)
+            alvo[origens // n] = ate
+        dist[origens] = 0
+        tocadas = [origens]
+        fronteira = origens
+        d = 0
+        while len(fronteira) and (raio is None or d < raio):
+            d += 1
+            viz = (fronteira[:, None] + offsets).ravel()
+            viz = viz[(livre[viz] != COD_PAREDE) & (dist[viz] < 0)]
+            # Remove repetidas sem ordenar: fica a última escrita de cada célula
+            ordem = np.arange(len(viz), dtype=np.int32)
+            marca[viz] = ordem
+            fronteira = viz[marca[viz] == ordem]
+            dist[fronteira] = d
+            tocadas.append(fronteira)
+            if ate is not None:
+                fronteira = fronteira[dist[alvo[fronteira // n]] < 0]
+        return tocadas
+
+    def _descer(self, pos, dist):
+        """Um passo de cada posição para o primeiro vizinho (ordem de offsets) com distância um a menos."""
+        viz = pos[:, None] + self.offsets
+        alvo = (dist[pos].astype(np.int64) - 1)[:, None]
+        coluna = np.argmax(dist[viz] == alvo, axis=1)
+        return viz[np.arange(len(pos)), coluna]
+
+    def _sortear_livre(self, jogos, excluir_a, excluir_b):
+        """Célula livre uniforme de cada partida em `jogos`, diferente de excluir_a e excluir_b."""
+        escolha = np.empty(len(jogos), dtype=np.int64)
+        pendentes = np.arange(len(jogos))
+        while len(pendentes):
+            g = jogos[pendentes]
+            k = (self.rng.random(len(pendentes)) * self.n_livres[g]).astype(np.int64)
+            celula = self.base[g] + self.livres[g, k]
+            ok = (celula != excluir_a[pendentes]) & (celula != excluir_b[pendentes])
+            escolha[pendentes[ok]] = celula[ok]
+            pendentes = pendentes[~ok]
+        return escolha
+
+    # --- Rodada ---
+    def _minotauros(self, ativos, rodada):
+        """Minotauro.passo para todas as partidas ativas com Minotauro visível."""
+        jogos = ativos[~self.escondido[ativos]]
+        if not len(jogos):
+            return
+        percepcao = self.percepcao
+        m_pos = self.m_pos[jogos]
+
+        # Campo a partir do Entrante, limitado à percepção
+        rascunho = self._rascunho
+        tocadas = self._bfs(self.e_pos[jogos], rascunho, max(percepcao, 1))
+        dist = rascunho[m_pos].astype(np.int64)
+        perto = (dist >= 0) & (dist <= percepcao)
+
+        novo = perto & ~self.perseguindo[jogos] & (dist > 0) & (self.detectado_em[jogos] < 0)
+        self.detectado_em[jogos[novo]] = rodada
+        self.perseguindo[jogos] = perto
+
+        # Perseguição: até 2 arestas pelo caminho mínimo
+        caca = perto & (dist > 0)
+        if caca.any():
+            pos = self._descer(m_pos[caca], rascunho)
+            dois = dist[caca] >= 2
+            pos[dois] = self._descer(pos[dois], rascunho)
+            self.m_pos[jogos[caca]] = pos
+        for t in tocadas:
+            rascunho[t] = -1
+
+        # Patrulha: um passo pela rota até o destino (campo de distâncias do destino)
+        patrulha = jogos[~caca]
+        if not len(patrulha):
+            return
+        pos = self.m_pos[patrulha]
+        novo_destino = (self.destino[patrulha] < 0) | (pos == self.destino[patrulha])
+        if novo_destino.any():
+            g = patrulha[novo_destino]
+            self.destino[g] = self._sortear_livre(g, pos[novo_destino], self.centro[g])
+        # O campo só cobre as células até a distância em que estava o Minotauro;
+        # se a perseguição o levou para fora disso, a rota é recalculada.
+        recalcular = novo_destino | (self.campo_patrulha[pos] < 0)
+        if recalcular.any():
+            g = patrulha[recalcular]
+            self.campo_patrulha.reshape(-1, self.n)[g] = -1
+            self._bfs(self.destino[g], self.campo_patrulha, ate=pos[recalcular])
+
+        anda = pos != self.destino[patrulha]
+        g = patrulha[anda]
+        self.m_pos[g] = self._descer(pos[anda], self.campo_patrulha)
+        self.passos_patrulha[g] += 1
+        fim = g[self.passos_patrulha[g] >= PASSOS_PATRULHA]
+        self.passos_patrulha[fim] = 0
+        self.destino[fim] = -1
+
+    def _combates(self, ativos, rodada):
+        """checar_combate_imediato + resolver_encontro. Devolve as partidas que continuam."""
+        diferenca = np.abs(self.m_pos[ativos] - self.e_pos[ativos])
+        encontro = (diferenca == 0) | (diferenca == 1) | (diferenca == self.passo)
+        jogos = ativos[encontro]
+        if not len(jogos):
+            return ativos
+        self.encontro_em[jogos] = np.where(self.encontro_em[jogos] < 0, rodada, self.encontro_em[jogos])
+
+        chance = np.full(len(jogos), 0.01)
+        if self.itens_ativos:
+            chance += (ARMA_POR_CODIGO[self.arma[jogos]] + ARMADURA_POR_CODIGO[self.armadura[jogos]]) / 100
+        chance = np.minimum(chance, 0.99)
+        mortos = jogos[self.rng.random(len(jogos)) >= chance]
+        self.escondido[jogos] = True
+
+        self.status[mortos] = MINOTAURO
+        self.rodadas[mortos] = rodada
+        return ativos[self.status[ativos] == EM_JOGO]
+
+    def _entrantes(self, ativos, rodada):
+        """Entrante.passo para as partidas em `ativos`."""
+        fome = ativos[self.energia[ativos] <= 0]
+        self.status[fome] = FOME
+        self.rodadas[fome] = rodada
+        jogos = ativos[self.energia[ativos] > 0]
+        self.energia[jogos] -= 1
+
+        pos = self.e_pos[jogos]
+        na_saida = pos == self.saida[jogos]
+        self.status[jogos[na_saida]] = ESCAPOU
+        self.rodadas[jogos[na_saida]] = rodada
+        jogos, pos = jogos[~na_saida], pos[~na_saida]
+
+        # DFS: sorteia um vizinho livre não visitado; sem candidatos, volta pela pilha
+        viz = pos[:, None] + self.offsets
+        candidato = (self.celulas[viz] != COD_PAREDE) & ~self.visitado[viz]
+        quantos = candidato.sum(axis=1)
+        avanca = quantos > 0
+
+        g = jogos[avanca]
+        if len(g):
+            cand = candidato[avanca]
+            sorteio = (self.rng.random(len(g)) * quantos[avanca]).astype(np.int64)
+            coluna = np.argmax(cand & (np.cumsum(cand, axis=1) == (sorteio + 1)[:, None]), axis=1)
+            novo = viz[avanca][np.arange(len(g)), coluna]
+
+            self.pilha[g, self.topo[g]] = pos[avanca] - self.base[g]
+            self.topo[g] += 1
+            self.e_pos[g] = novo
+            self.visitado[novo] = True
+            if self.itens_ativos:
+                self._coletar(g, novo)
+
+        g = jogos[~avanca & (self.topo[jogos] > 0)]
+        self.topo[g] -= 1
+        self.e_pos[g] = self.base[g] + self.pilha[g, self.topo[g]]
+
+        salvou = jogos[self.e_pos[jogos] == self.saida[jogos]]
+        self.status[salvou] = ESCAPOU
+        self.rodadas[salvou] = rodada
+
+    def _coletar(self, jogos, celulas):
+        """Entrante.coletar_item para as partidas que pisaram num item."""
+        codigo = self.itens[celulas]
+        item = codigo >= COD_ITEM_BASE
+        if not item.any():
+            return
+        jogos, celulas, codigo = jogos[item], celulas[item], codigo[item]
+        self.energia[jogos] = np.minimum(self.energia_max, self.energia[jogos] + ENERGIA_POR_CODIGO[codigo])
+        arma = ARMA_POR_CODIGO[codigo] > 0
+        self.arma[jogos[arma]] = codigo[arma]
+        armadura = ARMADURA_POR_CODIGO[codigo] > 0
+        self.armadura[jogos[armadura]] = codigo[armadura]
+        self.itens[celulas] = 0
+
+    def ativos(self):
+        return np.flatnonzero(self.status == EM_JOGO)
+
+    def avancar(self):
+        """Executa uma rodada em todas as partidas ainda em jogo. Retorna quantas continuam."""
+        ativos = self.ativos()
+        if not len(ativos):
+            return 0
+        self.rodada += 1
+        rodada = self.rodada
+        self.rodadas[ativos] = rodada
+
+        # Mesma ordem de Jogo.avancar: Minotauro, combate, Entrante
+        self._minotauros(ativos, rodada)
+        ativos = self._combates(ativos, rodada)
+        self._entrantes(ativos, rodada)
+        return int(np.count_nonzero(self.status == EM_JOGO))
+
+    def resultado(self):
+        return ResultadoLote(
+            sementes=self.sementes.copy(),
+            status=self.status.astype(np.int64),
+            rodadas=self.rodadas.copy(),
+            detectado_em=self.detectado_em.copy(),
+            encontro_em=self.encontro_em.copy(),
+            energia_restante=self.energia.copy(),
+        )
+
+
+def simular_lote(sementes, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO, energia_max=500,
+                 quantidade_itens=30, max_rodadas=None, bloco=4096, semente_rng=None):
+    """Simula uma partida por semente, `bloco` partidas por vez, e junta os resultados.
+
+    max_rodadas: limite opcional de rodadas (status "INCOMPLETO" se atingido).
+    bloco: partidas simuladas juntas; a memória de trabalho é de cerca de
+    15 bytes por célula por partida do bloco (ver o início do módulo).
+    """
+    sementes = list(sementes)
+    rng = np.random.default_rng(semente_rng)
+    partes = []
+    for inicio in range(0, len(sementes), bloco):
+        lote = SimuladorLote(sementes[inicio:inicio + bloco], largura, altura, percepcao,
+                             energia_max, quantidade_itens, rng=rng)
+        while lote.avancar():
+            if max_rodadas is not None and lote.rodada >= max_rodadas:
+                break
+        partes.append(lote.resultado())
+    if not partes:
+        vazio = np.zeros(0, dtype=np.int64)
+        return ResultadoLote(vazio, vazio, vazio, vazio, vazio, vazio)
+    return ResultadoLote(*(np.concatenate([getattr(p, campo) for p in partes])
+                           for campo in ResultadoLote.__dataclass_fields__))
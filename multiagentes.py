@@ -0,0 +1,193 @@
+"""Modo com vários agentes: muitos Entrantes e muitos Minotauros no mesmo labirinto.
+
+Com um par Entrante/Minotauro, o jogo faz uma BFS por rodada a partir do
+Entrante. Com N Minotauros e M Entrantes, buscas por par custariam N·M BFS por
+rodada. Aqui cada rodada usa duas BFS de múltiplas origens (bfs_multiorigem),
+ambas limitadas à percepção:
+
+    campo das presas    a partir de todos os Entrantes vivos; cada Minotauro lê
+                        a distância até o Entrante mais próximo, persegue-o
+                        descendo o campo e descobre com quem entra em combate
+    campo das ameaças   a partir de todos os Minotauros ativos; cada Entrante lê
+                        qual Minotauro é a ameaça mais próxima e a que distância
+
+O custo por rodada fica proporcional às células dentro da percepção dos agentes
+(no máximo o tamanho do labirinto), e não ao produto N·M.
+
+Ordem da rodada: todos os Minotauros andam; os combates são resolvidos em lote;
+o campo das ameaças é calculado; todos os Entrantes vivos andam.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from labirinto import (LARGURA, ALTURA, PERCEPCAO, Entrante, Minotauro, CampoDistancias,
+                       gerar_labirinto, espalhar_itens, encontrar_spawn_minotauro, resolver_encontro)
+
+EM_JOGO = "EM JOGO"
+
+
+@dataclass
+class ResultadoMultiagente:
+    """Resultado de uma partida com vários agentes (listas na ordem dos agentes)."""
+    rodadas: int
+    status: List[str]                       # status final de cada Entrante
+    energia_restante: List[int]
+    rodadas_sob_ameaca: List[int]           # rodadas com um Minotauro a até a percepção
+    encontros: List[Tuple[int, int, int, bool]]  # (rodada, minotauro, entrante, sobreviveu)
+    trilhas_entrantes: List[Sequence]
+    trilhas_minotauros: List[Sequence]
+
+
+class JogoMultiagente:
+    """Partida com `entrantes` Entrantes e `minotauros` Minotauros.
+
+    Todos os Entrantes começam na entrada e tentam chegar à saída com a DFS de
+    sempre. O primeiro Minotauro nasce no centro e os demais em células livres
+    sorteadas. A partida termina quando nenhum Entrante está mais em jogo.
+    """
+    def __init__(self, semente=None, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO,
+                 entrantes=4, minotauros=4, energia_max=500, quantidade_itens=30, rng=None):
+        self.rng = rng if rng is not None else random.Random(semente)
+        self.largura = largura
+        self.altura = altura
+        self.percepcao = percepcao
+
+        self.entrada = (1, 1)
+        self.saida = (largura-2, altura-2)
+
+        lab = gerar_labirinto(largura, altura, self.rng)
+        self.itens = espalhar_itens(lab, quantidade=quantidade_itens, rng=self.rng)  # compartilhados
+        self.lab = lab
+
+        self.entrantes = [Entrante(self.entrada, self.saida, lab, energia_max, rng=self.rng, itens=self.itens)
+                          for _ in range(entrantes)]
+
+        excluidos = (lab.indice(*self.entrada), lab.indice(*self.saida))
+        inicios = [encontrar_spawn_minotauro(lab)]
+        for _ in range(minotauros - 1):
+            i = lab.livres().sortear(self.rng, excluidos)
+            inicios.append(inicios[0] if i is None else lab.coord(i))
+        self.minotauros = [Minotauro(inicio, rng=self.rng) for inicio in inicios[:minotauros]]
+
+        self.status = [EM_JOGO] * entrantes
+        self.ameacas = [None] * entrantes  # (minotauro mais próximo, distância) ou None
+        self.rodadas_sob_ameaca = [0] * entrantes
+        self.encontros = []
+        self.rodada = 0
+        self.encerrado = entrantes == 0
+
+    def vivos(self):
+        """Índices dos Entrantes ainda em jogo."""
+        return [k for k, s in enumerate(self.status) if s == EM_JOGO]
+
+    def _combates(self, vivos, campo, rodada):
+        """Resolve em lote os combates dos Minotauros a até 1 aresta de algum Entrante."""
+        por_entrante = {}
+        for m, minotauro in enumerate(self.minotauros):
+            if minotauro.escondido or campo.distancia(minotauro.pos) > 1:
+                continue
+            alvo = vivos[campo.mais_proxima(minotauro.pos)]
+            por_entrante.setdefault(alvo, []).append(m)
+
+        eventos = []
+        for k in sorted(por_entrante):
+            entrante = self.entrantes[k]
+            for m in por_entrante[k]:
+                # Um Entrante já morto não luta de novo; os Minotauros restantes seguem ativos
+                if entrante.morto:
+                    break
+                minotauro = self.minotauros[m]
+                minotauro.alcancado_em = rodada
+                minotauro.escondido = True
+                sobreviveu = resolver_encontro(entrante, self.rng)
+                self.encontros.append((rodada, m, k, sobreviveu))
+                if sobreviveu:
+                    eventos.append((k, "SOBREVIVEU"))
+                else:
+                    entrante.morto = True
+                    self.status[k] = "MORREU PELO MINOTAURO"
+                    eventos.append((k, "MINOTAURO"))
+        return eventos
+
+    def _ameacas(self, vivos):
+        """Ameaça mais próxima de cada Entrante vivo (uma BFS a partir de todos os Minotauros ativos)."""
+        ativos = [m for m, minotauro in enumerate(self.minotauros) if not minotauro.escondido]
+        for k in range(len(self.ameacas)):
+            self.ameacas[k] = None
+        if not ativos:
+            return
+        campo = CampoDistancias.de_origens([self.minotauros[m].pos for m in ativos],
+                                           self.lab, self.percepcao)
+        for k in vivos:
+            pos = self.entrantes[k].pos
+            d = campo.distancia(pos)
+            if d <= self.percepcao:
+                self.ameacas[k] = (ativos[campo.mais_proxima(pos)], d)
+                self.rodadas_sob_ameaca[k] += 1
+
+    def avancar(self):
+        """Executa uma rodada para todos os agentes.
+
+        Retorna a lista de eventos da rodada, pares (entrante, evento) com os
+        mesmos eventos de Jogo.avancar: "SOBREVIVEU", "MINOTAURO", "FOME" ou "ESCAPOU".
+        """
+        if self.encerrado:
+            return []
+
+        self.rodada += 1
+        rodada = self.rodada
+        lab = self.lab
+        vivos = self.vivos()
+
+        # 1. MINOTAUROS SE MOVEM, todos pelo mesmo campo até o Entrante mais próximo
+        campo = CampoDistancias.de_origens([self.entrantes[k].pos for k in vivos],
+                                           lab, max(self.percepcao, 1))
+        for minotauro in self.minotauros:
+            minotauro.passo(None, lab, self.percepcao, rodada, campo)
+
+        # 2. COMBATES EM LOTE (os Entrantes ainda não andaram, o campo continua válido)
+        eventos = self._combates(vivos, campo, rodada)
+        vivos = [k for k in vivos if self.status[k] == EM_JOGO]
+
+        # 3. AMEAÇA MAIS PRÓXIMA DE CADA ENTRANTE
+        self._ameacas(vivos)
+
+        # 4. ENTRANTES SE MOVEM
+        for k in vivos:
+            _, salvou, morreu_fome = self.entrantes[k].passo()
+            if morreu_fome:
+                self.status[k] = "MORREU DE FOME"
+                eventos.append((k, "FOME"))
+            elif salvou:
+                self.status[k] = "ESCAPOU"
+                eventos.append((k, "ESCAPOU"))
+
+        self.encerrado = EM_JOGO not in self.status
+        return eventos
+
+    def resultado(self):
+        """Resumo da partida no formato ResultadoMultiagente."""
+        return ResultadoMultiagente(
+            rodadas=self.rodada,
+            status=list(self.status),
+            energia_restante=[e.energia for e in self.entrantes],
+            rodadas_sob_ameaca=list(self.rodadas_sob_ameaca),
+            encontros=list(self.encontros),
+            trilhas_entrantes=[e.trilha_final for e in self.entrantes],
+            trilhas_minotauros=[m.caminho_perseguicao for m in self.minotauros],
+        )
+
+
+def jogar_multiagente(semente=None, largura=LARGURA, altura=ALTURA, percepcao=PERCEPCAO,
+                      entrantes=4, minotauros=4, energia_max=500, quantidade_itens=30,
+                      max_rodadas: Optional[int] = None):
+    """Executa uma partida com vários agentes sem terminal (ver jogar)."""
+    jogo = JogoMultiagente(semente, largura, altura, percepcao, entrantes, minotauros,
+                           energia_max, quantidade_itens)
+    while not jogo.encerrado:
+        if max_rodadas is not None and jogo.rodada >= max_rodadas:
+            break
+        jogo.avancar()
+    return jogo.resultado()
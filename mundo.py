@@ -0,0 +1,317 @@
+"""Labirinto infinito gerado sob demanda em chunks, com despejo LRU.
+
+O mundo é dividido em chunks de `tamanho` x `tamanho` células (tamanho par).
+Cada chunk é gerado no primeiro acesso, só a partir de (semente do mundo,
+coordenada do chunk): um labirinto perfeito de Eller (eller.linhas_eller, sem
+o disco do centro) com as células nas coordenadas ímpares, como no
+gerar_labirinto. A linha 0 e a coluna 0 de cada chunk são a fronteira com os
+chunks de cima e da esquerda; cada chunk abre uma passagem em cada uma delas.
+Assim todo chunk fica ligado aos quatro vizinhos (as passagens de baixo e da
+direita são abertas pelos vizinhos) e o mundo inteiro é conexo, sem que gerar
+um chunk dependa de outro.
+
+Só `limite_chunks` chunks ficam em memória; o menos usado recentemente é
+descartado e, se for visitado de novo, é gerado outra vez, idêntico. As
+alterações de terreno (`definir`) e os itens já coletados ficam guardados à
+parte e são reaplicados na regeneração. Essa memória também é limitada: guarda
+o estado de até `limite_lembrados` chunks e esquece o do chunk visitado há mais
+tempo (que, se regenerado depois, volta ao original).
+
+Os itens de cada chunk são sorteados junto com ele e ficam fora do terreno, em
+`mundo.itens` (mesma interface de consulta e remoção da CamadaItens, itens.py).
+
+O MundoInfinito tem a mesma interface de acesso da Grade usada pelas buscas e
+pelos agentes: índices planos, `celulas[i]`, `offsets`, `indice`/`coord`,
+`vizinhos`, `mascara_vizinhos` e `livres().sortear`. O índice plano é
+y * 2**32 + x, então vizinhos continuam a ±1 e ±passo e as coordenadas podem
+ser negativas (|x|, |y| < 2**30). Funcionam vizinhos_livres, caminho_minimo
+(estratégias "bfs" e "bidirecional"; sobre "alt" e "arvore", ver
+caminhos.py), CampoDistancias com raio, Entrante e Minotauro.
+
+    from mundo import jogar_infinito
+    r = jogar_infinito(semente=1, max_rodadas=100000, energia_max=2000)
+"""
+
+import random
+from collections import OrderedDict
+
+from grade import BaseGrade, COD_PAREDE, COD_CAMINHO
+from eller import linhas_eller
+from caminhos import bfs_limitada
+import labirinto
+from labirinto import Jogo, ITENS, CODIGO_ITEM, PERCEPCAO
+
+TAMANHO_CHUNK = 32
+LIMITE_CHUNKS = 256  # ~256 KB com chunks de 32x32
+LIMITE_LEMBRADOS = 16384  # chunks com alterações, coletas e estatística lembradas
+
+_PASSO = 1 << 32
+_META = 1 << 31
+
+
+def _lembrar(lembrados, chave, limite, novo):
+    """Valor de `chave` (criado com novo() se faltar), marcado como o mais recente; esquece o mais antigo além de `limite`."""
+    valor = lembrados.get(chave)
+    if valor is None:
+        valor = lembrados[chave] = novo()
+        if len(lembrados) > limite:
+            lembrados.popitem(last=False)
+    else:
+        lembrados.move_to_end(chave)
+    return valor
+
+
+class _CelulasMundo:
+    """Visão `celulas[i]` do mundo: lê e escreve códigos por índice plano, gerando chunks sob demanda."""
+    __slots__ = ("mundo",)
+
+    def __init__(self, mundo):
+        self.mundo = mundo
+
+    def __getitem__(self, i):
+        y = (i + _META) >> 32
+        x = i - (y << 32)
+        mundo = self.mundo
+        t = mundo.tamanho
+        chave = (x // t, y // t)
+        ultimo = mundo._ultimo
+        dados = ultimo[1] if ultimo is not None and ultimo[0] == chave else mundo.chunk(*chave)
+        return dados[(y % t) * t + x % t]
+
+    def __setitem__(self, i, codigo):
+        y = (i + _META) >> 32
+        self.mundo.definir(i - (y << 32), y, codigo)
+
+
+class _LivresMundo:
+    """Sorteio de células livres do mundo, restrito aos chunks em volta de uma referência.
+
+    O Minotauro chama sortear(rng, (posição, centro)); o destino de patrulha
+    sai dos chunks a até `raio` chunks do último índice excluído (o centro de
+    patrulha), ou da origem do mundo se não houver exclusões.
+    """
+    __slots__ = ("mundo", "raio")
+
+    def __init__(self, mundo, raio=1):
+        self.mundo = mundo
+        self.raio = raio
+
+    def sortear(self, rng, excluir=()):
+        mundo = self.mundo
+        t = mundo.tamanho
+        x, y = mundo.coord(excluir[-1]) if excluir else (1, 1)
+        cx, cy = x // t, y // t
+        while True:
+            ox = (cx + rng.randint(-self.raio, self.raio)) * t
+            oy = (cy + rng.randint(-self.raio, self.raio)) * t
+            i = mundo.indice(ox + rng.randrange(t), oy + rng.randrange(t))
+            if mundo.livre(i) and i not in excluir:
+                return i
+
+
+class _ItensMundo:
+    """Camada de itens do mundo: os itens de cada chunk, com remoção O(1) e coletas persistentes."""
+    __slots__ = ("mundo",)
+
+    def __init__(self, mundo):
+        self.mundo = mundo
+
+    def _local(self, i):
+        mundo = self.mundo
+        x, y = mundo.coord(i)
+        t = mundo.tamanho
+        chave = (x // t, y // t)
+        mundo.chunk(*chave)
+        return mundo._itens_chunks[chave], chave, (y % t) * t + x % t
+
+    def __contains__(self, i):
+        itens, _, local = self._local(i)
+        return local in itens
+
+    def obter(self, i):
+        """Código do item em i (None se não houver)."""
+        itens, _, local = self._local(i)
+        return itens.get(local)
+
+    def remover(self, i):
+        """Remove e retorna o código do item em i (None se não houver); a coleta vale também após o despejo."""
+        itens, chave, local = self._local(i)
+        codigo = itens.pop(local, None)
+        if codigo is not None:
+            mundo = self.mundo
+            _lembrar(mundo.coletados, chave, mundo.limite_lembrados, set).add(local)
+        return codigo
+
+    def ao_alcance(self, origem, k):
+        """Itens a até k passos de `origem`, como [(distância, índice, código)] em ordem."""
+        resultado = []
+        for i, d in bfs_limitada(origem, self.mundo, k).items():
+            codigo = self.obter(i)
+            if codigo is not None:
+                resultado.append((d, i, codigo))
+        return sorted(resultado)
+
+
+class MundoInfinito(BaseGrade):
+    """Labirinto sem bordas, gerado em chunks determinísticos e mantido num cache LRU."""
+    pre_calculo = False  # ver caminhos.buscar
+
+    def __init__(self, semente=0, tamanho=TAMANHO_CHUNK, limite_chunks=LIMITE_CHUNKS, itens_por_chunk=0,
+                 raio_patrulha=1, limite_lembrados=LIMITE_LEMBRADOS):
+        if tamanho < 2 or tamanho % 2:
+            raise ValueError(f"O tamanho do chunk deve ser par e >= 2 (recebido {tamanho}).")
+        self.semente = semente
+        self.tamanho = tamanho
+        self.limite_chunks = max(limite_chunks, 1)
+        self.limite_lembrados = max(limite_lembrados, 1)
+        self.itens_por_chunk = itens_por_chunk
+        self._definir_passo(_PASSO)
+        self.versao = 0
+        self.celulas = _CelulasMundo(self)
+        self._livres = _LivresMundo(self, raio_patrulha)
+
+        self._chunks = OrderedDict()  # (cx, cy) -> bytearray tamanho*tamanho, do menos ao mais recente
+        self._itens_chunks = {}       # (cx, cy) -> {posição local: código do item}, dos chunks em memória
+        self._ultimo = None           # (chave, dados) do último chunk acessado
+        # Sobrevivem ao despejo (LRU de até limite_lembrados chunks cada):
+        self.alteracoes = OrderedDict()  # (cx, cy) -> {posição local: código}
+        self.coletados = OrderedDict()   # (cx, cy) -> {posições locais de itens coletados}
+        self.itens = _ItensMundo(self)
+
+        # Estatísticas do cache
+        self.geracoes = 0
+        self.regeneracoes = 0
+        self.despejos = 0
+        self._ja_gerados = OrderedDict()  # (cx, cy) -> True, para contar regenerações
+
+    # --- Chunks ---
+    def chunk(self, cx, cy):
+        """Códigos do chunk (cx, cy) (bytearray linha a linha), gerando-o se não estiver no cache."""
+        chave = (cx, cy)
+        ultimo = self._ultimo
+        if ultimo is not None and ultimo[0] == chave:
+            return ultimo[1]
+        dados = self._chunks.get(chave)
+        if dados is None:
+            dados, itens = self._gerar_chunk(cx, cy)
+            self._chunks[chave] = dados
+            self._itens_chunks[chave] = itens
+            if len(self._chunks) > self.limite_chunks:
+                despejado, _ = self._chunks.popitem(last=False)
+                del self._itens_chunks[despejado]
+                self.despejos += 1
+        else:
+            self._chunks.move_to_end(chave)
+        self._ultimo = (chave, dados)
+        return dados
+
+    def _gerar_chunk(self, cx, cy):
+        t = self.tamanho
+        rng = random.Random(f"{self.semente}:{cx}:{cy}")
+        dados = bytearray(t * t)
+        # Eller em (t+1) x (t+1) e corte da moldura de baixo e da direita:
+        # células nas posições locais ímpares, linha 0 e coluna 0 de parede
+        for y, linha in enumerate(linhas_eller(t + 1, t + 1, rng, disco=False)):
+            if y == t:
+                break
+            dados[y * t:(y + 1) * t] = linha[:t]
+
+        # Passagens para o chunk de cima (linha 0) e para o da esquerda (coluna 0)
+        dados[rng.randrange(t // 2) * 2 + 1] = COD_CAMINHO
+        dados[(rng.randrange(t // 2) * 2 + 1) * t] = COD_CAMINHO
+
+        # Itens nas células (posições locais ímpares, sempre caminho), fora da entrada do mundo
+        itens = {}
+        if labirinto.ITENS_ATIVOS:
+            for _ in range(self.itens_por_chunk):
+                local = (rng.randrange(t // 2) * 2 + 1) * t + rng.randrange(t // 2) * 2 + 1
+                if local not in itens and not (cx == cy == 0 and local == t + 1):
+                    itens[local] = CODIGO_ITEM[rng.choice(ITENS)]
+        chave = (cx, cy)
+        if chave in self.coletados:
+            self.coletados.move_to_end(chave)
+            for local in self.coletados[chave]:
+                itens.pop(local, None)
+
+        if chave in self.alteracoes:
+            self.alteracoes.move_to_end(chave)
+            for local, codigo in self.alteracoes[chave].items():
+                dados[local] = codigo
+
+        self.geracoes += 1
+        if chave in self._ja_gerados:
+            self.regeneracoes += 1
+        _lembrar(self._ja_gerados, chave, self.limite_lembrados, lambda: True)
+        return dados, itens
+
+    def carregados(self):
+        """Número de chunks em memória."""
+        return len(self._chunks)
+
+    # --- Interface da Grade (o resto vem de BaseGrade) ---
+    def indice(self, x, y):
+        """Índice plano da célula (x, y)."""
+        return y * _PASSO + x
+
+    def coord(self, i):
+        """Coordenada (x, y) de um índice plano."""
+        y = (i + _META) >> 32
+        return (i - (y << 32), y)
+
+    def dentro(self, x, y):
+        return True
+
+    def celula(self, x, y):
+        """Código da célula (x, y)."""
+        t = self.tamanho
+        return self.chunk(x // t, y // t)[(y % t) * t + x % t]
+
+    def definir(self, x, y, codigo):
+        """Altera o código da célula (x, y); a alteração vale também depois de o chunk ser regenerado."""
+        t = self.tamanho
+        cx, cy = x // t, y // t
+        local = (y % t) * t + x % t
+        dados = self.chunk(cx, cy)
+        antes = dados[local]
+        dados[local] = codigo
+        _lembrar(self.alteracoes, (cx, cy), self.limite_lembrados, dict)[local] = codigo
+        if (antes == COD_PAREDE) != (codigo == COD_PAREDE):
+            self.versao += 1
+
+    def __getstate__(self):
+        # Os chunks em cache são refeitos sob demanda; só as alterações vão para instantâneos
+        estado = self.__dict__.copy()
+        estado["_chunks"] = OrderedDict()
+        estado["_itens_chunks"] = {}
+        estado["_ultimo"] = None
+        return estado
+
+
+class JogoInfinito(Jogo):
+    """Partida no MundoInfinito, com as mesmas regras e rodadas de Jogo.
+
+    O Entrante sai de (1, 1) rumo a `saida` (por padrão, longe o bastante
+    para a partida só acabar por fome ou pelo Minotauro) e o Minotauro nasce
+    no meio do chunk (0, 0).
+    """
+    def __init__(self, semente=None, saida=(1_000_001, 1_000_001), percepcao=PERCEPCAO, energia_max=500,
+                 itens_por_chunk=4, tamanho_chunk=TAMANHO_CHUNK, limite_chunks=LIMITE_CHUNKS, rng=None,
+                 instrumentar=False):
+        self._parametros_mundo = (saida, tamanho_chunk, limite_chunks, itens_por_chunk)
+        super().__init__(semente, None, None, percepcao, energia_max, 0, rng, instrumentar)
+
+    def _montar(self, quantidade_itens):
+        saida, tamanho, limite, itens = self._parametros_mundo
+        mundo = MundoInfinito(self.rng.randrange(2**32), tamanho, limite, itens)
+        centro = tamanho // 2 | 1
+        return mundo, mundo.itens, saida, (centro, centro)
+
+
+def jogar_infinito(semente=None, max_rodadas=None, **opcoes):
+    """Joga uma partida no mundo infinito até o fim (ou até `max_rodadas`) e devolve (ResultadoJogo, mundo)."""
+    jogo = JogoInfinito(semente, **opcoes)
+    while not jogo.encerrado:
+        if max_rodadas is not None and jogo.rodada >= max_rodadas:
+            break
+        jogo.avancar()
+    return jogo.resultado(), jogo.lab
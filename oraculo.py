@@ -0,0 +1,228 @@
+"""Oráculo de distâncias que aproveita a árvore geradora do Prim.
+
+Fora do disco livre do centro, o labirinto gerado por gerar_labirinto é uma
+floresta: o Prim produz uma árvore, e abrir o disco só remove células dela.
+Entre duas células da mesma componente da floresta o caminho é único, e a
+distância sai de um LCA (ancestral comum mais baixo) em O(log n).
+
+O disco é ortogonalmente convexo (toda linha e toda coluna dele é contígua),
+então dentro dele a distância entre duas células é a distância de Manhattan. Um
+caminho mínimo que passa pelo disco entra por um "portal" (célula da floresta
+vizinha ao disco), atravessa o disco em linha de Manhattan e sai por outro
+portal. Como o disco dá atalhos de Manhattan entre quaisquer dois pontos seus,
+sair e entrar de novo nunca encurta o caminho.
+
+    d(u, v) = min( d_arvore(u, v)                         se mesma componente,
+                   min_{p, q} d_arvore(u, p) + 1 + |p' - q'| + 1 + d_arvore(q, v) )
+
+onde p' e q' são as células do disco vizinhas aos portais p e q. O custo por
+consulta é O(log n) mais o número de pares de portais das duas componentes
+envolvidas (que cresce só com o perímetro do disco), sem nenhuma BFS.
+
+O LCA usa ponteiros de salto (jump pointers) de Myers: cada célula guarda só o
+pai e um salto, com memória O(n) e subida em O(log n).
+"""
+
+import math
+from collections import deque
+from array import array
+
+from grade import COD_PAREDE, centro_livre, celulas_do_disco
+
+
+class OraculoArvore:
+    """Distâncias e caminhos mínimos exatos via árvore do Prim + correção do disco central.
+
+    Levanta ValueError se, fora do disco, o labirinto tiver algum ciclo (por
+    exemplo, dimensões pares, em que a saída forçada pode fechar um ciclo).
+    """
+
+    def __init__(self, grade, disco=None):
+        # Só o que as consultas leem da grade (sem guardar a grade: o cache de caminhos.py é fraco nela)
+        self.celulas = celulas = grade.celulas
+        self.offsets = offsets = grade.offsets
+        self.passo = passo = grade.passo
+        self.versao = grade.versao
+        n = len(celulas)
+
+        if disco is None:
+            disco = centro_livre(grade.largura, grade.altura)
+        cx, cy, self.raio = disco
+        # Centro nas coordenadas do índice plano (com a moldura sentinela)
+        self.centro = (cx + 1, cy + 1)
+        no_disco = bytearray(n)
+        for x, y in celulas_do_disco(grade.largura, grade.altura, *disco):
+            i = grade.indice(x, y)
+            if celulas[i] != COD_PAREDE:
+                no_disco[i] = 1
+        self.no_disco = no_disco
+
+        pai = array("i", [-1]) * n
+        salto = array("i", [-1]) * n
+        prof = array("i", [-1]) * n
+        comp = array("i", [-1]) * n
+        portais = {}  # raiz da componente -> [(portal, célula do disco, x, y)]
+
+        for y in range(grade.altura):
+            for raiz in grade.indices_linha(y):
+                if celulas[raiz] == COD_PAREDE or no_disco[raiz] or prof[raiz] >= 0:
+                    continue
+                pai[raiz] = salto[raiz] = raiz
+                prof[raiz] = 0
+                lista = []
+                fila = deque([raiz])
+                while fila:
+                    v = fila.popleft()
+                    comp[v] = raiz
+                    for o in offsets:
+                        w = v + o
+                        if celulas[w] == COD_PAREDE:
+                            continue
+                        if no_disco[w]:
+                            wy, wx = divmod(w, passo)
+                            lista.append((v, w, wx, wy))
+                        elif prof[w] < 0:
+                            pai[w] = v
+                            prof[w] = prof[v] + 1
+                            j = salto[v]
+                            if prof[v] - prof[j] == prof[j] - prof[salto[j]]:
+                                salto[w] = salto[j]
+                            else:
+                                salto[w] = v
+                            fila.append(w)
+                        elif w != pai[v]:
+                            raise ValueError("O labirinto tem ciclos fora do centro livre; o oráculo de árvore não se aplica.")
+                if lista:
+                    portais[raiz] = lista
+
+        self.pai = pai
+        self.salto = salto
+        self.prof = prof
+        self.comp = comp
+        self.portais = portais
+
+    # --- LCA ---
+    def _ancestral(self, v, d):
+        """Ancestral de v na profundidade d."""
+        prof, salto, pai = self.prof, self.salto, self.pai
+        while prof[v] > d:
+            s = salto[v]
+            v = s if prof[s] >= d else pai[v]
+        return v
+
+    def distancia_arvore(self, u, v):
+        """Distância entre u e v na floresta (ambos fora do disco e na mesma componente)."""
+        prof, salto, pai = self.prof, self.salto, self.pai
+        pu, pv = prof[u], prof[v]
+        if pu > pv:
+            u = self._ancestral(u, pv)
+        elif pv > pu:
+            v = self._ancestral(v, pu)
+        while u != v:
+            if salto[u] != salto[v]:
+                u, v = salto[u], salto[v]
+            else:
+                u, v = pai[u], pai[v]
+        return pu + pv - 2 * prof[u]
+
+    def _longe_do_disco(self, i):
+        """Limite inferior para a distância de i até o disco (distância euclidiana à borda)."""
+        y, x = divmod(i, self.passo)
+        d = math.hypot(x - self.centro[0], y - self.centro[1]) - self.raio
+        return d if d > 0 else 0
+
+    def _entradas(self, i):
+        """Células do disco pelas quais i pode entrar nele, com o custo para chegar até elas."""
+        if self.no_disco[i]:
+            y, x = divmod(i, self.passo)
+            return [(0, x, y)]
+        lista = self.portais.get(self.comp[i])
+        if not lista:
+            return []
+        return [(self.distancia_arvore(i, p) + 1, x, y) for p, _, x, y in lista]
+
+    def caminho_arvore(self, u, v):
+        """Caminho único entre u e v na floresta."""
+        prof, pai = self.prof, self.pai
+        ida, volta = [u], [v]
+        while prof[u] > prof[v]:
+            u = pai[u]
+            ida.append(u)
+        while prof[v] > prof[u]:
+            v = pai[v]
+            volta.append(v)
+        while u != v:
+            u, v = pai[u], pai[v]
+            ida.append(u)
+            volta.append(v)
+        volta.pop()
+        ida.extend(reversed(volta))
+        return ida
+
+    # --- Consultas ---
+    def _distancias(self, i, j):
+        """(distância só pela floresta, distância passando pelo disco); inf quando não há."""
+        inf = float('inf')
+        no_disco = self.no_disco
+        arvore = inf
+        if not no_disco[i] and not no_disco[j] and self.comp[i] == self.comp[j]:
+            arvore = self.distancia_arvore(i, j)
+            if self._longe_do_disco(i) + self._longe_do_disco(j) > arvore:
+                return arvore, inf
+
+        # Atalhos pelo disco, com as entradas em ordem de custo para poder parar
+        # cedo (empates com a floresta contam: o caminho deixa de ser único)
+        disco = inf
+        entradas_j = sorted(self._entradas(j))
+        if entradas_j:
+            minimo_j = entradas_j[0][0]
+            for ci, xi, yi in sorted(self._entradas(i)):
+                limite = arvore if arvore < disco else disco
+                if ci + minimo_j > limite:
+                    break
+                for cj, xj, yj in entradas_j:
+                    if ci + cj > limite:
+                        break
+                    c = ci + cj + abs(xi - xj) + abs(yi - yj)
+                    if c < disco:
+                        disco = c
+                        if c < limite:
+                            limite = c
+        return arvore, disco
+
+    def distancia(self, i, j):
+        """Distância exata entre os índices planos i e j (inf se não houver caminho)."""
+        if i == j:
+            return 0
+        celulas = self.celulas
+        if celulas[i] == COD_PAREDE or celulas[j] == COD_PAREDE:
+            return float('inf')
+        return min(self._distancias(i, j))
+
+    def caminho(self, i, j):
+        """Caminho mínimo de i até j (índices planos), o mesmo que a BFS devolveria.
+
+        Enquanto houver atalho pelo disco, anda para o primeiro vizinho (na ordem
+        de grade.offsets) que diminui a distância até j. Quando o caminho só pela
+        floresta for estritamente o mais curto, ele é único e é copiado direto.
+        """
+        restante = self.distancia(i, j)
+        if restante == float('inf'):
+            return []
+        celulas = self.celulas
+        offsets = self.offsets
+        path = [i]
+        atual = i
+        while restante > 0:
+            arvore, disco = self._distancias(atual, j)
+            if arvore < disco:
+                path.extend(self.caminho_arvore(atual, j)[1:])
+                return path
+            restante -= 1
+            for o in offsets:
+                w = atual + o
+                if celulas[w] != COD_PAREDE and self.distancia(w, j) == restante:
+                    atual = w
+                    break
+            path.append(atual)
+        return path
@@ -1,120 +1,127 @@
-import random
-import math
-import time
-
-# --- Configurações ---
-LARGURA = 31
-ALTURA = 31
-# Definições de estados para a animação
-PAREDE = "🔳"
-CAMINHO = "⬜"
-ENTRADA = "🟩"
-SAIDA = "❎"
-PAREDE_EM_PROCESSAMENTO = "🟨"
-CAMINHO_RECENTE = "🟦"
-
-# --- Funções de Impressão ---
-def imprimir(matriz, x_proc=None, y_proc=None, delay=0.01):
-    """
-    Imprime o labirinto.
-    x_proc, y_proc: Coordenadas da célula que está sendo processada para destaque.
-    """
-    print("\033c", end="") 
-    
-    largura_celula = 1
-    for y in range(len(matriz)):
-        linha = ""
-        for x in range(len(matriz[0])):
-
-            celula = matriz[y][x]
-            
-            if (x == x_proc and y == y_proc):
-                celula = PAREDE_EM_PROCESSAMENTO
-            elif (x, y) == (1, 1):
-                celula = ENTRADA
-            elif (x, y) == (len(matriz[0])-2, len(matriz)-2):
-                celula = SAIDA
-
-            linha += f"{celula}" 
-        print(linha)
-    
-    time.sleep(delay)
-
-# --- Gera labirinto (Modificada para animação) ---
-def gerar_labirinto(largura, altura):
-    """Gera um labirinto usando o algoritmo de Prim modificado com um centro livre e animação."""
-    print("Iniciando geração animada...")
-    
-    # --- Inicializa matriz com paredes ---
-    matriz = [[PAREDE for _ in range(largura)] for _ in range(altura)]
-    visitado = [[False for _ in range(largura)] for _ in range(altura)]
-
-    start_x, start_y = 1, 1
-    matriz[start_y][start_x] = CAMINHO
-    visitado[start_y][start_x] = True
-    imprimir(matriz, delay=0.1)
-
-    paredes = []
-    for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        nx, ny = start_x+dx, start_y+dy
-        if 0 <= nx < largura and 0 <= ny < altura and not visitado[ny][nx]:
-            paredes.append((nx, ny))
-
-
-    # --- Loop do Prim (Com Animação) ---
-    while paredes:
-        idx = random.randrange(len(paredes))
-        x, y = paredes[idx]
-        
-        imprimir(matriz, x_proc=x, y_proc=y, delay=0.01)
-
-        vizinhos_conectados = []
-        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < largura and 0 <= ny < altura and visitado[ny][nx]:
-                vizinhos_conectados.append((nx, ny))
-
-        if vizinhos_conectados:
-            nx, ny = random.choice(vizinhos_conectados)
-
-            px, py = (x+nx)//2, (y+ny)//2
-            matriz[py][px] = CAMINHO_RECENTE
-
-            matriz[y][x] = CAMINHO_RECENTE
-            visitado[y][x] = True
-
-            imprimir(matriz, delay=0.05)
-            
-            matriz[py][px] = CAMINHO
-            matriz[y][x] = CAMINHO
-            imprimir(matriz, delay=0.01)
-
-
-            for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                nnx, nny = x+dx, y+dy
-                if 0 <= nnx < largura and 0 <= nny < altura and not visitado[nny][nnx] and (nnx, nny) not in paredes:
-                    paredes.append((nnx, nny))
-
-        paredes.pop(idx)
-
-    # --- Cria centro livre (Após o Prim) ---
-    cx, cy = largura // 2, altura // 2
-    total = largura * altura
-    area_livre = math.ceil(total * 0.05)
-    raio = int(math.sqrt(area_livre / math.pi))
-
-    for y in range(cy - raio, cy + raio + 1):
-        for x in range(cx - raio, cx + raio + 1):
-            if 0 <= x < largura and 0 <= y < altura:
-                if (x - cx) ** 2 + (y - cy) ** 2 <= raio ** 2:
-                    matriz[y][x] = CAMINHO
-
-    matriz[altura-2][largura-2] = CAMINHO
-    
-    imprimir(matriz) 
-
-    return matriz
-
-# --- Execução Principal ---
-labirinto = gerar_labirinto(LARGURA, ALTURA)
-print("Labirinto gerado!")
\ No newline at end of file
+"""Depurador visual da geração do labirinto (Prim), animado no terminal.
+
+Não tem uma cópia própria do algoritmo: consome os eventos de
+labirinto.passos_geracao (fronteira sorteada, célula cavada, centro aberto,
+saída), o mesmo gerador que gerar_labirinto roda sem eventos. Os eventos
+atualizam um buffer de glifos; o desenho é por diferença (RenderizadorANSI) e
+limitado a `fps` quadros por segundo, e os eventos que chegam entre dois
+quadros só acumulam as células alteradas. Com `duracao`, os eventos são
+espaçados para a animação durar cerca desse tempo, qualquer que seja o tamanho;
+sem ela, a animação anda o mais rápido possível.
+
+    python prim_debug.py 31 31 --duracao 10
+    python prim_debug.py 401 201 --semente 7 --passos-por-quadro 50
+"""
+
+import argparse
+import random
+import time
+
+from labirinto import passos_geracao, EVENTO_FRONTEIRA, EVENTO_CAVAR
+from renderizador import RenderizadorANSI
+
+# --- Configurações ---
+LARGURA = 31
+ALTURA = 31
+FPS = 30
+DURACAO = 10.0  # segundos de animação (padrão da linha de comando)
+# Definições de estados para a animação
+PAREDE = "🔳"
+CAMINHO = "⬜"
+ENTRADA = "🟩"
+SAIDA = "❎"
+PAREDE_EM_PROCESSAMENTO = "🟨"
+CAMINHO_RECENTE = "🟦"
+
+
+def animar(largura, altura, rng=random, fps=FPS, passos_por_quadro=1, duracao=None, saida=None):
+    """Anima a geração e retorna a Grade gerada (a mesma de gerar_labirinto com o mesmo rng).
+
+    fps: limite de quadros por segundo (os eventos entre dois quadros são acumulados).
+    passos_por_quadro: só tenta desenhar a cada tantos eventos.
+    duracao: duração aproximada da animação em segundos (None = sem pausas).
+    """
+    # Cada célula do Prim gera um sorteio de fronteira e dois eventos de cavar
+    total_estimado = 3 * max((largura - 1) // 2, 1) * max((altura - 1) // 2, 1)
+    por_evento = duracao / total_estimado if duracao else 0.0
+    tela = RenderizadorANSI(largura, altura, saida=saida, fps_max=fps)
+    caminho = bytearray(largura * altura)  # 1 = já é caminho
+    recentes = set()   # cavadas desde o último quadro desenhado
+    processando = [None]
+
+    def glifo(x, y):
+        if (x, y) == processando[0]:
+            return PAREDE_EM_PROCESSAMENTO
+        if (x, y) == (1, 1):
+            return ENTRADA
+        if (x, y) == (largura-2, altura-2):
+            return SAIDA
+        if (x, y) in recentes:
+            return CAMINHO_RECENTE
+        return CAMINHO if caminho[y * largura + x] else PAREDE
+
+    print("Iniciando geração animada...")
+    tela.quadro_completo(glifo, forcar=True)
+
+    passos = passos_geracao(largura, altura, rng)
+    alteradas = []
+    eventos = 0
+    inicio = time.perf_counter()
+    while True:
+        try:
+            tipo, x, y = next(passos)
+        except StopIteration as fim:
+            grade = fim.value
+            break
+
+        if tipo == EVENTO_FRONTEIRA:
+            if processando[0] is not None:
+                alteradas.append(processando[0])
+            processando[0] = (x, y)
+        else:
+            caminho[y * largura + x] = 1
+            if tipo == EVENTO_CAVAR:
+                recentes.add((x, y))
+        alteradas.append((x, y))
+
+        eventos += 1
+        if eventos % passos_por_quadro == 0:
+            if por_evento:
+                adiantado = eventos * por_evento - (time.perf_counter() - inicio)
+                if adiantado > 0:
+                    time.sleep(adiantado)
+            # Quadros descartados pelo fps deixam as células pendentes no renderizador
+            if tela.atualizar(alteradas, glifo):
+                # As recentes deste quadro voltam à cor normal no próximo
+                alteradas = list(recentes)
+                recentes.clear()
+            else:
+                alteradas = []
+
+    if processando[0] is not None:
+        alteradas.append(processando[0])
+        processando[0] = None
+    alteradas.extend(recentes)
+    recentes.clear()
+    tela.atualizar(alteradas, glifo, forcar=True)
+    tela.fechar()
+    return grade
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Anima a geração do labirinto (Prim) no terminal.")
+    parser.add_argument("largura", type=int, nargs="?", default=LARGURA)
+    parser.add_argument("altura", type=int, nargs="?", default=ALTURA)
+    parser.add_argument("--semente", type=int, default=None)
+    parser.add_argument("--fps", type=float, default=FPS)
+    parser.add_argument("--passos-por-quadro", type=int, default=1)
+    parser.add_argument("--duracao", type=float, default=DURACAO, help="duração aproximada (s); 0 = sem pausas")
+    args = parser.parse_args(argumentos)
+
+    animar(args.largura, args.altura, random.Random(args.semente), args.fps,
+           max(args.passos_por_quadro, 1), args.duracao or None)
+    print("Labirinto gerado!")
+
+
+if __name__ == "__main__":
+    main()
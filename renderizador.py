@@ -0,0 +1,118 @@
+"""Renderizador de terminal por diferença (ANSI).
+
+Guarda o último quadro desenhado e, a cada novo quadro, escreve só as células
+que mudaram, posicionando o cursor com sequências ANSI. Tudo vai numa única
+escrita por quadro, sem limpar a tela e sem subprocessos.
+"""
+
+import sys
+import time
+
+CSI = "\033["
+
+
+class RenderizadorANSI:
+    """Desenha uma grade de glifos largura x altura no terminal, por diferença.
+
+    glifo(x, y) -> str é fornecido pelo chamador a cada quadro.
+    largura_celula: colunas do terminal ocupadas por célula (emojis ocupam 2).
+    fps_max: se informado, quadros que chegam antes de 1/fps_max segundos do
+    anterior são descartados (as células alteradas ficam pendentes para o
+    próximo quadro desenhado).
+    """
+
+    def __init__(self, largura, altura, saida=None, fps_max=None, largura_celula=2):
+        self.largura = largura
+        self.altura = altura
+        self.saida = saida if saida is not None else sys.stdout
+        self.intervalo = 1.0 / fps_max if fps_max else 0.0
+        self.largura_celula = largura_celula
+        self.anterior = None
+        self.pendentes = set()
+        self.ultimo_quadro = 0.0
+        self.rodape_anterior = []
+
+    def _pode_desenhar(self, forcar):
+        if forcar or not self.intervalo:
+            return True
+        return time.perf_counter() - self.ultimo_quadro >= self.intervalo
+
+    def _cursor(self, x, y):
+        return f"{CSI}{y + 1};{x * self.largura_celula + 1}H"
+
+    def _escrever(self, partes, rodape):
+        if rodape is not None:
+            linha = self.altura + 2
+            for k, texto in enumerate(rodape):
+                partes.append(f"{CSI}{linha + k};1H{texto}{CSI}K")
+            for k in range(len(rodape), len(self.rodape_anterior)):
+                partes.append(f"{CSI}{linha + k};1H{CSI}K")
+            self.rodape_anterior = list(rodape)
+        partes.append(f"{CSI}{self.altura + 2 + len(self.rodape_anterior)};1H")
+        self.saida.write("".join(partes))
+        self.saida.flush()
+        self.ultimo_quadro = time.perf_counter()
+
+    def quadro_completo(self, glifo, rodape=None, forcar=False):
+        """Compara todas as células com o quadro anterior e escreve as diferentes.
+
+        Retorna False se o quadro foi descartado pelo limite de fps.
+        """
+        if not self._pode_desenhar(forcar):
+            return False
+        largura = self.largura
+        if self.anterior is None:
+            # Primeiro quadro: limpa a tela uma única vez e desenha tudo
+            self.anterior = [glifo(x, y) for y in range(self.altura) for x in range(largura)]
+            partes = [f"{CSI}?25l{CSI}2J{CSI}H"]
+            for y in range(self.altura):
+                partes.append(self._cursor(0, y))
+                partes.append("".join(self.anterior[y * largura:(y + 1) * largura]))
+            self.pendentes.clear()
+            self._escrever(partes, rodape)
+            return True
+
+        anterior = self.anterior
+        partes = []
+        k = 0
+        for y in range(self.altura):
+            for x in range(largura):
+                g = glifo(x, y)
+                if g != anterior[k]:
+                    anterior[k] = g
+                    partes.append(self._cursor(x, y))
+                    partes.append(g)
+                k += 1
+        self.pendentes.clear()
+        self._escrever(partes, rodape)
+        return True
+
+    def atualizar(self, posicoes, glifo, rodape=None, forcar=False):
+        """Redesenha só as posições (x, y) informadas (mais as pendentes de quadros descartados).
+
+        É o caminho rápido quando o chamador sabe quais células podem ter mudado.
+        Retorna False se o quadro foi descartado pelo limite de fps.
+        """
+        if self.anterior is None:
+            return self.quadro_completo(glifo, rodape, forcar=True)
+        self.pendentes.update(posicoes)
+        if not self._pode_desenhar(forcar):
+            return False
+        anterior = self.anterior
+        largura = self.largura
+        partes = []
+        for x, y in self.pendentes:
+            g = glifo(x, y)
+            k = y * largura + x
+            if g != anterior[k]:
+                anterior[k] = g
+                partes.append(self._cursor(x, y))
+                partes.append(g)
+        self.pendentes.clear()
+        self._escrever(partes, rodape)
+        return True
+
+    def fechar(self):
+        """Mostra o cursor de novo e o deixa abaixo do desenho."""
+        self.saida.write(f"{CSI}?25h")
+        self.saida.flush()
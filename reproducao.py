@@ -0,0 +1,154 @@
+"""Gravação de partidas com instantâneos e busca rápida de rodada (replay).
+
+Uma partida com semente é determinística: o Jogo guarda o próprio
+random.Random, o labirinto, os itens e os agentes. A gravação roda a partida
+sem terminal e guarda um instantâneo (Jogo.instantaneo) a cada `intervalo`
+rodadas. Para ver a rodada r, carrega-se o instantâneo mais próximo antes de r
+e avança-se no máximo `intervalo - 1` rodadas, sem renderizar nada.
+
+O labirinto não muda depois de gerado, então vai uma vez só para a gravação;
+os instantâneos são tirados sem ele (com_labirinto=False) e guardam só o RNG,
+os agentes, os itens e a rodada.
+
+Uso pela linha de comando:
+
+    python reproducao.py gravar 1234 --intervalo 100 --saida partida.rep
+    python reproducao.py ver partida.rep 5000
+"""
+
+import argparse
+import pickle
+import zlib
+from bisect import bisect_right
+
+from labirinto import Jogo, LARGURA, ALTURA, PERCEPCAO, imprimir, _rodape
+
+VERSAO_ARQUIVO = 3  # 2: itens numa camada separada do labirinto (Jogo.itens); 3: labirinto guardado uma vez
+VERSOES_LIDAS = (2, 3)  # na versão 2 cada instantâneo traz o próprio labirinto
+
+
+class Gravacao:
+    """Instantâneos de uma partida, indexados pela rodada em que foram tirados."""
+
+    def __init__(self, parametros, intervalo):
+        self.parametros = parametros   # argumentos de Jogo (semente, largura, ...)
+        self.intervalo = intervalo
+        self.instantaneos = {}         # rodada -> bytes (Jogo.instantaneo, sem o labirinto)
+        self.labirinto = None          # bytes: o labirinto da partida, comprimido (None: vem em cada instantâneo)
+        self.rodada_final = 0
+        self.status_final = "INCOMPLETO"
+        self._lab = None               # labirinto já descompactado, compartilhado pelos jogos de ir_para
+
+    def registrar(self, jogo):
+        """Guarda o estado atual do jogo se a rodada cair no intervalo (ou se o jogo acabou)."""
+        if jogo.rodada % self.intervalo == 0 or jogo.encerrado:
+            if self.labirinto is None and not self.instantaneos:
+                self.labirinto = zlib.compress(pickle.dumps(jogo.lab, protocol=pickle.HIGHEST_PROTOCOL))
+                self._lab = jogo.lab
+            self.instantaneos[jogo.rodada] = jogo.instantaneo(com_labirinto=self.labirinto is None)
+        self.rodada_final = jogo.rodada
+        self.status_final = jogo.status_final
+
+    def rodadas(self):
+        """Rodadas com instantâneo, em ordem."""
+        return sorted(self.instantaneos)
+
+    def ir_para(self, rodada):
+        """Jogo no fim da `rodada` pedida (ou no fim da partida, se ela acabou antes).
+
+        Os jogos devolvidos compartilham o mesmo objeto de labirinto, que a partida não altera.
+        """
+        marcos = self.rodadas()
+        k = bisect_right(marcos, rodada) - 1
+        if k < 0:
+            raise ValueError(f"Nenhum instantâneo antes da rodada {rodada}.")
+        if self._lab is None and self.labirinto is not None:
+            self._lab = pickle.loads(zlib.decompress(self.labirinto))
+        jogo = Jogo.restaurar(self.instantaneos[marcos[k]], self._lab)
+        while jogo.rodada < rodada and not jogo.encerrado:
+            jogo.avancar()
+        return jogo
+
+    def salvar(self, caminho):
+        with open(caminho, "wb") as f:
+            pickle.dump({
+                "versao": VERSAO_ARQUIVO,
+                "parametros": self.parametros,
+                "intervalo": self.intervalo,
+                "labirinto": self.labirinto,
+                "instantaneos": self.instantaneos,
+                "rodada_final": self.rodada_final,
+                "status_final": self.status_final,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def carregar(caminho):
+        """Lê uma gravação salva por `salvar` (é um pickle: só abra arquivos confiáveis)."""
+        with open(caminho, "rb") as f:
+            dados = pickle.load(f)
+        if dados.get("versao") not in VERSOES_LIDAS:
+            raise ValueError(f"Versão de gravação não suportada: {dados.get('versao')!r}")
+        gravacao = Gravacao(dados["parametros"], dados["intervalo"])
+        gravacao.labirinto = dados.get("labirinto")
+        gravacao.instantaneos = dados["instantaneos"]
+        gravacao.rodada_final = dados["rodada_final"]
+        gravacao.status_final = dados["status_final"]
+        return gravacao
+
+
+def gravar(semente, intervalo=100, max_rodadas=None, largura=LARGURA, altura=ALTURA,
+           percepcao=PERCEPCAO, energia_max=500, quantidade_itens=30):
+    """Joga a partida da `semente` sem terminal, com um instantâneo a cada `intervalo` rodadas."""
+    parametros = dict(semente=semente, largura=largura, altura=altura, percepcao=percepcao,
+                      energia_max=energia_max, quantidade_itens=quantidade_itens)
+    jogo = Jogo(**parametros)
+    gravacao = Gravacao(parametros, intervalo)
+    gravacao.registrar(jogo)
+    while not jogo.encerrado:
+        if max_rodadas is not None and jogo.rodada >= max_rodadas:
+            break
+        jogo.avancar()
+        gravacao.registrar(jogo)
+    return gravacao
+
+
+def mostrar(jogo):
+    """Imprime o labirinto e o rodapé do estado do jogo."""
+    imprimir(jogo.lab, jogo.entrante.pos, jogo.minotauro.pos, jogo.minotauro, jogo.entrante.morto, jogo.itens)
+    print("\n".join(_rodape(jogo)))
+    if jogo.encerrado:
+        print(f"--- FIM DE JOGO: {jogo.status_final} na Rodada {jogo.rodada} ---")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Grava partidas e mostra qualquer rodada delas.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_gravar = sub.add_parser("gravar", help="joga a partida de uma semente e salva os instantâneos")
+    p_gravar.add_argument("semente", type=int)
+    p_gravar.add_argument("--intervalo", type=int, default=100, help="rodadas entre instantâneos")
+    p_gravar.add_argument("--saida", default="partida.rep")
+    p_gravar.add_argument("--largura", type=int, default=LARGURA)
+    p_gravar.add_argument("--altura", type=int, default=ALTURA)
+    p_gravar.add_argument("--percepcao", type=int, default=PERCEPCAO)
+    p_gravar.add_argument("--energia", type=int, default=500)
+    p_gravar.add_argument("--itens", type=int, default=30)
+    p_gravar.add_argument("--max-rodadas", type=int, default=None)
+
+    p_ver = sub.add_parser("ver", help="mostra o estado da partida no fim de uma rodada")
+    p_ver.add_argument("arquivo")
+    p_ver.add_argument("rodada", type=int)
+
+    args = parser.parse_args(argumentos)
+    if args.comando == "gravar":
+        gravacao = gravar(args.semente, args.intervalo, args.max_rodadas, args.largura, args.altura,
+                          args.percepcao, args.energia, args.itens)
+        gravacao.salvar(args.saida)
+        print(f"[INFO] {len(gravacao.instantaneos)} instantâneos até a rodada {gravacao.rodada_final} "
+              f"({gravacao.status_final}) salvos em '{args.saida}'")
+    else:
+        mostrar(Gravacao.carregar(args.arquivo).ir_para(args.rodada))
+
+
+if __name__ == "__main__":
+    main()
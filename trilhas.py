@@ -0,0 +1,250 @@
+"""Históricos compactos de posições (trilhas) dos agentes.
+
+As trilhas são expostas como sequências somente-leitura de coordenadas (x, y),
+decodificadas sob demanda; internamente guardam índices planos da Grade.
+
+    TrilhaMovimentos   caminho em que cada vértice é vizinho do anterior:
+                       célula inicial + 2 bits por movimento (4 movimentos por byte)
+    TrilhaIndices      posições quaisquer: um índice plano por vértice em array('q')
+    MapaVisitados      conjunto de células visitadas: um bit por célula da grade
+"""
+
+from array import array
+from collections.abc import Sequence, Set
+
+_INTERVALO_MARCO = 1024  # guarda a célula absoluta a cada 1024 movimentos (acesso aleatório rápido)
+
+
+def _normaliza_indice(k, n):
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("índice fora da trilha")
+    return k
+
+
+class _TrilhaBase(Sequence):
+    """Comportamento comum: igualdade com qualquer sequência e repr como lista."""
+
+    def __eq__(self, outra):
+        if not isinstance(outra, Sequence) or isinstance(outra, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(outra) and all(a == b for a, b in zip(self, outra))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(len(self)))]
+        return self.grade.coord(self.indice(k))
+
+
+class TrilhaMovimentos(_TrilhaBase):
+    """Trilha de vértices adjacentes codificada como célula inicial + 2 bits por movimento.
+
+    Os códigos 0..3 são as posições em grade.offsets. Suporta acrescentar e
+    remover do fim (serve também de pilha para a DFS do Entrante).
+    """
+    __slots__ = ("grade", "inicio", "fim", "_n", "_codigos", "_marcos", "_codigo_de")
+
+    def __init__(self, grade, inicio=None):
+        self.grade = grade
+        self._codigo_de = {d: k for k, d in enumerate(grade.offsets)}
+        self.inicio = None
+        self.fim = None
+        self._n = 0  # número de movimentos (vértices - 1)
+        self._codigos = bytearray()
+        self._marcos = array("q")
+        if inicio is not None:
+            self.anexar(inicio)
+
+    def __len__(self):
+        return 0 if self.inicio is None else self._n + 1
+
+    def anexar(self, pos):
+        """Acrescenta o vértice (x, y); deve ser vizinho do último."""
+        self.anexar_indice(self.grade.indice(*pos))
+
+    def anexar_indice(self, i):
+        if self.inicio is None:
+            self.inicio = self.fim = i
+            return
+        codigo = self._codigo_de[i - self.fim]
+        n = self._n
+        if n % 4 == 0:
+            self._codigos.append(codigo)
+        else:
+            self._codigos[-1] |= codigo << (2 * (n % 4))
+        n += 1
+        if n % _INTERVALO_MARCO == 0:
+            self._marcos.append(i)
+        self._n = n
+        self.fim = i
+
+    def remover_indice(self):
+        """Remove e retorna o último vértice (índice plano)."""
+        if self.inicio is None:
+            raise IndexError("remoção de trilha vazia")
+        fim = self.fim
+        n = self._n
+        if n == 0:
+            self.inicio = self.fim = None
+            return fim
+        if n % _INTERVALO_MARCO == 0:
+            self._marcos.pop()
+        n -= 1
+        desloc = 2 * (n % 4)
+        codigo = (self._codigos[-1] >> desloc) & 3
+        if desloc == 0:
+            self._codigos.pop()
+        else:
+            self._codigos[-1] &= ~(3 << desloc) & 0xFF
+        self._n = n
+        self.fim = fim - self.grade.offsets[codigo]
+        return fim
+
+    def remover(self):
+        """Remove e retorna o último vértice como (x, y)."""
+        return self.grade.coord(self.remover_indice())
+
+    def indices(self, inicio=0):
+        """Gera os índices planos a partir do vértice `inicio`."""
+        if self.inicio is None:
+            return
+        offsets = self.grade.offsets
+        codigos = self._codigos
+        marco = inicio // _INTERVALO_MARCO
+        atual = self.inicio if marco == 0 else self._marcos[marco - 1]
+        k = marco * _INTERVALO_MARCO
+        while k < inicio:
+            atual += offsets[(codigos[k >> 2] >> (2 * (k & 3))) & 3]
+            k += 1
+        yield atual
+        for k in range(inicio, self._n):
+            atual += offsets[(codigos[k >> 2] >> (2 * (k & 3))) & 3]
+            yield atual
+
+    def indice(self, k):
+        k = _normaliza_indice(k, len(self))
+        if k == self._n:
+            return self.fim
+        return next(self.indices(k))
+
+    def __iter__(self):
+        coord = self.grade.coord
+        for i in self.indices():
+            yield coord(i)
+
+
+class TrilhaIndices(_TrilhaBase):
+    """Trilha de posições arbitrárias: um índice plano por vértice em array('q').
+
+    A grade é associada no primeiro `anexar`, então a trilha pode ser criada antes.
+    """
+    __slots__ = ("grade", "_indices")
+
+    def __init__(self, grade=None):
+        self.grade = grade
+        self._indices = array("q")
+
+    def __len__(self):
+        return len(self._indices)
+
+    def anexar(self, pos, grade=None):
+        if grade is not None:
+            self.grade = grade
+        self._indices.append(self.grade.indice(*pos))
+
+    def indice(self, k):
+        return self._indices[k]
+
+    def indices(self):
+        return iter(self._indices)
+
+    def __iter__(self):
+        coord = self.grade.coord if self.grade is not None else None
+        for i in self._indices:
+            yield coord(i)
+
+
+class _BytesEsparsos(dict):
+    """Dict byte -> valor em que um byte ausente vale 0; ler não insere a chave (ao contrário de defaultdict)."""
+    __slots__ = ()
+
+    def __missing__(self, byte):
+        return 0
+
+
+class MapaVisitados(Set):
+    """Conjunto de células (x, y) visitadas, guardado como um bit por célula da grade.
+
+    Em grades sem tamanho fixo (o MundoInfinito de mundo.py), os bytes de bits
+    ficam num dict esparso (byte -> valor), com a mesma forma de acesso; só
+    adicionar_indice grava nele, então consultar vizinhos não o faz crescer.
+    """
+    __slots__ = ("grade", "_bits", "_total")
+
+    def __init__(self, grade, celulas=()):
+        self.grade = grade
+        if hasattr(grade.celulas, "__len__"):
+            self._bits = bytearray((len(grade.celulas) + 7) // 8)
+        else:
+            self._bits = _BytesEsparsos()
+        self._total = 0
+        for pos in celulas:
+            self.adicionar(pos)
+
+    def __len__(self):
+        return self._total
+
+    def contem_indice(self, i):
+        return self._bits[i >> 3] >> (i & 7) & 1
+
+    def contar_nao_visitados(self, i, offsets):
+        """Quantos dos vizinhos i + d (d em offsets) ainda não foram visitados (sem alocar)."""
+        bits = self._bits
+        contagem = 0
+        for d in offsets:
+            j = i + d
+            if not bits[j >> 3] >> (j & 7) & 1:
+                contagem += 1
+        return contagem
+
+    def nao_visitado(self, i, offsets, k):
+        """Índice do k-ésimo (a partir de 0) vizinho i + d não visitado, na ordem de offsets."""
+        bits = self._bits
+        for d in offsets:
+            j = i + d
+            if not bits[j >> 3] >> (j & 7) & 1:
+                if k == 0:
+                    return j
+                k -= 1
+        raise IndexError("Índice de vizinho não visitado fora do intervalo.")
+
+    def adicionar_indice(self, i):
+        byte = i >> 3
+        bit = 1 << (i & 7)
+        if not self._bits[byte] & bit:
+            self._bits[byte] |= bit
+            self._total += 1
+
+    def adicionar(self, pos):
+        self.adicionar_indice(self.grade.indice(*pos))
+
+    def __contains__(self, pos):
+        return bool(self.contem_indice(self.grade.indice(*pos)))
+
+    def __iter__(self):
+        coord = self.grade.coord
+        bits = self._bits
+        for byte, valor in (sorted(bits.items()) if isinstance(bits, dict) else enumerate(bits)):
+            if valor:
+                for b in range(8):
+                    if valor >> b & 1:
+                        yield coord(byte * 8 + b)
+
+    def __repr__(self):
+        return f"MapaVisitados({len(self)} células)"